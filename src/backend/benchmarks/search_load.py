@@ -0,0 +1,201 @@
+"""
+Load benchmark for /api/v1/knowledge/search.
+
+Starts a local stand-in for the OpenAI embeddings API (with configurable
+latency), boots HippoBox against a throwaway SQLite DB and local Qdrant
+storage, seeds a few knowledge entries, then fires many concurrent search
+requests and reports latency percentiles.
+
+    python benchmarks/search_load.py --mode async
+    python benchmarks/search_load.py --mode blocking   # previous sync client behaviour
+
+Run from src/backend.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+DIM = 64
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _fake_vector(text: str) -> list[float]:
+    digest = hashlib.sha256(text.encode()).digest()
+    return [(digest[i % len(digest)] - 128) / 128 for i in range(DIM)]
+
+
+def _build_embedding_app(latency: float):
+    from fastapi import FastAPI, Request
+
+    app = FastAPI()
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        await asyncio.sleep(latency)
+        return {
+            "object": "list",
+            "model": body.get("model", "stand-in"),
+            "data": [
+                {"object": "embedding", "index": i, "embedding": _fake_vector(text)} for i, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        }
+
+    return app
+
+
+class _ServerThread(threading.Thread):
+    def __init__(self, app, port: int):
+        import uvicorn
+
+        super().__init__(daemon=True)
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+
+    def run(self):
+        self.server.run()
+
+    def wait_started(self):
+        while not self.server.started:
+            time.sleep(0.05)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.join()
+
+
+class BlockingEmbedding:
+    """Reproduces the previous behaviour: a sync OpenAI call inside an async handler."""
+
+    def __init__(self):
+        from openai import OpenAI
+
+        from hippobox.core.settings import SETTINGS
+
+        self.client = OpenAI(api_key=SETTINGS.OPENAI_API_KEY, base_url=SETTINGS.OPENAI_BASE_URL)
+        self.model = SETTINGS.EMBEDDING_MODEL
+
+    async def embed(self, text: str) -> list[float]:
+        return self.client.embeddings.create(model=self.model, input=text).data[0].embedding
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [item.embedding for item in self.client.embeddings.create(model=self.model, input=texts).data]
+
+    async def close(self):
+        self.client.close()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _run_load(base_url: str, args: argparse.Namespace) -> None:
+    import httpx
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        for i in range(args.entries):
+            res = await client.post(
+                "/api/v1/knowledge/",
+                json={
+                    "topic": "bench",
+                    "tags": [f"tag{i % 5}"],
+                    "title": f"Benchmark note {i}",
+                    "content": f"Benchmark content number {i} about topic {i % 7}.",
+                },
+            )
+            res.raise_for_status()
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies: list[float] = []
+
+        async def one(i: int):
+            async with semaphore:
+                start = time.perf_counter()
+                res = await client.get("/api/v1/knowledge/search", params={"query": f"query {i}", "limit": 5})
+                res.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+    ms = [v * 1000 for v in latencies]
+    print(f"mode={args.mode} requests={args.requests} concurrency={args.concurrency} latency={args.latency_ms}ms")
+    print(f"  throughput : {args.requests / elapsed:8.1f} req/s")
+    print(f"  mean       : {statistics.mean(ms):8.1f} ms")
+    print(f"  p50        : {_percentile(ms, 50):8.1f} ms")
+    print(f"  p95        : {_percentile(ms, 95):8.1f} ms")
+    print(f"  p99        : {_percentile(ms, 99):8.1f} ms")
+    print(f"  max        : {max(ms):8.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Concurrent /knowledge/search load benchmark")
+    parser.add_argument("--mode", choices=["async", "blocking"], default="async")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=int, default=50, help="Stand-in embedding server latency")
+    parser.add_argument("--entries", type=int, default=20, help="Knowledge entries to seed")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="hippobox-bench-"))
+    embed_port = _free_port()
+    app_port = _free_port()
+
+    os.environ.update(
+        {
+            "LOGIN_ENABLED": "false",
+            "REDIS_IN_MEMORY": "true",
+            "VDB_ENABLED": "true",
+            "QDRANT_MODE": "local",
+            "QDRANT_PATH": str(workdir / "qdrant"),
+            "DB_DRIVER": "sqlite+aiosqlite",
+            "DB_NAME": str(workdir / "bench.db"),
+            "OPENAI_API_KEY": "bench",
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{embed_port}/v1",
+            "EMBEDDING_DIMENSION": str(DIM),
+            "LOG_LEVEL": "WARNING",
+        }
+    )
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+    from hippobox.server import app
+
+    embed_server = _ServerThread(_build_embedding_app(args.latency_ms / 1000), embed_port)
+    embed_server.start()
+    embed_server.wait_started()
+
+    app_server = _ServerThread(app, app_port)
+    app_server.start()
+    app_server.wait_started()
+
+    if args.mode == "blocking":
+        app.state.EMBEDDING = BlockingEmbedding()
+
+    try:
+        asyncio.run(_run_load(f"http://127.0.0.1:{app_port}", args))
+    finally:
+        app_server.stop()
+        embed_server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
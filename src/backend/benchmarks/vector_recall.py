@@ -0,0 +1,190 @@
+"""
+Recall / latency benchmark for the Qdrant index profiles.
+
+Builds a synthetic, clustered corpus of normalized vectors, computes the
+exact top-k of each query with numpy, then loads the corpus into one
+collection per index profile (QDRANT_INDEX_PROFILE) and reports recall@k
+and search latency of each, next to an exact full-scan baseline.
+
+    python benchmarks/vector_recall.py --url http://localhost:6333
+    python benchmarks/vector_recall.py --url http://localhost:6333 --grpc --points 100000 --dim 1536
+    python benchmarks/vector_recall.py                 # local mode: full scan only, profiles have no effect
+
+Run from src/backend. Collections are named hp_bench_<profile> and are
+dropped afterwards unless --keep is given.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _corpus(args: argparse.Namespace) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Points scattered around random cluster centres, like embeddings of notes on
+    a handful of subjects; queries are drawn the same way. Returns the points,
+    the queries and the exact top-k point indexes of each query.
+    """
+    rng = np.random.default_rng(args.seed)
+    centres = _normalize(rng.standard_normal((args.clusters, args.dim)))
+
+    def sample(n: int) -> np.ndarray:
+        picked = centres[rng.integers(0, args.clusters, n)]
+        return _normalize(picked + args.spread * rng.standard_normal((n, args.dim)) / np.sqrt(args.dim)).astype(
+            np.float32
+        )
+
+    points, queries = sample(args.points), sample(args.queries)
+    truth = np.argsort(-(queries @ points.T), axis=1)[:, : args.k]
+    return points, queries, truth
+
+
+async def _wait_indexed(qdrant, cname: str, timeout: float = 600):
+    from qdrant_client.models import models
+
+    started = time.monotonic()
+    while time.monotonic() - started < timeout:
+        info = await qdrant.client.get_collection(cname)
+        if info.status == models.CollectionStatus.GREEN:
+            return
+        await asyncio.sleep(0.5)
+    print(f"  {cname} still optimizing after {timeout:.0f}s; results may include unindexed segments")
+
+
+async def _bench_profile(profile, points: np.ndarray, queries: np.ndarray, truth: np.ndarray, args) -> dict:
+    from hippobox.rag.qdrant import Qdrant
+
+    qdrant = Qdrant(profile=profile)
+    name = f"bench_{profile.name.replace('-', '_')}"
+    try:
+        if await qdrant.has_collection(name):
+            await qdrant.delete_collection(name)
+        await qdrant.create_collection(name, args.dim)
+
+        started = time.perf_counter()
+        for start in range(0, len(points), args.batch_size):
+            batch = points[start : start + args.batch_size]
+            items = [
+                {"id": start + i, "vector": vector.tolist(), "text": "", "metadata": {"knowledge_id": start + i}}
+                for i, vector in enumerate(batch)
+            ]
+            await qdrant.upsert(name, items, args.dim)
+        if qdrant.mode != "local":
+            await _wait_indexed(qdrant, qdrant._full_name(name))
+        load_seconds = time.perf_counter() - started
+
+        # Warm the caches (and the memory-mapped segments) before timing.
+        for query in queries[: min(20, len(queries))]:
+            await qdrant.search(name, query.tolist(), limit=args.k)
+
+        latencies, hits = [], 0
+        for query, expected in zip(queries, truth):
+            start = time.perf_counter()
+            result = await qdrant.search(name, query.tolist(), limit=args.k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            hits += len(set(result["ids"]) & set(expected.tolist()))
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def one(query):
+            async with semaphore:
+                await qdrant.search(name, query.tolist(), limit=args.k)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(query) for query in queries))
+        qps = len(queries) / (time.perf_counter() - started)
+
+        if not args.keep:
+            await qdrant.delete_collection(name)
+    finally:
+        await qdrant.close()
+
+    return {
+        "profile": profile.name,
+        "recall": hits / (len(queries) * args.k),
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "mean": statistics.mean(latencies),
+        "qps": qps,
+        "load": load_seconds,
+    }
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from hippobox.rag.index_profiles import PROFILES
+
+    print(f"corpus: {args.points} points, {args.queries} queries, {args.dim} dims, {args.clusters} clusters")
+    points, queries, truth = _corpus(args)
+
+    profiles = [PROFILES[name] for name in args.profiles]
+    # Baseline: the balanced layout searched by full scan without quantization.
+    profiles.append(PROFILES["balanced"].model_copy(update={"name": "exact", "quantization": None, "exact": True}))
+
+    results = []
+    for profile in profiles:
+        print(f"  {profile.name} ...", flush=True)
+        results.append(await _bench_profile(profile, points, queries, truth, args))
+
+    columns = ("recall@" + str(args.k), "p50 ms", "p95 ms", "mean ms", "qps", "load s")
+    print(f"\n{'profile':<12} {columns[0]:>9} " + " ".join(f"{c:>8}" for c in columns[1:]))
+    for r in results:
+        print(
+            f"{r['profile']:<12} {r['recall']:>9.3f} {r['p50']:>8.2f} {r['p95']:>8.2f} {r['mean']:>8.2f} "
+            f"{r['qps']:>8.1f} {r['load']:>8.1f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Recall / latency benchmark of the Qdrant index profiles")
+    parser.add_argument("--url", default=None, help="Qdrant server URL; local mode when omitted")
+    parser.add_argument("--grpc", action="store_true", help="Use gRPC (QDRANT_PREFER_GRPC)")
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=50)
+    parser.add_argument("--spread", type=float, default=1.0, help="Noise around each cluster centre")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=256, help="Points per upsert")
+    parser.add_argument("--concurrency", type=int, default=16, help="In-flight searches for the qps run")
+    parser.add_argument("--profiles", nargs="+", default=["low-memory", "balanced", "low-latency"])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark collections")
+    args = parser.parse_args()
+
+    os.environ.update({"LOG_LEVEL": "WARNING", "QDRANT_PREFER_GRPC": str(args.grpc).lower()})
+    if args.url:
+        os.environ.update({"QDRANT_MODE": "docker", "QDRANT_URL": args.url})
+    else:
+        os.environ.update({"QDRANT_MODE": "local", "QDRANT_PATH": tempfile.mkdtemp(prefix="hippobox-recall-")})
+        print("local mode searches by full scan: every profile shows the exact recall and the same latency")
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+    from hippobox.rag.index_profiles import PROFILES
+
+    unknown = [name for name in args.profiles if name not in PROFILES]
+    if unknown:
+        parser.error(f"unknown profiles: {', '.join(unknown)} (expected {', '.join(PROFILES)})")
+
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,164 @@
 import argparse
-
-import uvicorn
+import asyncio
+import signal
+import sys
+from pathlib import Path
 
 from hippobox import __version__
-from hippobox.server import app
+from hippobox.core.database import dispose_db, init_db
+from hippobox.core.launcher import HTTP_PROTOCOLS, LOOPS, MANAGERS, ServerOptions, run_server
+from hippobox.core.logging_config import setup_logger
+from hippobox.core.settings import SETTINGS
+from hippobox.errors.knowledge import KnowledgeException
+from hippobox.models.knowledge import ExportFormat
+from hippobox.models.user import Users
+from hippobox.rag.backfill import backfill_knowledge_payload
+from hippobox.rag.embedding import Embedding
+from hippobox.rag.index_worker import IndexWorker
+from hippobox.rag.indexing import KnowledgeIndexer
+from hippobox.rag.qdrant import CollectionSchemaError, Qdrant
+from hippobox.rag.reindex import KnowledgeReindexer, ReindexStatus
+from hippobox.services.knowledge import KnowledgeService
+from hippobox.utils.import_files import load_import_items
+
+
+async def _migrate_vectors(batch_size: int) -> dict:
+    await init_db()
+    qdrant = Qdrant()
+    try:
+        return await backfill_knowledge_payload(qdrant, batch_size=batch_size)
+    finally:
+        await qdrant.close()
+        await dispose_db()
+
+
+async def _import(path: Path, email: str | None, topic: str | None, batch_size: int) -> int:
+    items, errors = load_import_items(path, default_topic=topic)
+    for error in errors:
+        print(f"skipped {error}", file=sys.stderr)
+    if not items:
+        print("Nothing to import.")
+        return 1 if errors else 0
+
+    await init_db()
+    qdrant = embedding = None
+    try:
+        user = await Users.get_by_email(email) if email else await Users.get_admin()
+        if user is None:
+            print(f"User not found: {email or 'admin'}", file=sys.stderr)
+            return 1
+
+        qdrant = Qdrant() if SETTINGS.VDB_ENABLED else None
+        embedding = Embedding() if SETTINGS.VDB_ENABLED else None
+        service = KnowledgeService(embedding, qdrant, SETTINGS.VDB_ENABLED)
+        if service.indexer is not None:
+            await service.indexer.ensure_collection()
+
+        def progress(done: int, total: int):
+            print(f"\r{done}/{total}", end="", flush=True)
+
+        result = await service.import_knowledge(user.id, items, batch_size=batch_size, on_progress=progress)
+        print()
+    finally:
+        if qdrant is not None:
+            await qdrant.close()
+        if embedding is not None:
+            await embedding.close()
+        await dispose_db()
+
+    for error in result.errors:
+        print(f"item {error.index} ({error.title}): {error.error} {error.message}", file=sys.stderr)
+    print(f"Imported {result.created}/{result.total} entries for {user.email} ({len(result.errors)} failed).")
+    return 1 if result.errors or errors else 0
+
+
+async def _export(output: str, email: str | None, export_format: ExportFormat, include_vectors: bool) -> int:
+    await init_db()
+    qdrant = embedding = None
+    try:
+        user = await Users.get_by_email(email) if email else await Users.get_admin()
+        if user is None:
+            print(f"User not found: {email or 'admin'}", file=sys.stderr)
+            return 1
+
+        qdrant = Qdrant() if SETTINGS.VDB_ENABLED else None
+        embedding = Embedding() if SETTINGS.VDB_ENABLED else None
+        service = KnowledgeService(embedding, qdrant, SETTINGS.VDB_ENABLED)
+        stream = await service.export_knowledge(user.id, export_format, include_vectors)
+
+        size = 0
+        with open(sys.stdout.fileno(), "wb", closefd=False) if output == "-" else open(output, "wb") as f:
+            async for data in stream:
+                f.write(data)
+                size += len(data)
+    finally:
+        if qdrant is not None:
+            await qdrant.close()
+        if embedding is not None:
+            await embedding.close()
+        await dispose_db()
+
+    print(f"Exported knowledge of {user.email} ({size} bytes).", file=sys.stderr)
+    return 0
+
+
+async def _worker(batch_size: int | None, once: bool) -> int:
+    if not SETTINGS.VDB_ENABLED:
+        print("VDB is disabled; there is nothing to index.", file=sys.stderr)
+        return 1
+
+    await init_db()
+    embedding = Embedding()
+    qdrant = Qdrant()
+    try:
+        indexer = KnowledgeIndexer(embedding, qdrant)
+        await indexer.ensure_collection()
+        worker = IndexWorker(indexer, batch_size=batch_size)
+        if once:
+            processed = await worker.drain()
+            print(f"Processed {processed} index jobs.")
+            return 0
+
+        stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stopping.set)
+
+        worker.start()
+        await stopping.wait()
+        await worker.stop()
+    finally:
+        await qdrant.close()
+        await embedding.close()
+        await dispose_db()
+    return 0
+
+
+async def _reindex(rebuild: bool, dry_run: bool, batch_size: int | None) -> ReindexStatus | None:
+    if not SETTINGS.VDB_ENABLED:
+        print("VDB is disabled; there is nothing to reindex.", file=sys.stderr)
+        return None
+
+    await init_db()
+    embedding = Embedding()
+    qdrant = Qdrant()
+    try:
+        reindexer = KnowledgeReindexer(embedding, qdrant, batch_size=batch_size)
+
+        def progress(status: ReindexStatus):
+            print(
+                f"\r{status.phase}: {status.scanned}/{status.total} ({status.rate}/s)",
+                end="",
+                flush=True,
+            )
+
+        status = await reindexer.run(rebuild=rebuild, dry_run=dry_run, on_progress=progress)
+        print()
+        return status
+    finally:
+        await qdrant.close()
+        await embedding.close()
+        await dispose_db()
 
 
 def main():
@@ -38,12 +193,260 @@ def main():
         help="Port to bind (default: 8000)",
     )
 
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=SETTINGS.SERVER_WORKERS,
+        help=f"Worker processes (default: {SETTINGS.SERVER_WORKERS}); more than one needs a Qdrant and Redis server",
+    )
+
+    run_parser.add_argument(
+        "--manager",
+        choices=MANAGERS,
+        default=SETTINGS.SERVER_MANAGER,
+        help=f"Process manager for several workers; SIGHUP reloads them (default: {SETTINGS.SERVER_MANAGER})",
+    )
+
+    run_parser.add_argument(
+        "--preload",
+        action="store_true",
+        default=SETTINGS.SERVER_PRELOAD,
+        help="Import the app and heavy libraries once in the gunicorn master, shared by the forked workers",
+    )
+
+    run_parser.add_argument(
+        "--loop",
+        choices=LOOPS,
+        default=SETTINGS.SERVER_LOOP,
+        help=f"Event loop implementation (default: {SETTINGS.SERVER_LOOP})",
+    )
+
+    run_parser.add_argument(
+        "--http",
+        choices=HTTP_PROTOCOLS,
+        default=SETTINGS.SERVER_HTTP,
+        help=f"HTTP parser implementation (default: {SETTINGS.SERVER_HTTP})",
+    )
+
+    run_parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=SETTINGS.SERVER_KEEP_ALIVE,
+        help=f"Seconds to keep idle connections open (default: {SETTINGS.SERVER_KEEP_ALIVE})",
+    )
+
+    run_parser.add_argument(
+        "--backlog",
+        type=int,
+        default=SETTINGS.SERVER_BACKLOG,
+        help=f"Maximum queued connections (default: {SETTINGS.SERVER_BACKLOG})",
+    )
+
+    run_parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        default=SETTINGS.SERVER_LIMIT_CONCURRENCY,
+        help="Connections per worker before answering 503; 0 for no limit "
+        f"(default: {SETTINGS.SERVER_LIMIT_CONCURRENCY})",
+    )
+
+    run_parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=SETTINGS.SERVER_MAX_REQUESTS,
+        help=f"Restart a worker after this many requests; 0 to never (default: {SETTINGS.SERVER_MAX_REQUESTS})",
+    )
+
+    run_parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=SETTINGS.SERVER_GRACEFUL_TIMEOUT,
+        help=f"Seconds in-flight requests get on shutdown or reload (default: {SETTINGS.SERVER_GRACEFUL_TIMEOUT})",
+    )
+
+    migrate_parser = subparsers.add_parser(
+        "migrate-vectors",
+        help="Rewrite Qdrant points to the current payload schema, keeping vectors (then run reindex)",
+    )
+
+    migrate_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Knowledge rows per batch (default: 500)",
+    )
+
+    import_parser = subparsers.add_parser(
+        "import",
+        help="Bulk import knowledge from JSONL files or markdown notes",
+    )
+
+    import_parser.add_argument(
+        "path",
+        type=Path,
+        help="JSONL file, markdown file, or directory searched recursively for *.jsonl and *.md",
+    )
+
+    import_parser.add_argument(
+        "--email",
+        default=None,
+        help="Owner of the imported entries (default: the admin user)",
+    )
+
+    import_parser.add_argument(
+        "--topic",
+        default=None,
+        help="Topic for entries that do not set one",
+    )
+
+    import_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=SETTINGS.IMPORT_BATCH_SIZE,
+        help=f"Entries per transaction (default: {SETTINGS.IMPORT_BATCH_SIZE})",
+    )
+
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="Drain the vector index outbox (when the server runs with INDEX_WORKER_ENABLED=false)",
+    )
+
+    worker_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=f"Jobs per batch (default: {SETTINGS.INDEX_WORKER_BATCH_SIZE})",
+    )
+
+    worker_parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Process every due job, then exit",
+    )
+
+    reindex_parser = subparsers.add_parser(
+        "reindex",
+        help="Reconcile the Qdrant collection with the knowledge table",
+    )
+
+    reindex_mode = reindex_parser.add_mutually_exclusive_group()
+
+    reindex_mode.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Embed everything into a new collection and swap the alias to it",
+    )
+
+    reindex_mode.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count missing, stale and orphan points",
+    )
+
+    reindex_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=f"Entries per batch (default: {SETTINGS.REINDEX_BATCH_SIZE})",
+    )
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Export knowledge as NDJSON or a tar of markdown notes",
+    )
+
+    export_parser.add_argument(
+        "output",
+        help="Output file, or - for stdout",
+    )
+
+    export_parser.add_argument(
+        "--email",
+        default=None,
+        help="Owner of the exported entries (default: the admin user)",
+    )
+
+    export_parser.add_argument(
+        "--format",
+        choices=[f.value for f in ExportFormat],
+        default=None,
+        help="ndjson or tar (default: from the output suffix, else ndjson)",
+    )
+
+    export_parser.add_argument(
+        "--include-vectors",
+        action="store_true",
+        help="Include stored vectors so a re-import skips embedding (ndjson only)",
+    )
+
     args = parser.parse_args()
 
     if args.command == "run":
-        uvicorn.run(
-            app,
+        options = ServerOptions(
             host=args.host,
             port=args.port,
-            reload=False,
+            workers=args.workers,
+            manager=args.manager,
+            preload=args.preload,
+            loop=args.loop,
+            http=args.http,
+            keep_alive=args.keep_alive,
+            backlog=args.backlog,
+            limit_concurrency=args.limit_concurrency,
+            max_requests=args.max_requests,
+            graceful_timeout=args.graceful_timeout,
+        )
+        try:
+            run_server(options)
+        except (ValueError, RuntimeError) as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+
+    elif args.command == "migrate-vectors":
+        setup_logger()
+        stats = asyncio.run(_migrate_vectors(args.batch_size))
+        print(f"Updated {stats['updated']} points ({stats['missing']} missing from Qdrant).")
+
+    elif args.command == "import":
+        setup_logger()
+        try:
+            code = asyncio.run(_import(args.path, args.email, args.topic, args.batch_size))
+        except CollectionSchemaError as e:
+            print(e, file=sys.stderr)
+            code = 1
+        sys.exit(code)
+
+    elif args.command == "worker":
+        setup_logger()
+        try:
+            code = asyncio.run(_worker(args.batch_size, args.once))
+        except CollectionSchemaError as e:
+            print(e, file=sys.stderr)
+            code = 1
+        sys.exit(code)
+
+    elif args.command == "reindex":
+        setup_logger()
+        try:
+            status = asyncio.run(_reindex(args.rebuild, args.dry_run, args.batch_size))
+        except CollectionSchemaError as e:
+            print(e, file=sys.stderr)
+            status = None
+        if status is None:
+            sys.exit(1)
+        verb = "need reindexing" if status.dry_run else "reindexed"
+        print(f"{status.reindexed}/{status.total} entries {verb}, {status.orphans} orphan points.")
+
+    elif args.command == "export":
+        setup_logger()
+        export_format = (
+            ExportFormat(args.format)
+            if args.format
+            else (ExportFormat.TAR if args.output.endswith(".tar") else ExportFormat.NDJSON)
         )
+        try:
+            code = asyncio.run(_export(args.output, args.email, export_format, args.include_vectors))
+        except KnowledgeException as e:
+            print(e.message, file=sys.stderr)
+            code = 1
+        sys.exit(code)
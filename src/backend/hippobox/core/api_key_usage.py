@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from hippobox.core.redis import RedisManager
+from hippobox.core.settings import SETTINGS
+from hippobox.models.api_key import APIKeys
+
+log = logging.getLogger("auth")
+
+COUNTS_KEY = "usage:api_key:count"
+LAST_SEEN_KEY = "usage:api_key:last"
+
+
+class APIKeyUsageRecorder:
+    """
+    Coalesces API-key usage so authenticated reads do not each write to the DB.
+
+    record() only bumps a counter, in process or with API_KEY_USAGE_REDIS in
+    Redis (HINCRBY + last-seen), and a background task flushes the totals to
+    the api_key table every API_KEY_USAGE_FLUSH_INTERVAL seconds. stop()
+    flushes whatever is still pending, so a clean shutdown loses nothing.
+    """
+
+    def __init__(self, interval: float, use_redis: bool):
+        self.interval = interval
+        self.use_redis = use_redis
+        self._pending: dict[int, tuple[int, datetime]] = {}
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    async def record(self, key_id: int):
+        now = datetime.now(timezone.utc)
+        if self.use_redis:
+            try:
+                redis = await RedisManager.get_client()
+                async with redis.pipeline(transaction=False) as pipe:
+                    pipe.hincrby(COUNTS_KEY, key_id, 1)
+                    pipe.hset(LAST_SEEN_KEY, key_id, now.isoformat())
+                    await pipe.execute()
+                return
+            except Exception as e:
+                log.warning(f"API key usage Redis write failed, counting in process: {e}")
+
+        count, _ = self._pending.get(key_id, (0, now))
+        self._pending[key_id] = (count + 1, now)
+
+    async def _take_redis(self) -> dict[int, tuple[int, datetime]]:
+        redis = await RedisManager.get_client()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(COUNTS_KEY)
+            pipe.hgetall(LAST_SEEN_KEY)
+            pipe.delete(COUNTS_KEY, LAST_SEEN_KEY)
+            counts, last_seen, _ = await pipe.execute()
+
+        now = datetime.now(timezone.utc)
+        return {
+            int(key_id): (
+                int(count),
+                datetime.fromisoformat(last_seen[key_id]) if key_id in last_seen else now,
+            )
+            for key_id, count in counts.items()
+        }
+
+    async def flush(self):
+        usage, self._pending = self._pending, {}
+        if self.use_redis:
+            try:
+                for key_id, (count, seen) in (await self._take_redis()).items():
+                    pending_count, pending_seen = usage.get(key_id, (0, seen))
+                    usage[key_id] = (count + pending_count, max(seen, pending_seen))
+            except Exception as e:
+                log.warning(f"API key usage Redis read failed: {e}")
+
+        if not usage:
+            return
+
+        try:
+            await APIKeys.add_usage(usage)
+        except Exception as e:
+            log.warning(f"API key usage flush failed, retrying next interval: {e}")
+            for key_id, (count, seen) in usage.items():
+                pending_count, pending_seen = self._pending.get(key_id, (0, seen))
+                self._pending[key_id] = (count + pending_count, max(seen, pending_seen))
+
+    async def _run(self):
+        # Flushes are never cancelled mid-write: stop() sets the event and the
+        # loop exits after one last flush.
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            await self.flush()
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+
+APIKeyUsage = APIKeyUsageRecorder(
+    interval=SETTINGS.API_KEY_USAGE_FLUSH_INTERVAL,
+    use_redis=SETTINGS.API_KEY_USAGE_REDIS,
+)
@@ -1,10 +1,12 @@
 import logging
+import time
 from contextlib import asynccontextmanager
 
-from sqlalchemy import event
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from hippobox.core.metrics import DB_QUERY_SECONDS, DB_SESSIONS, DB_SESSIONS_ACTIVE, statement_type
 from hippobox.core.settings import SETTINGS
 
 log = logging.getLogger("database")
@@ -14,37 +16,93 @@ class Base(DeclarativeBase):
     pass
 
 
-def _create_engine():
-    db_url = SETTINGS.DATABASE_URL
+def _instrument(engine):
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_execute(_conn, _cursor, statement, _parameters, context, _executemany):
+        started = getattr(context, "_query_started", None)
+        if started is not None:
+            DB_QUERY_SECONDS.labels(statement=statement_type(statement)).observe(time.perf_counter() - started)
+
+    return engine
+
+
+def _pool_options() -> dict:
+    return {
+        "pool_size": SETTINGS.DB_POOL_SIZE,
+        "max_overflow": SETTINGS.DB_MAX_OVERFLOW,
+        "pool_timeout": SETTINGS.DB_POOL_TIMEOUT,
+        "pool_recycle": SETTINGS.DB_POOL_RECYCLE,
+    }
+
+
+def _sqlite_in_memory(db_url: str) -> bool:
+    # In-memory databases get a SingletonThreadPool / StaticPool, which take no size or overflow options.
+    url = make_url(db_url)
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _sqlite_pragmas(read_only: bool) -> list[str]:
+    pragmas = [
+        "PRAGMA foreign_keys=ON",
+        f"PRAGMA busy_timeout={SETTINGS.DB_SQLITE_BUSY_TIMEOUT}",
+        f"PRAGMA synchronous={SETTINGS.DB_SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={SETTINGS.DB_SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size={SETTINGS.DB_SQLITE_CACHE_SIZE}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    elif SETTINGS.DB_SQLITE_WAL:
+        # WAL is persistent in the file; readers no longer block behind a writer.
+        pragmas.insert(0, "PRAGMA journal_mode=WAL")
+    return pragmas
+
+
+def _create_engine(read_only: bool = False):
+    db_url = SETTINGS.DATABASE_READ_URL if read_only else SETTINGS.DATABASE_URL
 
     if db_url.startswith("sqlite+aiosqlite"):
         engine = create_async_engine(
             db_url,
             echo=False,
             future=True,
+            **({} if _sqlite_in_memory(db_url) else _pool_options()),
         )
+        pragmas = _sqlite_pragmas(read_only)
 
         @event.listens_for(engine.sync_engine, "connect")
         def _set_sqlite_pragma(dbapi_connection, _connection_record):
             cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
+            for pragma in pragmas:
+                cursor.execute(pragma)
             cursor.close()
 
-        log.info(f"Using database: {db_url}")
-        return engine
+        log.info(f"Using database{' (read-only)' if read_only else ''}: {db_url}")
+        return _instrument(engine)
+
+    connect_args = {}
+    if read_only and db_url.startswith("postgresql+asyncpg"):
+        connect_args["server_settings"] = {"default_transaction_read_only": "on"}
 
     engine = create_async_engine(
         db_url,
         echo=False,
         future=True,
         pool_pre_ping=True,
+        connect_args=connect_args,
+        **_pool_options(),
     )
-    log.info(f"Using database: {db_url}")
-    return engine
+    log.info(f"Using database{' (read-only)' if read_only else ''}: {db_url}")
+    return _instrument(engine)
 
 
 _ENGINE = None
 _SESSION_FACTORY = None
+_READ_ENGINE = None
+_READ_SESSION_FACTORY = None
 
 
 def get_engine():
@@ -65,6 +123,25 @@ def get_session_factory():
     return _SESSION_FACTORY
 
 
+def get_read_session_factory():
+    """
+    Sessions for read paths. With DB_READ_ENGINE they come from a separate,
+    read-only engine (its own pool, optionally a replica); otherwise they are
+    ordinary sessions.
+    """
+    global _READ_ENGINE, _READ_SESSION_FACTORY
+    if not SETTINGS.DB_READ_ENGINE:
+        return get_session_factory()
+    if _READ_SESSION_FACTORY is None:
+        _READ_ENGINE = _create_engine(read_only=True)
+        _READ_SESSION_FACTORY = async_sessionmaker(
+            _READ_ENGINE,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _READ_SESSION_FACTORY
+
+
 async def init_db():
     async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -72,22 +149,30 @@ async def init_db():
 
 
 async def dispose_db():
+    global _READ_ENGINE, _READ_SESSION_FACTORY
     engine = get_engine()
     await engine.dispose()
+    if _READ_ENGINE is not None:
+        await _READ_ENGINE.dispose()
+        _READ_ENGINE = _READ_SESSION_FACTORY = None
     log.info("Database engine disposed")
 
 
-async def _get_session():
-    db: AsyncSession = get_session_factory()()
+async def _get_session(read_only: bool = False):
+    factory = get_read_session_factory() if read_only else get_session_factory()
+    db: AsyncSession = factory()
+    DB_SESSIONS.inc()
+    DB_SESSIONS_ACTIVE.inc()
     try:
         yield db
     finally:
         await db.close()
+        DB_SESSIONS_ACTIVE.dec()
 
 
 @asynccontextmanager
-async def get_db():
-    gen = _get_session()
+async def get_db(read_only: bool = False):
+    gen = _get_session(read_only)
     db = await gen.__anext__()
     try:
         yield db
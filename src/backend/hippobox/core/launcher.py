@@ -0,0 +1,196 @@
+import asyncio
+import importlib
+import logging
+import os
+import pkgutil
+import tempfile
+
+import uvicorn
+from pydantic import BaseModel, Field
+
+from hippobox.core.logging_config import setup_logger
+from hippobox.core.settings import SETTINGS
+
+log = logging.getLogger("hippobox")
+
+APP = "hippobox.server:app"
+
+MANAGERS = ("uvicorn", "gunicorn")
+LOOPS = ("auto", "asyncio", "uvloop")
+HTTP_PROTOCOLS = ("auto", "h11", "httptools")
+
+
+class ServerOptions(BaseModel):
+    host: str = Field("0.0.0.0", description="Interface to bind")
+    port: int = Field(8000, description="Port to bind")
+    workers: int = Field(1, description="Worker processes; 1 serves from the current process")
+    manager: str = Field("uvicorn", description="Process manager for more than one worker: uvicorn | gunicorn")
+    preload: bool = Field(False, description="Import the app in the gunicorn master before forking workers")
+    loop: str = Field("auto", description="Event loop: auto | asyncio | uvloop")
+    http: str = Field("auto", description="HTTP parser: auto | h11 | httptools")
+    keep_alive: int = Field(5, description="Seconds an idle keep-alive connection stays open")
+    backlog: int = Field(2048, description="Pending connections the listening socket queues")
+    limit_concurrency: int = Field(0, description="Connections per worker before 503 responses; 0 for no limit")
+    max_requests: int = Field(0, description="Requests after which a worker is restarted; 0 to never restart")
+    graceful_timeout: int = Field(30, description="Seconds in-flight requests get to finish on shutdown or reload")
+
+
+def multi_worker_errors(manager: str) -> list[str]:
+    """
+    Settings that keep state inside one process and therefore break, or
+    silently diverge, when requests are spread over several workers.
+    """
+    errors = []
+    if SETTINGS.VDB_ENABLED and SETTINGS.QDRANT_MODE.lower() == "local":
+        errors.append(
+            "QDRANT_MODE=local opens the collection in a single process; run a Qdrant server "
+            "(QDRANT_MODE=docker, QDRANT_URL=...) to use several workers"
+        )
+    if SETTINGS.REDIS_IN_MEMORY:
+        errors.append(
+            "REDIS_IN_MEMORY keeps tokens, login limits and cache generations per process; "
+            "point REDIS_HOST at a Redis server to use several workers"
+        )
+    for name in ("SEARCH", "STATS"):
+        if getattr(SETTINGS, f"{name}_CACHE_ENABLED") and not getattr(SETTINGS, f"{name}_CACHE_REDIS"):
+            errors.append(
+                f"{name}_CACHE_ENABLED without {name}_CACHE_REDIS would serve stale results after writes "
+                f"handled by another worker; set {name}_CACHE_REDIS=true or {name}_CACHE_ENABLED=false"
+            )
+    if manager == "gunicorn" and SETTINGS.METRICS_ENABLED and not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        errors.append(
+            "METRICS_ENABLED with gunicorn needs PROMETHEUS_MULTIPROC_DIR (an empty directory) "
+            "in the environment before hippobox starts, or METRICS_ENABLED=false"
+        )
+    return errors
+
+
+async def _prepare_database():
+    # Workers start at the same time; creating the tables and the bootstrap
+    # admin once up front turns their own startup calls into no-ops.
+    from hippobox.core.bootstrap_admin import ensure_admin_for_login_disabled, ensure_default_admin_from_settings
+    from hippobox.core.database import dispose_db, init_db
+    from hippobox.core.redis import RedisManager
+
+    # Tables are registered on Base.metadata as their model modules are imported.
+    models = importlib.import_module("hippobox.models")
+    for module in pkgutil.iter_modules(models.__path__):
+        importlib.import_module(f"hippobox.models.{module.name}")
+
+    await init_db()
+    try:
+        await ensure_admin_for_login_disabled()
+        await ensure_default_admin_from_settings()
+    finally:
+        await dispose_db()
+        await RedisManager.close()
+
+
+def _uvicorn_options(options: ServerOptions) -> dict:
+    return {
+        "host": options.host,
+        "port": options.port,
+        "loop": options.loop,
+        "http": options.http,
+        "backlog": options.backlog,
+        "timeout_keep_alive": options.keep_alive,
+        "limit_concurrency": options.limit_concurrency or None,
+        "limit_max_requests": options.max_requests or None,
+        "timeout_graceful_shutdown": options.graceful_timeout,
+    }
+
+
+def _gunicorn_application(options: ServerOptions):
+    try:
+        from gunicorn.app.base import BaseApplication
+        from uvicorn_worker import UvicornWorker
+    except ImportError as e:
+        raise RuntimeError(
+            "--manager gunicorn requires gunicorn and uvicorn-worker: pip install 'hippobox[gunicorn]'"
+        ) from e
+
+    # gunicorn owns the socket, keep-alive and max-requests; the rest is passed to uvicorn.
+    worker_class = type(
+        "HippoBoxWorker",
+        (UvicornWorker,),
+        {
+            "CONFIG_KWARGS": {
+                **UvicornWorker.CONFIG_KWARGS,
+                "loop": options.loop,
+                "http": options.http,
+                "limit_concurrency": options.limit_concurrency or None,
+                "timeout_graceful_shutdown": options.graceful_timeout,
+            }
+        },
+    )
+
+    def child_exit(server, worker):
+        if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+            from prometheus_client import multiprocess
+
+            multiprocess.mark_process_dead(worker.pid)
+
+    class Application(BaseApplication):
+        def load_config(self):
+            config = {
+                "bind": f"{options.host}:{options.port}",
+                "workers": options.workers,
+                "worker_class": worker_class,
+                "preload_app": options.preload,
+                "backlog": options.backlog,
+                "keepalive": options.keep_alive,
+                "max_requests": options.max_requests,
+                "max_requests_jitter": options.max_requests // 10,
+                "graceful_timeout": options.graceful_timeout,
+                "child_exit": child_exit,
+            }
+            for key, value in config.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return importlib.import_module("hippobox.server").app
+
+    return Application()
+
+
+def run_server(options: ServerOptions):
+    """
+    Serve the app with one or more worker processes.
+
+    One worker serves from this process. With more, a process manager
+    supervises them: uvicorn's spawns fresh interpreters and restarts them
+    one at a time on SIGHUP (SIGTTIN / SIGTTOU add or remove a worker);
+    gunicorn forks them, optionally from a master that preloaded the app,
+    and replaces them gracefully on SIGHUP. Settings that only work within
+    one process are rejected before anything starts.
+    """
+    if options.workers <= 1:
+        from hippobox.server import app
+
+        uvicorn.run(app, reload=False, **_uvicorn_options(options))
+        return
+
+    setup_logger()
+    errors = multi_worker_errors(options.manager)
+    if errors:
+        raise ValueError("Cannot run several workers:\n  - " + "\n  - ".join(errors))
+
+    if SETTINGS.METRICS_ENABLED and not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # Spawned workers import prometheus_client afresh and pick this up.
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="hippobox-metrics-")
+        log.info(f"Aggregating worker metrics in {os.environ['PROMETHEUS_MULTIPROC_DIR']}")
+
+    asyncio.run(_prepare_database())
+
+    if options.manager == "gunicorn":
+        if options.preload and SETTINGS.VDB_ENABLED and SETTINGS.EMBEDDING_PROVIDER == "local":
+            # Shared copy-on-write by the forked workers; the model itself is loaded per worker.
+            try:
+                importlib.import_module("sentence_transformers")
+            except ImportError:
+                pass
+        _gunicorn_application(options).run()
+    else:
+        if options.preload:
+            log.warning("--preload only applies to --manager gunicorn; uvicorn workers import the app themselves")
+        uvicorn.run(APP, workers=options.workers, **_uvicorn_options(options))
@@ -0,0 +1,184 @@
+import os
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Latency buckets shared by every histogram, in seconds (1 ms .. 30 s).
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# fastapi_mcp runs tool calls against the app itself through this host.
+MCP_HOST = "apiserver"
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "hippobox_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=BUCKETS,
+)
+MCP_TOOL_SECONDS = Histogram(
+    "hippobox_mcp_tool_duration_seconds",
+    "MCP tool call latency",
+    ["tool", "status"],
+    buckets=BUCKETS,
+)
+SEARCH_STAGE_SECONDS = Histogram(
+    "hippobox_search_stage_duration_seconds",
+    "Knowledge search latency per stage (filters, vector, lexical, hydrate)",
+    ["stage"],
+    buckets=BUCKETS,
+)
+EMBEDDING_REQUEST_SECONDS = Histogram(
+    "hippobox_embedding_request_duration_seconds",
+    "Latency of one embedding provider batch",
+    ["provider"],
+    buckets=BUCKETS,
+)
+EMBEDDING_TEXTS = Counter("hippobox_embedding_texts_total", "Texts sent to the embedding provider", ["provider"])
+EMBEDDING_TOKENS = Counter(
+    "hippobox_embedding_tokens_total", "Tokens billed by the embedding provider, where it reports usage", ["provider"]
+)
+QDRANT_SECONDS = Histogram(
+    "hippobox_qdrant_duration_seconds",
+    "Qdrant call latency by operation",
+    ["op"],
+    buckets=BUCKETS,
+)
+DB_QUERY_SECONDS = Histogram(
+    "hippobox_db_query_duration_seconds",
+    "SQL statement latency by statement type",
+    ["statement"],
+    buckets=BUCKETS,
+)
+DB_SESSIONS = Counter("hippobox_db_sessions_total", "Database sessions opened")
+DB_SESSIONS_ACTIVE = Gauge(
+    "hippobox_db_sessions_active", "Database sessions currently open", multiprocess_mode="livesum"
+)
+REDIS_SECONDS = Histogram(
+    "hippobox_redis_command_duration_seconds",
+    "Redis command latency (pipelines count as one PIPELINE command)",
+    ["command"],
+    buckets=BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "hippobox_cache_lookups_total",
+    "Cache lookups by result; hit ratio = hits (local + redis) / all lookups",
+    ["cache", "result"],
+)
+
+SQL_STATEMENTS = {
+    "SELECT",
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "WITH",
+    "BEGIN",
+    "COMMIT",
+    "ROLLBACK",
+    "PRAGMA",
+    "CREATE",
+    "DROP",
+    "ALTER",
+}
+
+
+@contextmanager
+def observe(histogram: Histogram, **labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(**labels).observe(time.perf_counter() - start)
+
+
+async def timed(histogram: Histogram, awaitable, **labels):
+    """
+    Await and observe one coroutine, e.g. one branch of an asyncio.gather.
+    """
+    with observe(histogram, **labels):
+        return await awaitable
+
+
+def statement_type(statement: str) -> str:
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return verb if verb in SQL_STATEMENTS else "OTHER"
+
+
+def route_template(scope) -> str:
+    """
+    The matched route's path template, e.g. /api/v1/knowledge/{knowledge_id}.
+
+    Depending on the FastAPI version, the matched route of an included router
+    carries its full path or only the part below the router prefix; the
+    prefix is then taken from the request path, since router prefixes here
+    have no parameters.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return "unmatched"
+    if ":path}" in template:
+        return template
+    parts = scope["path"].split("/")
+    prefix = "/".join(parts[: len(parts) - len(template.split("/")) + 1])
+    return prefix + template
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Exposition of every metric; with PROMETHEUS_MULTIPROC_DIR set the values
+    of all worker processes are aggregated.
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """
+    Records request latency by route template, until the last body chunk is
+    sent, so streamed exports are timed in full. Requests that fastapi_mcp
+    makes on behalf of a tool call are recorded under the tool's operation id.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            template = route_template(scope)
+            host = dict(scope.get("headers") or []).get(b"host", b"").decode("latin-1")
+            if host == MCP_HOST:
+                operation_id = getattr(scope.get("route"), "operation_id", None)
+                tool = getattr(operation_id, "value", operation_id) or template
+                MCP_TOOL_SECONDS.labels(tool=tool, status=str(status_code)).observe(elapsed)
+            else:
+                HTTP_REQUEST_SECONDS.labels(method=scope["method"], route=template, status=str(status_code)).observe(
+                    elapsed
+                )
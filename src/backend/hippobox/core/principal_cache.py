@@ -0,0 +1,118 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from hippobox.core.metrics import CACHE_LOOKUPS
+from hippobox.core.redis import RedisManager
+from hippobox.core.settings import SETTINGS
+
+log = logging.getLogger("auth")
+
+T = TypeVar("T", bound=BaseModel)
+
+ADMIN_CACHE_KEY = "auth:admin"
+
+
+def api_key_cache_key(secret_hash: str) -> str:
+    return f"auth:key:{secret_hash}"
+
+
+def user_cache_key(user_id: int) -> str:
+    return f"auth:user:{user_id}"
+
+
+class PrincipalCache:
+    """
+    Short-TTL cache of the records get_current_user resolves on every request
+    (API keys by secret hash, users by id, the login-disabled admin).
+
+    Entries live in an in-process LRU and, with AUTH_CACHE_REDIS, in Redis so
+    workers share them. Writers call invalidate() after changing a user or
+    key; other workers' in-process copies expire within AUTH_CACHE_TTL.
+    Redis errors are logged and treated as misses.
+    """
+
+    def __init__(self, enabled: bool, ttl: int, max_entries: int, use_redis: bool):
+        self.enabled = enabled and ttl > 0
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.use_redis = use_redis
+        self._entries: OrderedDict[str, tuple[float, BaseModel]] = OrderedDict()
+
+    async def get(self, key: str, model: type[T]) -> T | None:
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at >= time.monotonic() and isinstance(value, model):
+                self._entries.move_to_end(key)
+                CACHE_LOOKUPS.labels(cache="auth", result="hit").inc()
+                return value
+            del self._entries[key]
+
+        raw = None
+        if self.use_redis:
+            try:
+                redis = await RedisManager.get_client()
+                raw = await redis.get(key)
+            except Exception as e:
+                log.warning(f"Principal cache Redis lookup failed: {e}")
+        if raw is None:
+            CACHE_LOOKUPS.labels(cache="auth", result="miss").inc()
+            return None
+
+        value = model.model_validate_json(raw)
+        self._set_local(key, value)
+        CACHE_LOOKUPS.labels(cache="auth", result="redis_hit").inc()
+        return value
+
+    def _set_local(self, key: str, value: BaseModel):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def set(self, key: str, value: BaseModel):
+        if not self.enabled:
+            return
+
+        self._set_local(key, value)
+        if not self.use_redis:
+            return
+
+        try:
+            redis = await RedisManager.get_client()
+            await redis.set(key, value.model_dump_json(), ex=self.ttl)
+        except Exception as e:
+            log.warning(f"Principal cache Redis write failed: {e}")
+
+    async def invalidate(self, *keys: str):
+        if not self.enabled or not keys:
+            return
+
+        for key in keys:
+            self._entries.pop(key, None)
+        if not self.use_redis:
+            return
+
+        try:
+            redis = await RedisManager.get_client()
+            await redis.delete(*keys)
+        except Exception as e:
+            log.warning(f"Principal cache Redis invalidation failed: {e}")
+
+    def clear(self):
+        self._entries.clear()
+
+
+Principals = PrincipalCache(
+    enabled=SETTINGS.AUTH_CACHE_ENABLED,
+    ttl=SETTINGS.AUTH_CACHE_TTL,
+    max_entries=SETTINGS.AUTH_CACHE_MAX_ENTRIES,
+    use_redis=SETTINGS.AUTH_CACHE_REDIS,
+)
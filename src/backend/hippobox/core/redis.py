@@ -1,17 +1,63 @@
+import asyncio
 import logging
+import time
 
 import redis.asyncio as redis
 
+from hippobox.core.metrics import REDIS_SECONDS
 from hippobox.core.settings import SETTINGS
 
 log = logging.getLogger("redis")
 
 
+def _instrument(client: redis.Redis) -> redis.Redis:
+    # Time every command and pipeline of the shared client for /metrics.
+    execute_command = client.execute_command
+    make_pipeline = client.pipeline
+
+    async def timed_execute_command(*args, **options):
+        start = time.perf_counter()
+        try:
+            return await execute_command(*args, **options)
+        finally:
+            REDIS_SECONDS.labels(command=str(args[0]).upper()).observe(time.perf_counter() - start)
+
+    def timed_pipeline(*args, **kwargs):
+        pipe = make_pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        async def timed_execute(*exec_args, **exec_kwargs):
+            start = time.perf_counter()
+            try:
+                return await execute(*exec_args, **exec_kwargs)
+            finally:
+                REDIS_SECONDS.labels(command="PIPELINE").observe(time.perf_counter() - start)
+
+        pipe.execute = timed_execute
+        return pipe
+
+    client.execute_command = timed_execute_command
+    client.pipeline = timed_pipeline
+    return client
+
+
 class RedisManager:
     _client: redis.Redis | None = None
+    _lock: asyncio.Lock | None = None
 
     @classmethod
     async def get_client(cls) -> redis.Redis:
+        if cls._client is not None:
+            return cls._client
+
+        # Concurrent first callers must share one client (and, for fakeredis, one dataset).
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            return await cls._connect()
+
+    @classmethod
+    async def _connect(cls) -> redis.Redis:
         if cls._client is None:
             if SETTINGS.REDIS_IN_MEMORY:
                 log.info("Using in-memory Redis (fakeredis).")
@@ -39,7 +85,7 @@ class RedisManager:
                 log.error(f"Redis connection failed: {e}")
                 raise
 
-            cls._client = client
+            cls._client = _instrument(client)
 
         return cls._client
 
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from hippobox.core.metrics import CACHE_LOOKUPS
+from hippobox.core.redis import RedisManager
+from hippobox.core.settings import SETTINGS
+
+log = logging.getLogger("knowledge")
+
+
+def generation_key(name: str, user_id: int) -> str:
+    return f"{name}:gen:{user_id}"
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+class ResultCache:
+    """
+    Per-user cache of read results, e.g. searches keyed by (user, normalized
+    query, filters, limit, mode, weights, generation).
+
+    Every user has a generation counter per cache that knowledge writes,
+    topic renames and deletes, and finished index jobs bump after committing
+    (see invalidate_results); lookups embed the current generation in the
+    key, so a bump makes all of the user's earlier results unreachable at
+    once. Results live in an in-process LRU bounded by max_entries and, with
+    use_redis, in Redis together with the generation counters so every
+    worker sees the same generation. Redis errors are logged and treated as
+    misses.
+    """
+
+    def __init__(self, name: str, enabled: bool, ttl: int, max_entries: int, use_redis: bool):
+        self.name = name
+        self.enabled = enabled and ttl > 0 and max_entries > 0
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.use_redis = use_redis
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[int, int] = {}
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def _generation(self, user_id: int) -> int | None:
+        if not self.use_redis:
+            return self._generations.get(user_id, 0)
+        try:
+            redis = await RedisManager.get_client()
+            return int(await redis.get(generation_key(self.name, user_id)) or 0)
+        except Exception as e:
+            log.warning(f"{self.name.capitalize()} cache Redis generation lookup failed: {e}")
+            return None
+
+    def _key(self, user_id: int, generation: int, params: dict) -> str:
+        if "query" in params:
+            params = {**params, "query": normalize_query(params["query"])}
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return f"{self.name}:{user_id}:{generation}:{digest}"
+
+    def _set_local(self, key: str, results: Any):
+        self._entries[key] = (time.monotonic() + self.ttl, results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def key(self, user_id: int, **params) -> str | None:
+        """
+        Return the cache key of a read at the user's current generation, or
+        None if the result must not be cached.
+        """
+        if not self.enabled:
+            return None
+        generation = await self._generation(user_id)
+        if generation is None:
+            return None
+        return self._key(user_id, generation, params)
+
+    async def get(self, key: str | None, adapter: TypeAdapter) -> Any | None:
+        if key is None:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, results = entry
+            if expires_at >= time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                CACHE_LOOKUPS.labels(cache=self.name, result="hit").inc()
+                return results
+            del self._entries[key]
+
+        if self.use_redis:
+            try:
+                redis = await RedisManager.get_client()
+                raw = await redis.get(key)
+            except Exception as e:
+                log.warning(f"{self.name.capitalize()} cache Redis lookup failed: {e}")
+                raw = None
+            if raw is not None:
+                results = adapter.validate_json(raw)
+                self._set_local(key, results)
+                self.redis_hits += 1
+                CACHE_LOOKUPS.labels(cache=self.name, result="redis_hit").inc()
+                return results
+
+        self.misses += 1
+        CACHE_LOOKUPS.labels(cache=self.name, result="miss").inc()
+        return None
+
+    async def set(self, key: str | None, results: Any, adapter: TypeAdapter):
+        if key is None:
+            return
+
+        self._set_local(key, results)
+        if not self.use_redis:
+            return
+
+        try:
+            redis = await RedisManager.get_client()
+            await redis.set(key, adapter.dump_json(results), ex=self.ttl)
+        except Exception as e:
+            log.warning(f"{self.name.capitalize()} cache Redis write failed: {e}")
+
+    async def invalidate(self, *user_ids: int):
+        """
+        Bump the generation of each user so their cached results are no longer used.
+        """
+        if not self.enabled:
+            return
+
+        user_ids = set(user_ids)
+        for user_id in user_ids:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        self.invalidations += len(user_ids)
+        if not self.use_redis or not user_ids:
+            return
+
+        try:
+            redis = await RedisManager.get_client()
+            async with redis.pipeline(transaction=False) as pipe:
+                for user_id in user_ids:
+                    pipe.incr(generation_key(self.name, user_id))
+                await pipe.execute()
+        except Exception as e:
+            log.warning(f"{self.name.capitalize()} cache Redis invalidation failed: {e}")
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+        }
+
+
+SearchResults = ResultCache(
+    "search",
+    enabled=SETTINGS.SEARCH_CACHE_ENABLED,
+    ttl=SETTINGS.SEARCH_CACHE_TTL,
+    max_entries=SETTINGS.SEARCH_CACHE_MAX_ENTRIES,
+    use_redis=SETTINGS.SEARCH_CACHE_REDIS,
+)
+StatsResults = ResultCache(
+    "stats",
+    enabled=SETTINGS.STATS_CACHE_ENABLED,
+    ttl=SETTINGS.STATS_CACHE_TTL,
+    max_entries=SETTINGS.STATS_CACHE_MAX_ENTRIES,
+    use_redis=SETTINGS.STATS_CACHE_REDIS,
+)
+
+
+async def invalidate_results(*user_ids: int):
+    """
+    Drop the cached search results and stats of the given users; called after
+    every commit that changes what they would return.
+    """
+    await SearchResults.invalidate(*user_ids)
+    await StatsResults.invalidate(*user_ids)
@@ -15,6 +15,25 @@ class Settings(BaseModel):
     # ----------------------------------------
     SWAGGER_ENABLED: bool = os.getenv("SWAGGER_ENABLED", "true").lower() == "true"
 
+    # ----------------------------------------
+    # Server (hippobox run)
+    # ----------------------------------------
+    SERVER_WORKERS: int = int(os.getenv("SERVER_WORKERS", "1"))
+    SERVER_MANAGER: str = os.getenv("SERVER_MANAGER", "uvicorn").lower()
+    SERVER_PRELOAD: bool = os.getenv("SERVER_PRELOAD", "false").lower() == "true"
+    SERVER_LOOP: str = os.getenv("SERVER_LOOP", "auto").lower()
+    SERVER_HTTP: str = os.getenv("SERVER_HTTP", "auto").lower()
+    SERVER_KEEP_ALIVE: int = int(os.getenv("SERVER_KEEP_ALIVE", "5"))
+    SERVER_BACKLOG: int = int(os.getenv("SERVER_BACKLOG", "2048"))
+    SERVER_LIMIT_CONCURRENCY: int = int(os.getenv("SERVER_LIMIT_CONCURRENCY", "0"))
+    SERVER_MAX_REQUESTS: int = int(os.getenv("SERVER_MAX_REQUESTS", "0"))
+    SERVER_GRACEFUL_TIMEOUT: int = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))
+
+    # ----------------------------------------
+    # Metrics (Prometheus)
+    # ----------------------------------------
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
     # ----------------------------------------
     # Frontend
     # ----------------------------------------
@@ -35,9 +54,54 @@ class Settings(BaseModel):
     # LLM / Embedding
     # ----------------------------------------
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-
-    EMBEDDING_PROVIDER: str = os.getenv("EMBEDDING_PROVIDER", "openai")
-    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    OPENAI_BASE_URL: str | None = os.getenv("OPENAI_BASE_URL") or None
+
+    EMBEDDING_PROVIDER: str = os.getenv("EMBEDDING_PROVIDER", "openai").lower()
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL") or (
+        "sentence-transformers/all-MiniLM-L6-v2"
+        if os.getenv("EMBEDDING_PROVIDER", "openai").lower() == "local"
+        else "text-embedding-3-small"
+    )
+    EMBEDDING_DIMENSION: int = int(os.getenv("EMBEDDING_DIMENSION", "0"))
+    EMBEDDING_LOCAL_BACKEND: str = os.getenv("EMBEDDING_LOCAL_BACKEND", "torch").lower()
+    EMBEDDING_LOCAL_THREADS: int = int(os.getenv("EMBEDDING_LOCAL_THREADS", "2"))
+    EMBEDDING_LOCAL_CACHE_DIR: Path | None = (
+        Path(os.environ["EMBEDDING_LOCAL_CACHE_DIR"]) if os.getenv("EMBEDDING_LOCAL_CACHE_DIR") else None
+    )
+    EMBEDDING_TIMEOUT: float = float(os.getenv("EMBEDDING_TIMEOUT", "30"))
+    EMBEDDING_MAX_RETRIES: int = int(os.getenv("EMBEDDING_MAX_RETRIES", "2"))
+    EMBEDDING_MAX_CONCURRENCY: int = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "16"))
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000"))
+    EMBEDDING_CACHE_TTL: int = int(os.getenv("EMBEDDING_CACHE_TTL", "86400"))
+    EMBEDDING_CACHE_REDIS: bool = os.getenv("EMBEDDING_CACHE_REDIS", "false").lower() == "true"
+
+    CHUNK_MAX_TOKENS: int = int(os.getenv("CHUNK_MAX_TOKENS", "512"))
+    CHUNK_OVERLAP_TOKENS: int = int(os.getenv("CHUNK_OVERLAP_TOKENS", "64"))
+    SEARCH_CHUNK_POOLING: str = os.getenv("SEARCH_CHUNK_POOLING", "max").lower()
+    SEARCH_CHUNK_GROUP_SIZE: int = int(os.getenv("SEARCH_CHUNK_GROUP_SIZE", "3"))
+    SEARCH_FUSION_CANDIDATES: int = int(os.getenv("SEARCH_FUSION_CANDIDATES", "50"))
+    SEARCH_RRF_K: int = int(os.getenv("SEARCH_RRF_K", "60"))
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_TTL: int = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "2000"))
+    SEARCH_CACHE_REDIS: bool = os.getenv("SEARCH_CACHE_REDIS", "false").lower() == "true"
+    STATS_CACHE_ENABLED: bool = os.getenv("STATS_CACHE_ENABLED", "true").lower() == "true"
+    STATS_CACHE_TTL: int = int(os.getenv("STATS_CACHE_TTL", "600"))
+    STATS_CACHE_MAX_ENTRIES: int = int(os.getenv("STATS_CACHE_MAX_ENTRIES", "500"))
+    STATS_CACHE_REDIS: bool = os.getenv("STATS_CACHE_REDIS", "false").lower() == "true"
+    QDRANT_UPSERT_BATCH_SIZE: int = int(os.getenv("QDRANT_UPSERT_BATCH_SIZE", "512"))
+    IMPORT_BATCH_SIZE: int = int(os.getenv("IMPORT_BATCH_SIZE", "200"))
+    IMPORT_MAX_ITEMS: int = int(os.getenv("IMPORT_MAX_ITEMS", "5000"))
+    INDEX_WORKER_ENABLED: bool = os.getenv("INDEX_WORKER_ENABLED", "true").lower() == "true"
+    INDEX_WORKER_BATCH_SIZE: int = int(os.getenv("INDEX_WORKER_BATCH_SIZE", "64"))
+    INDEX_WORKER_POLL_INTERVAL: float = float(os.getenv("INDEX_WORKER_POLL_INTERVAL", "1"))
+    INDEX_WORKER_LEASE: float = float(os.getenv("INDEX_WORKER_LEASE", "300"))
+    INDEX_WORKER_MAX_ATTEMPTS: int = int(os.getenv("INDEX_WORKER_MAX_ATTEMPTS", "8"))
+    INDEX_WORKER_BACKOFF: float = float(os.getenv("INDEX_WORKER_BACKOFF", "2"))
+    INDEX_WORKER_BACKOFF_MAX: float = float(os.getenv("INDEX_WORKER_BACKOFF_MAX", "600"))
+    REINDEX_BATCH_SIZE: int = int(os.getenv("REINDEX_BATCH_SIZE", "256"))
 
     # ----------------------------------------
     # Auth
@@ -49,6 +113,12 @@ class Settings(BaseModel):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24
     LOGIN_FAILED_LIMIT: int = 5
     LOGIN_LOCKED_MINUTES: int = 5
+    AUTH_CACHE_ENABLED: bool = os.getenv("AUTH_CACHE_ENABLED", "true").lower() == "true"
+    AUTH_CACHE_TTL: int = int(os.getenv("AUTH_CACHE_TTL", "30"))
+    AUTH_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+    AUTH_CACHE_REDIS: bool = os.getenv("AUTH_CACHE_REDIS", "false").lower() == "true"
+    API_KEY_USAGE_FLUSH_INTERVAL: float = float(os.getenv("API_KEY_USAGE_FLUSH_INTERVAL", "10"))
+    API_KEY_USAGE_REDIS: bool = os.getenv("API_KEY_USAGE_REDIS", "false").lower() == "true"
 
     # ----------------------------------------
     # Admin user
@@ -69,6 +139,18 @@ class Settings(BaseModel):
     DB_USER: str = os.getenv("DB_USER", "postgres")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "")
     DATABASE_URL: str | None = None
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_SQLITE_WAL: bool = os.getenv("DB_SQLITE_WAL", "true").lower() == "true"
+    DB_SQLITE_BUSY_TIMEOUT: int = int(os.getenv("DB_SQLITE_BUSY_TIMEOUT", "5000"))
+    DB_SQLITE_SYNCHRONOUS: str = os.getenv("DB_SQLITE_SYNCHRONOUS", "NORMAL").upper()
+    DB_SQLITE_MMAP_SIZE: int = int(os.getenv("DB_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    DB_SQLITE_CACHE_SIZE: int = int(os.getenv("DB_SQLITE_CACHE_SIZE", "-65536"))
+    DB_READ_ENGINE: bool = os.getenv("DB_READ_ENGINE", "false").lower() == "true"
+    DB_READ_HOST: str = os.getenv("DB_READ_HOST", "")
+    DATABASE_READ_URL: str | None = None
 
     # ----------------------------------------
     # Qdrant
@@ -77,6 +159,16 @@ class Settings(BaseModel):
     QDRANT_MODE: str = os.getenv("QDRANT_MODE", "local")
     QDRANT_PATH: str = os.getenv("QDRANT_PATH", "qdrant_storage")
     QDRANT_URL: str = os.getenv("QDRANT_URL", "http://localhost:6333")
+    QDRANT_API_KEY: str | None = os.getenv("QDRANT_API_KEY", None)
+    QDRANT_PREFER_GRPC: bool = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+    QDRANT_GRPC_PORT: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+    QDRANT_TIMEOUT: int = int(os.getenv("QDRANT_TIMEOUT", "10"))
+    QDRANT_POOL_SIZE: int = int(os.getenv("QDRANT_POOL_SIZE", "0"))
+    QDRANT_INDEX_PROFILE: str = os.getenv("QDRANT_INDEX_PROFILE", "balanced").lower()
+    QDRANT_HNSW_EF: int = int(os.getenv("QDRANT_HNSW_EF", "0"))
+    QDRANT_EXACT_SEARCH: bool = os.getenv("QDRANT_EXACT_SEARCH", "false").lower() == "true"
+    QDRANT_SCROLL_PAGE_SIZE: int = int(os.getenv("QDRANT_SCROLL_PAGE_SIZE", "256"))
+    QDRANT_PAYLOAD_SNIPPET_CHARS: int = int(os.getenv("QDRANT_PAYLOAD_SNIPPET_CHARS", "0"))
     QDRANT_LOCAL_PATH: Path | None = None
 
     # ----------------------------------------
@@ -98,6 +190,9 @@ class Settings(BaseModel):
         if self.DB_DRIVER.startswith("sqlite"):
             db_file = self.ROOT_DIR / self.DB_NAME
             object.__setattr__(self, "DATABASE_URL", f"{self.DB_DRIVER}:///{db_file.as_posix()}")
+            object.__setattr__(
+                self, "DATABASE_READ_URL", f"{self.DB_DRIVER}:///file:{db_file.as_posix()}?mode=ro&uri=true"
+            )
         else:
             object.__setattr__(
                 self,
@@ -107,6 +202,14 @@ class Settings(BaseModel):
                     f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
                 ),
             )
+            object.__setattr__(
+                self,
+                "DATABASE_READ_URL",
+                (
+                    f"{self.DB_DRIVER}://{self.DB_USER}:{self.DB_PASSWORD}"
+                    f"@{self.DB_READ_HOST or self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+                ),
+            )
 
         if self.QDRANT_MODE.lower() == "local":
             object.__setattr__(
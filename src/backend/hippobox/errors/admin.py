@@ -24,6 +24,24 @@ class AdminErrorCode(Enum):
         status.HTTP_404_NOT_FOUND,
     )
 
+    REINDEX_RUNNING = ServiceErrorCode(
+        "REINDEX_RUNNING",
+        "A reindex is already running",
+        status.HTTP_409_CONFLICT,
+    )
+
+    INVALID_REINDEX = ServiceErrorCode(
+        "INVALID_REINDEX",
+        "A rebuild cannot be a dry run",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
+    VDB_DISABLED = ServiceErrorCode(
+        "VDB_DISABLED",
+        "Vector search is disabled",
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
     @property
     def code(self) -> ServiceErrorCode:
         return self.value
@@ -42,6 +42,30 @@ class KnowledgeErrorCode(Enum):
         status.HTTP_500_INTERNAL_SERVER_ERROR,
     )
 
+    INVALID_ITEM = ServiceErrorCode(
+        "INVALID_ITEM",
+        "Knowledge entry is invalid",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
+    IMPORT_TOO_LARGE = ServiceErrorCode(
+        "IMPORT_TOO_LARGE",
+        "Too many entries in one import request",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
+    EXPORT_UNSUPPORTED = ServiceErrorCode(
+        "EXPORT_UNSUPPORTED",
+        "Vectors can only be exported as NDJSON",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
+    INVALID_CURSOR = ServiceErrorCode(
+        "INVALID_CURSOR",
+        "Invalid or expired pagination cursor",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
     VDB_DISABLED = ServiceErrorCode(
         "VDB_DISABLED",
         "Vector search is disabled",
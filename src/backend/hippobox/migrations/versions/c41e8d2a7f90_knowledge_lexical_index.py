@@ -0,0 +1,62 @@
+"""knowledge_lexical_index
+
+Revision ID: c41e8d2a7f90
+Revises: b3c7f2a91d4e
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "c41e8d2a7f90"
+down_revision: Union[str, Sequence[str], None] = "b3c7f2a91d4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSTGRES_TSVECTOR = "to_tsvector('simple', title || ' ' || content)"
+
+SQLITE_FTS_INSERT = "INSERT INTO knowledge_fts(rowid, title, content) VALUES (new.id, new.title, new.content);"
+SQLITE_FTS_DELETE = (
+    "INSERT INTO knowledge_fts(knowledge_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content);"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_knowledge_search ON knowledge USING GIN ({POSTGRES_TSVECTOR})")
+
+    elif conn.dialect.name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5("
+            "title, content, content='knowledge', content_rowid='id', tokenize=\"unicode61 tokenchars '_'\")"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS knowledge_fts_ai AFTER INSERT ON knowledge BEGIN {SQLITE_FTS_INSERT} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS knowledge_fts_ad AFTER DELETE ON knowledge BEGIN {SQLITE_FTS_DELETE} END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS knowledge_fts_au AFTER UPDATE ON knowledge BEGIN "
+            f"{SQLITE_FTS_DELETE} {SQLITE_FTS_INSERT} END"
+        )
+        op.execute("INSERT INTO knowledge_fts(knowledge_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+
+    if conn.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_knowledge_search")
+
+    elif conn.dialect.name == "sqlite":
+        for trigger in ("knowledge_fts_ai", "knowledge_fts_ad", "knowledge_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS knowledge_fts")
@@ -0,0 +1,50 @@
+"""knowledge_keyset_indexes
+
+Revision ID: d5a1f3c8e2b7
+Revises: c41e8d2a7f90
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "d5a1f3c8e2b7"
+down_revision: Union[str, Sequence[str], None] = "c41e8d2a7f90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_knowledge_user_created": ["user_id", "created_at", "id"],
+    "ix_knowledge_user_updated": ["user_id", "updated_at", "id"],
+}
+
+
+def _index_names(conn, table_name: str) -> set[str]:
+    return {index["name"] for index in sa.inspect(conn).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    if not sa.inspect(conn).has_table("knowledge"):
+        return
+
+    existing = _index_names(conn, "knowledge")
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "knowledge", columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    if not sa.inspect(conn).has_table("knowledge"):
+        return
+
+    existing = _index_names(conn, "knowledge")
+    for name in INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="knowledge")
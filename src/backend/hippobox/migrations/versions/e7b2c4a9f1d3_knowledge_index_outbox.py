@@ -0,0 +1,86 @@
+"""knowledge_index_outbox
+
+Revision ID: e7b2c4a9f1d3
+Revises: d5a1f3c8e2b7
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e7b2c4a9f1d3"
+down_revision: Union[str, Sequence[str], None] = "d5a1f3c8e2b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_FTS_INSERT = "INSERT INTO knowledge_fts(rowid, title, content) VALUES (new.id, new.title, new.content);"
+SQLITE_FTS_DELETE = (
+    "INSERT INTO knowledge_fts(knowledge_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content);"
+)
+
+
+def _replace_fts_triggers(update_columns: str) -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute("DROP TRIGGER IF EXISTS knowledge_fts_au")
+    op.execute(f"CREATE TRIGGER IF NOT EXISTS knowledge_fts_ai AFTER INSERT ON knowledge BEGIN {SQLITE_FTS_INSERT} END")
+    op.execute(f"CREATE TRIGGER IF NOT EXISTS knowledge_fts_ad AFTER DELETE ON knowledge BEGIN {SQLITE_FTS_DELETE} END")
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS knowledge_fts_au AFTER UPDATE {update_columns}ON knowledge BEGIN "
+        f"{SQLITE_FTS_DELETE} {SQLITE_FTS_INSERT} END"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    if inspector.has_table("knowledge"):
+        columns = {column["name"] for column in inspector.get_columns("knowledge")}
+        if "index_status" not in columns:
+            op.add_column(
+                "knowledge",
+                sa.Column("index_status", sa.String(length=16), nullable=False, server_default="pending"),
+            )
+            # Entries written so far were indexed inline.
+            op.execute("UPDATE knowledge SET index_status = 'indexed'")
+        # Index status changes must not rewrite the FTS row.
+        _replace_fts_triggers("OF title, content ")
+
+    if not inspector.has_table("knowledge_outbox"):
+        op.create_table(
+            "knowledge_outbox",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("knowledge_id", sa.Integer(), nullable=False),
+            sa.Column("op", sa.String(length=16), nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("available_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("lease_token", sa.String(length=36), nullable=True),
+            sa.Column("last_error", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_knowledge_outbox_available", "knowledge_outbox", ["available_at", "id"])
+        op.create_index("ix_knowledge_outbox_knowledge_id", "knowledge_outbox", ["knowledge_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    if inspector.has_table("knowledge_outbox"):
+        op.drop_index("ix_knowledge_outbox_knowledge_id", table_name="knowledge_outbox")
+        op.drop_index("ix_knowledge_outbox_available", table_name="knowledge_outbox")
+        op.drop_table("knowledge_outbox")
+
+    if inspector.has_table("knowledge"):
+        if "index_status" in {column["name"] for column in inspector.get_columns("knowledge")}:
+            with op.batch_alter_table("knowledge") as batch_op:
+                batch_op.drop_column("index_status")
+        # The SQLite batch rebuild drops the table's triggers; put them back.
+        _replace_fts_triggers("")
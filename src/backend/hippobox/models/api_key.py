@@ -3,10 +3,11 @@ import secrets
 from datetime import datetime, timezone
 
 from pydantic import BaseModel, Field
-from sqlalchemy import DateTime, ForeignKey, select
+from sqlalchemy import DateTime, ForeignKey, bindparam, case, select, update
 from sqlalchemy.orm import Mapped, mapped_column
 
 from hippobox.core.database import Base, get_db
+from hippobox.core.principal_cache import Principals, api_key_cache_key
 
 
 class APIKey(Base):
@@ -154,27 +155,38 @@ class APIKeyTable:
 
             await db.commit()
             await db.refresh(api_key)
+            await Principals.invalidate(api_key_cache_key(api_key.secret_hash))
 
             return APIKeyResponse.model_validate(api_key)
 
-    async def update_usage(self, key_id: int):
-        async with get_db() as db:
-            result = await db.execute(select(APIKey).where(APIKey.id == key_id))
-            api_key = result.scalar_one_or_none()
-
-            if api_key:
-                api_key.last_used_at = datetime.now(timezone.utc)
-                api_key.total_requests += 1
-
-                await db.commit()
+    async def add_usage(self, usage: dict[int, tuple[int, datetime]]):
+        """
+        Apply accumulated usage in one transaction.
+        usage maps key id -> (request count, last seen); counts are added in SQL, so
+        concurrent flushes from several workers never lose increments.
+        """
+        if not usage:
+            return
+
+        table = APIKey.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("key_id"))
+            .values(
+                total_requests=table.c.total_requests + bindparam("n"),
+                last_used_at=case(
+                    (table.c.last_used_at.is_(None), bindparam("seen")),
+                    (table.c.last_used_at < bindparam("seen"), bindparam("seen")),
+                    else_=table.c.last_used_at,
+                ),
+            )
+        )
+        rows = [{"key_id": key_id, "n": n, "seen": seen} for key_id, (n, seen) in usage.items()]
 
-    async def update_last_used(self, key_id: int):
         async with get_db() as db:
-            result = await db.execute(select(APIKey).where(APIKey.id == key_id))
-            api_key = result.scalar_one_or_none()
-            if api_key:
-                api_key.last_used_at = datetime.now(timezone.utc)
-                await db.commit()
+            conn = await db.connection()
+            await conn.execute(stmt, rows)
+            await db.commit()
 
     async def delete(self, key_id: int, user_id: int) -> bool:
         async with get_db() as db:
@@ -186,6 +198,7 @@ class APIKeyTable:
 
             await db.delete(api_key)
             await db.commit()
+            await Principals.invalidate(api_key_cache_key(api_key.secret_hash))
             return True
 
 
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import base64
+import json
+import logging
+import re
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
 
 from pydantic import BaseModel, Field
-from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint, select
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    and_,
+    delete,
+    event,
+    func,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload
+from sqlalchemy.orm import Mapped, defer, joinedload, mapped_column, relationship, selectinload
 
 from hippobox.core.database import Base, get_db
+from hippobox.core.result_cache import invalidate_results
+from hippobox.models.outbox import OutboxOp, outbox_row
 from hippobox.models.topic import Topic
 from hippobox.utils.knowledge_labels import (
     DEFAULT_TOPIC_NAME,
@@ -18,6 +40,16 @@ from hippobox.utils.knowledge_labels import (
     unique_labels,
 )
 
+log = logging.getLogger("knowledge")
+
+LEXICAL_TOKEN_RE = re.compile(r"\w+")
+LEXICAL_MAX_TERMS = 32
+
+LIST_SNIPPET_CHARS = 280
+
+# INSERT ... ON CONFLICT DO NOTHING for the supported dialects, used to create labels in bulk.
+INSERT_IGNORE = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 
 class Tag(Base):
     __tablename__ = "tag"
@@ -38,7 +70,11 @@ class Tag(Base):
 
 class Knowledge(Base):
     __tablename__ = "knowledge"
-    __table_args__ = (UniqueConstraint("user_id", "title", name="uq_knowledge_user_title"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "title", name="uq_knowledge_user_title"),
+        Index("ix_knowledge_user_created", "user_id", "created_at", "id"),
+        Index("ix_knowledge_user_updated", "user_id", "updated_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
@@ -54,6 +90,12 @@ class Knowledge(Base):
     )
     title: Mapped[str] = mapped_column(nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    index_status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default="pending",
+        server_default="pending",
+    )
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[datetime] = mapped_column(
@@ -92,14 +134,131 @@ class KnowledgeTag(Base):
     tag: Mapped[Tag] = relationship("Tag", back_populates="knowledge_tags")
 
 
+# -------------------------------------------
+# Lexical search index
+# -------------------------------------------
+# SQLite: external-content FTS5 table kept in sync by triggers.
+# PostgreSQL: GIN index over the same tsvector expression used by lexical search.
+SQLITE_FTS_INSERT = "INSERT INTO knowledge_fts(rowid, title, content) VALUES (new.id, new.title, new.content);"
+SQLITE_FTS_DELETE = (
+    "INSERT INTO knowledge_fts(knowledge_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content);"
+)
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5("
+    "title, content, content='knowledge', content_rowid='id', tokenize=\"unicode61 tokenchars '_'\")",
+    f"CREATE TRIGGER IF NOT EXISTS knowledge_fts_ai AFTER INSERT ON knowledge BEGIN {SQLITE_FTS_INSERT} END",
+    f"CREATE TRIGGER IF NOT EXISTS knowledge_fts_ad AFTER DELETE ON knowledge BEGIN {SQLITE_FTS_DELETE} END",
+    "CREATE TRIGGER IF NOT EXISTS knowledge_fts_au AFTER UPDATE OF title, content ON knowledge BEGIN "
+    f"{SQLITE_FTS_DELETE} {SQLITE_FTS_INSERT} END",
+]
+POSTGRES_TSVECTOR = "to_tsvector('simple', title || ' ' || content)"
+POSTGRES_FTS_DDL = [f"CREATE INDEX IF NOT EXISTS ix_knowledge_search ON knowledge USING GIN ({POSTGRES_TSVECTOR})"]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_lexical_index(target, connection, **kw):
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'knowledge_fts'"
+        ).first()
+        for ddl in SQLITE_FTS_DDL:
+            connection.exec_driver_sql(ddl)
+        if not exists:
+            # Index rows that were written before the FTS table existed.
+            connection.exec_driver_sql("INSERT INTO knowledge_fts(knowledge_fts) VALUES ('rebuild')")
+            log.info("Lexical index created (SQLite FTS5)")
+    elif dialect == "postgresql":
+        for ddl in POSTGRES_FTS_DDL:
+            connection.exec_driver_sql(ddl)
+
+
+def lexical_terms(query: str) -> list[str]:
+    terms = list(dict.fromkeys(t.lower() for t in LEXICAL_TOKEN_RE.findall(query)))
+    return terms[:LEXICAL_MAX_TERMS]
+
+
+class SearchMode(str, Enum):
+    VECTOR = "vector"
+    LEXICAL = "lexical"
+    HYBRID = "hybrid"
+
+
+class KnowledgeOrder(str, Enum):
+    CREATED_DESC = "created_desc"
+    CREATED_ASC = "created_asc"
+    UPDATED_DESC = "updated_desc"
+    UPDATED_ASC = "updated_asc"
+
+
+class KnowledgeView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+
+def encode_cursor(order: KnowledgeOrder, value: datetime, knowledge_id: int) -> str:
+    payload = json.dumps({"o": order.value, "v": value.isoformat(), "id": knowledge_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order: KnowledgeOrder) -> tuple[datetime, int]:
+    """
+    Decode an opaque list cursor. Raises ValueError if it is malformed or was issued for another order.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        value, knowledge_id = datetime.fromisoformat(payload["v"]), int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Malformed cursor") from e
+    if payload.get("o") != order.value:
+        raise ValueError("Cursor was issued for a different order")
+    return value, knowledge_id
+
+
+class IndexStatus(str, Enum):
+    PENDING = "pending"
+    INDEXED = "indexed"
+    FAILED = "failed"
+    # Written while VDB_ENABLED was off, so no index job exists; `hippobox reindex` picks it up.
+    DISABLED = "disabled"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    TAR = "tar"
+
+
+class StatsBucket(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+
+
+def activity_period(column, dialect: str, bucket: StatsBucket, utc_offset: int):
+    """
+    SQL expression for the first day (YYYY-MM-DD) of the day or ISO week
+    (starting Monday) a UTC timestamp falls in, shifted by utc_offset minutes.
+    """
+    if dialect == "postgresql":
+        local = func.timezone("UTC", column) + func.make_interval(0, 0, 0, 0, 0, utc_offset)
+        return func.to_char(func.date_trunc(bucket.value, local), "YYYY-MM-DD")
+    modifiers = [f"{utc_offset:+d} minutes"]
+    if bucket == StatsBucket.WEEK:
+        modifiers += ["-6 days", "weekday 1"]
+    return func.date(column, *modifiers)
+
+
 class KnowledgeModel(BaseModel):
     id: int = Field(..., description="Unique identifier of the knowledge entry")
 
     user_id: int = Field(..., description="Owner's user identifier")
+    topic_id: int = Field(..., description="Identifier of the topic row")
     topic: str = Field(..., description="High-level topic or category of the knowledge")
+    tag_ids: list[int] = Field(default_factory=list, description="Identifiers of the tag rows")
     tags: list[str] = Field(default_factory=list, description="List of keywords describing the knowledge")
     title: str = Field(..., description="Short title summarizing the knowledge")
     content: str = Field(..., description="Full text content of the knowledge entry")
+    index_status: IndexStatus = Field(IndexStatus.PENDING, description="Vector index state of the entry")
 
     created_at: datetime = Field(..., description="Timestamp when the entry was created")
     updated_at: datetime = Field(..., description="Timestamp when the entry was last updated")
@@ -108,6 +267,22 @@ class KnowledgeModel(BaseModel):
         from_attributes = True
 
 
+class KnowledgeSummaryModel(BaseModel):
+    id: int = Field(..., description="Unique identifier of the knowledge entry")
+
+    user_id: int = Field(..., description="Owner's user identifier")
+    topic_id: int = Field(..., description="Identifier of the topic row")
+    topic: str = Field(..., description="High-level topic or category of the knowledge")
+    tag_ids: list[int] = Field(default_factory=list, description="Identifiers of the tag rows")
+    tags: list[str] = Field(default_factory=list, description="List of keywords describing the knowledge")
+    title: str = Field(..., description="Short title summarizing the knowledge")
+    snippet: str = Field(..., description="Leading characters of the content")
+    index_status: IndexStatus = Field(IndexStatus.PENDING, description="Vector index state of the entry")
+
+    created_at: datetime = Field(..., description="Timestamp when the entry was created")
+    updated_at: datetime = Field(..., description="Timestamp when the entry was last updated")
+
+
 class KnowledgeForm(BaseModel):
     topic: str | None = Field(None, description="Topic or category under which the knowledge will be stored")
     tags: list[str] = Field(default_factory=list, description="Keywords for search and categorization")
@@ -122,10 +297,50 @@ class KnowledgeResponse(BaseModel):
     tags: list[str] = Field(default_factory=list, description="Keywords associated with this knowledge")
     title: str = Field(..., description="Title summarizing the content")
     content: str = Field(..., description="Full text content of the knowledge entry")
+    index_status: IndexStatus = Field(
+        IndexStatus.PENDING,
+        description="pending until the background worker has written the vectors; disabled without a vector DB",
+    )
+    created_at: datetime = Field(..., description="Timestamp when the entry was created")
+    updated_at: datetime = Field(..., description="Timestamp when the entry was last updated")
+
+
+class KnowledgeListItem(BaseModel):
+    id: int = Field(..., description="Unique identifier of the knowledge entry")
+    user_id: int = Field(..., description="Owner's user identifier")
+    topic: str = Field(..., description="Topic or category of this knowledge")
+    tags: list[str] = Field(default_factory=list, description="Keywords associated with this knowledge")
+    title: str = Field(..., description="Title summarizing the content")
+    content: str | None = Field(None, description="Full text content, present in the full view")
+    snippet: str | None = Field(None, description="Leading characters of the content, present in the summary view")
+    index_status: IndexStatus = Field(IndexStatus.PENDING, description="Vector index state of the entry")
     created_at: datetime = Field(..., description="Timestamp when the entry was created")
     updated_at: datetime = Field(..., description="Timestamp when the entry was last updated")
 
 
+class KnowledgePage(BaseModel):
+    items: list[KnowledgeListItem] = Field(default_factory=list, description="Entries on this page")
+    next_cursor: str | None = Field(None, description="Cursor for the next page, or null on the last page")
+
+
+class KnowledgeImportForm(BaseModel):
+    items: list[dict] = Field(..., description="Entries to import, each shaped like KnowledgeForm")
+
+
+class KnowledgeImportError(BaseModel):
+    index: int = Field(..., description="Position of the failed entry in the submitted items")
+    title: str | None = Field(None, description="Title of the failed entry, if it had one")
+    error: str = Field(..., description="Error code")
+    message: str = Field(..., description="Human readable reason")
+
+
+class KnowledgeImportResult(BaseModel):
+    total: int = Field(..., description="Number of submitted entries")
+    created: int = Field(..., description="Number of entries stored")
+    ids: list[int] = Field(default_factory=list, description="Identifiers of the stored entries")
+    errors: list[KnowledgeImportError] = Field(default_factory=list, description="Entries that were not stored")
+
+
 class KnowledgeUpdate(BaseModel):
     topic: str | None = Field(None, description="Updated topic, if changed")
     tags: list[str] | None = Field(None, description="Updated keyword list, if changed")
@@ -133,109 +348,135 @@ class KnowledgeUpdate(BaseModel):
     content: str | None = Field(None, description="Updated content text, if changed")
 
 
+class LabelCount(BaseModel):
+    id: int = Field(..., description="Identifier of the topic or tag")
+    name: str = Field(..., description="Display name")
+    count: int = Field(..., description="Number of knowledge entries")
+
+
+class TopicCount(LabelCount):
+    is_default: bool = Field(False, description="Whether this is the default topic")
+
+
+class ActivityPoint(BaseModel):
+    period: date = Field(..., description="First day of the day or week")
+    created: int = Field(0, description="Entries created in the period")
+    updated: int = Field(0, description="Entries whose last update falls in the period")
+
+
+class KnowledgeStats(BaseModel):
+    total: int = Field(0, description="Number of knowledge entries")
+    index_status: dict[IndexStatus, int] = Field(default_factory=dict, description="Entries per vector index state")
+    content_chars: int = Field(0, description="Total content length in characters")
+    content_chars_avg: float = Field(0.0, description="Average content length in characters")
+    content_chars_max: int = Field(0, description="Longest content in characters")
+    first_created_at: datetime | None = Field(None, description="Creation time of the oldest entry")
+    last_updated_at: datetime | None = Field(None, description="Time of the latest update")
+    topics: list[TopicCount] = Field(default_factory=list, description="Every topic with its entry count")
+    tags: list[LabelCount] = Field(default_factory=list, description="Most used tags with their entry count")
+    tag_total: int = Field(0, description="Number of tags, including those not listed")
+    bucket: StatsBucket = Field(StatsBucket.DAY, description="Size of the activity periods")
+    since: date = Field(..., description="First day covered by activity")
+    activity: list[ActivityPoint] = Field(
+        default_factory=list, description="Periods with activity, oldest first; empty periods are omitted"
+    )
+
+
 class KnowledgeTable:
-    async def _get_or_create_default_topic(self, db, user_id: int) -> Topic:
-        result = await db.execute(
-            select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == DEFAULT_TOPIC_NORMALIZED)
-        )
-        topic = result.scalar_one_or_none()
-        if topic:
-            return topic
-
-        topic = Topic(
-            user_id=user_id,
-            name=DEFAULT_TOPIC_NAME,
-            normalized_name=DEFAULT_TOPIC_NORMALIZED,
-            created_at=datetime.now(timezone.utc),
+    async def _get_or_create_labels(self, db, model: type[Topic] | type[Tag], user_id: int, names: dict[str, str]):
+        """
+        Resolve labels to rows with one lookup, one INSERT ... ON CONFLICT DO
+        NOTHING for the missing ones and one re-select.
+        names maps normalized_name -> display name; the result is keyed by normalized_name.
+
+        A label created concurrently by another writer is simply skipped by the
+        insert and picked up by the re-select, so the caller's transaction is
+        never rolled back.
+        """
+        if not names:
+            return {}
+
+        result = await db.execute(select(model).where(model.user_id == user_id, model.normalized_name.in_(list(names))))
+        found = {row.normalized_name: row for row in result.scalars().all()}
+        missing = [normalized for normalized in names if normalized not in found]
+        if not missing:
+            return found
+
+        insert = INSERT_IGNORE[db.get_bind().dialect.name]
+        now = datetime.now(timezone.utc)
+        await db.execute(
+            insert(model)
+            .values([{"user_id": user_id, "name": names[n], "normalized_name": n, "created_at": now} for n in missing])
+            .on_conflict_do_nothing(index_elements=["user_id", "normalized_name"])
         )
-        db.add(topic)
-        try:
-            await db.flush()
-        except IntegrityError:
-            await db.rollback()
-            result = await db.execute(
-                select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == DEFAULT_TOPIC_NORMALIZED)
-            )
-            topic = result.scalar_one()
-        return topic
-
-    async def _get_or_create_topic(self, db, user_id: int, raw_topic: str | None) -> Topic:
-        if not raw_topic or not raw_topic.strip():
-            return await self._get_or_create_default_topic(db, user_id)
-
-        name = clean_label(raw_topic)
-        normalized = normalize_label(name)
-        result = await db.execute(select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == normalized))
-        topic = result.scalar_one_or_none()
-        if topic:
-            return topic
-
-        topic = Topic(user_id=user_id, name=name, normalized_name=normalized)
-        db.add(topic)
-        try:
-            await db.flush()
-        except IntegrityError:
-            await db.rollback()
-            result = await db.execute(
-                select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == normalized)
-            )
-            topic = result.scalar_one()
-        return topic
-
-    async def _get_or_create_tag(self, db, user_id: int, raw_tag: str) -> Tag:
-        name = clean_label(raw_tag).lstrip("#")
-        normalized = normalize_tag(name)
-        result = await db.execute(select(Tag).where(Tag.user_id == user_id, Tag.normalized_name == normalized))
-        tag = result.scalar_one_or_none()
-        if tag:
-            return tag
-
-        tag = Tag(user_id=user_id, name=name, normalized_name=normalized)
-        db.add(tag)
-        try:
-            await db.flush()
-        except IntegrityError:
-            await db.rollback()
-            result = await db.execute(select(Tag).where(Tag.user_id == user_id, Tag.normalized_name == normalized))
-            tag = result.scalar_one()
-        return tag
+
+        result = await db.execute(select(model).where(model.user_id == user_id, model.normalized_name.in_(missing)))
+        found.update({row.normalized_name: row for row in result.scalars().all()})
+        return found
+
+    @staticmethod
+    def _topic_key(raw_topic: str | None) -> str:
+        if raw_topic and raw_topic.strip():
+            return normalize_label(raw_topic)
+        return DEFAULT_TOPIC_NORMALIZED
+
+    async def _get_or_create_topics(self, db, user_id: int, raw_topics: list[str | None]) -> dict[str, Topic]:
+        names: dict[str, str] = {}
+        for raw_topic in raw_topics:
+            key = self._topic_key(raw_topic)
+            names.setdefault(key, clean_label(raw_topic) if key != DEFAULT_TOPIC_NORMALIZED else DEFAULT_TOPIC_NAME)
+        return await self._get_or_create_labels(db, Topic, user_id, names)
+
+    async def _get_or_create_tags(self, db, user_id: int, raw_tags: list[str]) -> dict[str, Tag]:
+        names = {normalize_tag(name): name for name in unique_labels(raw_tags)}
+        return await self._get_or_create_labels(db, Tag, user_id, names)
 
     def _to_model(self, knowledge: Knowledge) -> KnowledgeModel:
         topic_name = knowledge.topic.name if knowledge.topic else DEFAULT_TOPIC_NAME
-        tags = [kt.tag.name for kt in knowledge.knowledge_tags if kt.tag]
+        tags = [kt.tag for kt in knowledge.knowledge_tags if kt.tag]
         return KnowledgeModel(
             id=knowledge.id,
             user_id=knowledge.user_id,
+            topic_id=knowledge.topic_id,
             topic=topic_name,
-            tags=tags,
+            tag_ids=[tag.id for tag in tags],
+            tags=[tag.name for tag in tags],
             title=knowledge.title,
             content=knowledge.content,
+            index_status=knowledge.index_status,
             created_at=knowledge.created_at,
             updated_at=knowledge.updated_at,
         )
 
-    async def create(self, user_id: int, form: KnowledgeForm) -> KnowledgeModel:
+    async def create(self, user_id: int, form: KnowledgeForm, index: bool = True) -> KnowledgeModel:
+        """
+        Insert an entry. With index, an outbox job is written in the same
+        transaction and the background worker embeds the entry later.
+        """
         async with get_db() as db:
-            topic = await self._get_or_create_topic(db, user_id, form.topic)
+            topics = await self._get_or_create_topics(db, user_id, [form.topic])
+            tags = await self._get_or_create_tags(db, user_id, form.tags)
+            topic = topics[self._topic_key(form.topic)]
             knowledge = Knowledge(
                 user_id=user_id,
                 topic_id=topic.id,
                 title=form.title.strip(),
                 content=form.content,
+                index_status=IndexStatus.PENDING.value if index else IndexStatus.DISABLED.value,
                 created_at=datetime.now(timezone.utc),
                 updated_at=datetime.now(timezone.utc),
             )
             knowledge.topic = topic
+            knowledge.knowledge_tags = [
+                KnowledgeTag(tag_id=tags[normalize_tag(name)].id, user_id=user_id) for name in unique_labels(form.tags)
+            ]
             db.add(knowledge)
             await db.flush()
 
-            tag_names = unique_labels(form.tags)
-            if tag_names:
-                for raw_tag in tag_names:
-                    tag = await self._get_or_create_tag(db, user_id, raw_tag)
-                    db.add(KnowledgeTag(knowledge_id=knowledge.id, tag_id=tag.id, user_id=user_id))
-
+            if index:
+                db.add(outbox_row(user_id, knowledge.id, OutboxOp.INDEX))
             await db.commit()
+            await invalidate_results(user_id)
             result = await db.execute(
                 select(Knowledge)
                 .options(
@@ -247,8 +488,74 @@ class KnowledgeTable:
             created = result.scalar_one()
             return self._to_model(created)
 
-    async def get(self, user_id: int, knowledge_id: int) -> KnowledgeModel | None:
+    async def create_many(
+        self, user_id: int, forms: list[KnowledgeForm], index: bool = True
+    ) -> tuple[dict[int, KnowledgeModel], list[int]]:
+        """
+        Insert a batch of entries in one transaction.
+
+        Topics and tags of the whole batch are resolved with a single lookup
+        each. Entries whose title already exists for the user, or repeats an
+        earlier entry of the batch, are skipped. With index, outbox jobs for
+        the new entries are written in the same transaction.
+
+        ### Returns:
+
+            (created, conflicts): created entries keyed by position in forms,
+            and the positions skipped for a duplicate title.
+        """
+        if not forms:
+            return {}, []
+
+        titles = [form.title.strip() for form in forms]
+        rows: dict[int, Knowledge] = {}
+        conflicts: list[int] = []
+
         async with get_db() as db:
+            result = await db.execute(
+                select(Knowledge.title).where(Knowledge.user_id == user_id, Knowledge.title.in_(titles))
+            )
+            taken = set(result.scalars().all())
+
+            topics = await self._get_or_create_topics(db, user_id, [form.topic for form in forms])
+            tags = await self._get_or_create_tags(db, user_id, [tag for form in forms for tag in form.tags])
+
+            now = datetime.now(timezone.utc)
+            for i, form in enumerate(forms):
+                if titles[i] in taken:
+                    conflicts.append(i)
+                    continue
+                taken.add(titles[i])
+
+                knowledge = Knowledge(
+                    user_id=user_id,
+                    topic_id=topics[self._topic_key(form.topic)].id,
+                    title=titles[i],
+                    content=form.content,
+                    index_status=IndexStatus.PENDING.value if index else IndexStatus.DISABLED.value,
+                    created_at=now,
+                    updated_at=now,
+                )
+                knowledge.knowledge_tags = [
+                    KnowledgeTag(tag_id=tags[normalize_tag(name)].id, user_id=user_id)
+                    for name in unique_labels(form.tags)
+                ]
+                rows[i] = knowledge
+
+            db.add_all(rows.values())
+            await db.flush()
+            if index:
+                db.add_all([outbox_row(user_id, knowledge.id, OutboxOp.INDEX) for knowledge in rows.values()])
+            await db.commit()
+            if rows:
+                await invalidate_results(user_id)
+            ids = {i: knowledge.id for i, knowledge in rows.items()}
+
+        by_id = {k.id: k for k in await self.get_many(user_id, list(ids.values()))}
+        return {i: by_id[kid] for i, kid in ids.items() if kid in by_id}, conflicts
+
+    async def get(self, user_id: int, knowledge_id: int) -> KnowledgeModel | None:
+        async with get_db(read_only=True) as db:
             result = await db.execute(
                 select(Knowledge)
                 .options(
@@ -260,69 +567,361 @@ class KnowledgeTable:
             knowledge = result.scalar_one_or_none()
             return self._to_model(knowledge) if knowledge else None
 
-    async def get_by_title(self, user_id: int, title: str) -> KnowledgeModel | None:
-        async with get_db() as db:
+    async def get_many(self, user_id: int, knowledge_ids: list[int], read_only: bool = False) -> list[KnowledgeModel]:
+        """
+        Load several entries in one query, returned in the order of knowledge_ids.
+        Ids that do not exist or belong to another user are skipped.
+        read_only uses the read engine; the index worker reads the primary so
+        it never embeds a version a replica has not caught up with.
+        """
+        if not knowledge_ids:
+            return []
+
+        async with get_db(read_only=read_only) as db:
             result = await db.execute(
                 select(Knowledge)
                 .options(
-                    selectinload(Knowledge.topic),
-                    selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+                    joinedload(Knowledge.topic),
+                    joinedload(Knowledge.knowledge_tags).joinedload(KnowledgeTag.tag),
                 )
-                .where(Knowledge.title == title, Knowledge.user_id == user_id)
+                .where(Knowledge.id.in_(knowledge_ids), Knowledge.user_id == user_id)
             )
-            knowledge = result.scalar_one_or_none()
-            return self._to_model(knowledge) if knowledge else None
+            by_id = {k.id: k for k in result.unique().scalars().all()}
+            return [self._to_model(by_id[kid]) for kid in knowledge_ids if kid in by_id]
 
-    async def get_list(self, user_id: int) -> list[KnowledgeModel]:
-        async with get_db() as db:
+    async def lexical_search(
+        self,
+        user_id: int,
+        query: str,
+        limit: int,
+        topic_id: int | None = None,
+        tag_id: int | None = None,
+    ) -> list[int]:
+        """
+        Rank the user's entries by keyword match on title and content.
+        Uses FTS5 on SQLite and tsvector on PostgreSQL; other backends fall back to unranked LIKE.
+        """
+        terms = lexical_terms(query)
+        if not terms:
+            return []
+
+        params = {"user_id": user_id, "limit": limit, "topic_id": topic_id, "tag_id": tag_id}
+        filters = "k.user_id = :user_id"
+        joins = ""
+        if topic_id is not None:
+            filters += " AND k.topic_id = :topic_id"
+        if tag_id is not None:
+            joins = "JOIN knowledge_tag kt ON kt.knowledge_id = k.id AND kt.tag_id = :tag_id"
+
+        async with get_db(read_only=True) as db:
+            dialect = db.get_bind().dialect.name
+
+            if dialect == "sqlite":
+                params["match"] = " OR ".join(f'"{term}"' for term in terms)
+                result = await db.execute(
+                    text(
+                        f"SELECT k.id FROM knowledge_fts JOIN knowledge k ON k.id = knowledge_fts.rowid {joins} "
+                        f"WHERE knowledge_fts MATCH :match AND {filters} "
+                        "ORDER BY bm25(knowledge_fts, 10.0, 1.0) LIMIT :limit"
+                    ),
+                    params,
+                )
+            elif dialect == "postgresql":
+                params["tsquery"] = " | ".join(terms)
+                result = await db.execute(
+                    text(
+                        f"SELECT k.id FROM knowledge k {joins} "
+                        f"WHERE {POSTGRES_TSVECTOR} @@ to_tsquery('simple', :tsquery) AND {filters} "
+                        f"ORDER BY ts_rank_cd({POSTGRES_TSVECTOR}, to_tsquery('simple', :tsquery)) DESC LIMIT :limit"
+                    ),
+                    params,
+                )
+            else:
+                stmt = select(Knowledge.id).where(
+                    Knowledge.user_id == user_id,
+                    or_(*[Knowledge.title.ilike(f"%{t}%") | Knowledge.content.ilike(f"%{t}%") for t in terms]),
+                )
+                if topic_id is not None:
+                    stmt = stmt.where(Knowledge.topic_id == topic_id)
+                if tag_id is not None:
+                    stmt = stmt.join(KnowledgeTag, KnowledgeTag.knowledge_id == Knowledge.id).where(
+                        KnowledgeTag.tag_id == tag_id
+                    )
+                result = await db.execute(stmt.order_by(Knowledge.updated_at.desc()).limit(limit))
+
+            return [row[0] for row in result.all()]
+
+    async def get_tag_id(self, user_id: int, tag: str) -> int | None:
+        async with get_db(read_only=True) as db:
+            result = await db.execute(
+                select(Tag.id).where(Tag.user_id == user_id, Tag.normalized_name == normalize_tag(tag))
+            )
+            return result.scalar_one_or_none()
+
+    async def get_by_title(self, user_id: int, title: str) -> KnowledgeModel | None:
+        async with get_db(read_only=True) as db:
             result = await db.execute(
                 select(Knowledge)
                 .options(
                     selectinload(Knowledge.topic),
                     selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
                 )
-                .where(Knowledge.user_id == user_id)
+                .where(Knowledge.title == title, Knowledge.user_id == user_id)
+            )
+            knowledge = result.scalar_one_or_none()
+            return self._to_model(knowledge) if knowledge else None
+
+    def _to_summary(self, knowledge: Knowledge, snippet: str) -> KnowledgeSummaryModel:
+        topic_name = knowledge.topic.name if knowledge.topic else DEFAULT_TOPIC_NAME
+        tags = [kt.tag for kt in knowledge.knowledge_tags if kt.tag]
+        return KnowledgeSummaryModel(
+            id=knowledge.id,
+            user_id=knowledge.user_id,
+            topic_id=knowledge.topic_id,
+            topic=topic_name,
+            tag_ids=[tag.id for tag in tags],
+            tags=[tag.name for tag in tags],
+            title=knowledge.title,
+            snippet=snippet or "",
+            index_status=knowledge.index_status,
+            created_at=knowledge.created_at,
+            updated_at=knowledge.updated_at,
+        )
+
+    async def get_page(
+        self,
+        user_id: int,
+        limit: int,
+        cursor: str | None = None,
+        order: KnowledgeOrder = KnowledgeOrder.CREATED_DESC,
+        view: KnowledgeView = KnowledgeView.FULL,
+        topic: str | None = None,
+        tag: str | None = None,
+    ) -> tuple[list[KnowledgeModel] | list[KnowledgeSummaryModel], str | None]:
+        """
+        Return one page of the user's entries and the cursor of the next page.
+
+        Pages are keyset-paginated on (created_at | updated_at, id), so each
+        page is an index range scan regardless of depth. The summary view
+        skips loading content and selects only its first LIST_SNIPPET_CHARS
+        characters. Raises ValueError for an invalid cursor.
+        """
+        sort_column = Knowledge.updated_at if order.value.startswith("updated") else Knowledge.created_at
+        descending = order.value.endswith("desc")
+
+        stmt = select(Knowledge).options(
+            selectinload(Knowledge.topic),
+            selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+        )
+        if view == KnowledgeView.SUMMARY:
+            stmt = stmt.add_columns(func.substr(Knowledge.content, 1, LIST_SNIPPET_CHARS)).options(
+                defer(Knowledge.content)
+            )
+        stmt = stmt.where(Knowledge.user_id == user_id)
+
+        if topic is not None:
+            stmt = stmt.join(Topic, Knowledge.topic_id == Topic.id).where(
+                Topic.normalized_name == normalize_label(topic)
+            )
+        if tag is not None:
+            stmt = (
+                stmt.join(KnowledgeTag, Knowledge.id == KnowledgeTag.knowledge_id)
+                .join(Tag, Tag.id == KnowledgeTag.tag_id)
+                .where(Tag.normalized_name == normalize_tag(tag))
             )
-            knowledges = result.scalars().all()
-            return [self._to_model(k) for k in knowledges]
 
-    async def get_by_topic(self, user_id: int, topic: str) -> list[KnowledgeModel]:
+        if cursor:
+            value, last_id = decode_cursor(cursor, order)
+            if descending:
+                stmt = stmt.where(or_(sort_column < value, and_(sort_column == value, Knowledge.id < last_id)))
+            else:
+                stmt = stmt.where(or_(sort_column > value, and_(sort_column == value, Knowledge.id > last_id)))
+
+        if descending:
+            stmt = stmt.order_by(sort_column.desc(), Knowledge.id.desc())
+        else:
+            stmt = stmt.order_by(sort_column.asc(), Knowledge.id.asc())
+
+        async with get_db(read_only=True) as db:
+            # One extra row tells whether another page exists.
+            result = await db.execute(stmt.limit(limit + 1))
+            if view == KnowledgeView.SUMMARY:
+                rows = [(k, snippet) for k, snippet in result.all()]
+            else:
+                rows = [(k, None) for k in result.scalars().all()]
+
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            if view == KnowledgeView.SUMMARY:
+                items = [self._to_summary(k, snippet) for k, snippet in rows]
+            else:
+                items = [self._to_model(k) for k, _ in rows]
+
+        next_cursor = None
+        if has_more and items:
+            last = items[-1]
+            last_value = last.updated_at if sort_column is Knowledge.updated_at else last.created_at
+            next_cursor = encode_cursor(order, last_value, last.id)
+
+        return items, next_cursor
+
+    async def count(self, user_id: int | None = None) -> int:
+        stmt = select(func.count(Knowledge.id))
+        if user_id is not None:
+            stmt = stmt.where(Knowledge.user_id == user_id)
         async with get_db() as db:
-            normalized = normalize_label(topic)
-            result = await db.execute(
-                select(Knowledge)
-                .join(Topic, Knowledge.topic_id == Topic.id)
-                .options(
-                    selectinload(Knowledge.topic),
-                    selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+            result = await db.execute(stmt)
+            return result.scalar_one()
+
+    async def stats(
+        self,
+        user_id: int,
+        since: date,
+        bucket: StatsBucket = StatsBucket.DAY,
+        utc_offset: int = 0,
+        tag_limit: int = 50,
+    ) -> KnowledgeStats:
+        """
+        Aggregate the user's entries with GROUP BY queries: totals and content
+        length, entries per index state, topic and tag counts, and created and
+        updated entries per day or week since the given local date. No entry
+        rows are loaded, so the cost does not grow with content size.
+        """
+        since_utc = datetime.combine(since, datetime.min.time(), timezone.utc) - timedelta(minutes=utc_offset)
+        mine = Knowledge.user_id == user_id
+
+        async with get_db(read_only=True) as db:
+            dialect = db.get_bind().dialect.name
+            length = func.length(Knowledge.content)
+            totals = (
+                await db.execute(
+                    select(
+                        func.count(Knowledge.id),
+                        func.coalesce(func.sum(length), 0),
+                        func.coalesce(func.max(length), 0),
+                        func.min(Knowledge.created_at),
+                        func.max(Knowledge.updated_at),
+                    ).where(mine)
                 )
-                .where(Topic.normalized_name == normalized, Knowledge.user_id == user_id)
+            ).one()
+
+            statuses = await db.execute(
+                select(Knowledge.index_status, func.count(Knowledge.id)).where(mine).group_by(Knowledge.index_status)
+            )
+
+            entries = func.count(Knowledge.id).label("entries")
+            topics = await db.execute(
+                select(Topic.id, Topic.name, Topic.normalized_name, entries)
+                .outerjoin(Knowledge, Knowledge.topic_id == Topic.id)
+                .where(Topic.user_id == user_id)
+                .group_by(Topic.id, Topic.name, Topic.normalized_name)
+                .order_by(entries.desc(), Topic.name.asc())
             )
-            knowledges = result.scalars().all()
-            return [self._to_model(k) for k in knowledges]
 
-    async def get_by_tag(self, user_id: int, tag: str) -> list[KnowledgeModel]:
+            tagged = func.count(KnowledgeTag.knowledge_id).label("tagged")
+            tags = await db.execute(
+                select(Tag.id, Tag.name, tagged)
+                .outerjoin(KnowledgeTag, KnowledgeTag.tag_id == Tag.id)
+                .where(Tag.user_id == user_id)
+                .group_by(Tag.id, Tag.name)
+                .order_by(tagged.desc(), Tag.name.asc())
+                .limit(tag_limit)
+            )
+            tag_total = (await db.execute(select(func.count(Tag.id)).where(Tag.user_id == user_id))).scalar_one()
+
+            activity: dict[str, ActivityPoint] = {}
+            for field, column in (("created", Knowledge.created_at), ("updated", Knowledge.updated_at)):
+                period = activity_period(column, dialect, bucket, utc_offset).label("period")
+                rows = await db.execute(
+                    select(period, func.count(Knowledge.id))
+                    .where(mine, column >= since_utc)
+                    .group_by(period)
+                    .order_by(period)
+                )
+                for key, count in rows.all():
+                    setattr(activity.setdefault(key, ActivityPoint(period=key)), field, count)
+
+        total, content_chars, content_chars_max, first_created_at, last_updated_at = totals
+        return KnowledgeStats(
+            total=total,
+            index_status={status: count for status, count in statuses.all()},
+            content_chars=content_chars,
+            content_chars_avg=round(content_chars / total, 1) if total else 0.0,
+            content_chars_max=content_chars_max,
+            first_created_at=first_created_at,
+            last_updated_at=last_updated_at,
+            topics=[
+                TopicCount(id=tid, name=name, count=count, is_default=normalized == DEFAULT_TOPIC_NORMALIZED)
+                for tid, name, normalized, count in topics.all()
+            ],
+            tags=[LabelCount(id=tid, name=name, count=count) for tid, name, count in tags.all()],
+            tag_total=tag_total,
+            bucket=bucket,
+            since=since,
+            activity=[activity[key] for key in sorted(activity)],
+        )
+
+    async def existing_ids(self, knowledge_ids: list[int]) -> set[int]:
+        if not knowledge_ids:
+            return set()
         async with get_db() as db:
-            normalized = normalize_tag(tag)
-            result = await db.execute(
+            result = await db.execute(select(Knowledge.id).where(Knowledge.id.in_(knowledge_ids)))
+            return set(result.scalars().all())
+
+    async def iter_batches(self, batch_size: int = 500, user_id: int | None = None):
+        """
+        Yield knowledge entries in id order, one batch per session.
+        """
+        last_id = 0
+        while True:
+            async with get_db() as db:
+                stmt = (
+                    select(Knowledge)
+                    .options(
+                        selectinload(Knowledge.topic),
+                        selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+                    )
+                    .where(Knowledge.id > last_id)
+                    .order_by(Knowledge.id.asc())
+                    .limit(batch_size)
+                )
+                if user_id is not None:
+                    stmt = stmt.where(Knowledge.user_id == user_id)
+                result = await db.execute(stmt)
+                batch = [self._to_model(k) for k in result.scalars().all()]
+
+            if not batch:
+                return
+            yield batch
+            last_id = batch[-1].id
+
+    async def stream(self, user_id: int, batch_size: int = 500):
+        """
+        Yield all of the user's entries in id order from one server-side cursor.
+        Rows are fetched batch_size at a time, so memory stays flat however
+        many entries the user has.
+        """
+        async with get_db(read_only=True) as db:
+            result = await db.stream(
                 select(Knowledge)
-                .join(KnowledgeTag, Knowledge.id == KnowledgeTag.knowledge_id)
-                .join(Tag, Tag.id == KnowledgeTag.tag_id)
                 .options(
                     selectinload(Knowledge.topic),
                     selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
                 )
-                .where(Tag.normalized_name == normalized, Knowledge.user_id == user_id)
+                .where(Knowledge.user_id == user_id)
+                .order_by(Knowledge.id.asc())
+                .execution_options(yield_per=batch_size)
             )
-            knowledges = result.scalars().all()
-            return [self._to_model(k) for k in knowledges]
+            async for partition in result.scalars().partitions():
+                for knowledge in partition:
+                    yield self._to_model(knowledge)
 
     async def update(
         self,
         user_id: int,
         knowledge_id: int,
         form: KnowledgeUpdate,
-        override_updated_at: datetime | None = None,
+        index: bool = True,
     ) -> KnowledgeModel | None:
         async with get_db() as db:
             result = await db.execute(
@@ -344,24 +943,32 @@ class KnowledgeTable:
 
             try:
                 if "topic" in update_data:
-                    topic = await self._get_or_create_topic(db, user_id, update_data.pop("topic"))
+                    raw_topic = update_data.pop("topic")
+                    topics = await self._get_or_create_topics(db, user_id, [raw_topic])
+                    topic = topics[self._topic_key(raw_topic)]
                     knowledge.topic_id = topic.id
                     knowledge.topic = topic
 
                 if "tags" in update_data:
-                    tags = update_data.pop("tags") or []
-                    knowledge.knowledge_tags.clear()
-                    tag_names = unique_labels(tags)
-                    for raw_tag in tag_names:
-                        tag = await self._get_or_create_tag(db, user_id, raw_tag)
-                        knowledge.knowledge_tags.append(
-                            KnowledgeTag(knowledge_id=knowledge.id, tag_id=tag.id, user_id=user_id)
-                        )
+                    tag_names = unique_labels(update_data.pop("tags") or [])
+                    tags = await self._get_or_create_tags(db, user_id, tag_names)
+                    # Unchanged tags keep their rows; dropped ones are deleted as orphans.
+                    current = {kt.tag_id: kt for kt in knowledge.knowledge_tags}
+                    tag_ids = [tags[normalize_tag(name)].id for name in tag_names]
+                    knowledge.knowledge_tags = [
+                        current.get(tag_id) or KnowledgeTag(knowledge_id=knowledge.id, tag_id=tag_id, user_id=user_id)
+                        for tag_id in tag_ids
+                    ]
 
                 for key, value in update_data.items():
                     setattr(knowledge, key, value)
 
-                knowledge.updated_at = override_updated_at or datetime.now(timezone.utc)
+                knowledge.updated_at = datetime.now(timezone.utc)
+                if index:
+                    knowledge.index_status = IndexStatus.PENDING.value
+                    db.add(outbox_row(user_id, knowledge.id, OutboxOp.INDEX))
+                else:
+                    knowledge.index_status = IndexStatus.DISABLED.value
 
                 await db.commit()
             except IntegrityError:
@@ -370,10 +977,11 @@ class KnowledgeTable:
             except Exception:
                 await db.rollback()
                 raise
+            await invalidate_results(user_id)
             await db.refresh(knowledge)
             return self._to_model(knowledge)
 
-    async def delete(self, user_id: int, knowledge_id: int) -> bool:
+    async def delete(self, user_id: int, knowledge_id: int, index: bool = True) -> bool:
         async with get_db() as db:
             result = await db.execute(
                 select(Knowledge).where(Knowledge.id == knowledge_id, Knowledge.user_id == user_id)
@@ -384,34 +992,29 @@ class KnowledgeTable:
                 return False
 
             await db.delete(knowledge)
+            if index:
+                db.add(outbox_row(user_id, knowledge_id, OutboxOp.DELETE))
             await db.commit()
+            await invalidate_results(user_id)
             return True
 
-    async def restore(self, knowledge: KnowledgeModel) -> KnowledgeModel:
+    async def delete_many(self, user_id: int, knowledge_ids: list[int], index: bool = True) -> int:
+        if not knowledge_ids:
+            return 0
+
         async with get_db() as db:
-            topic = await self._get_or_create_topic(db, knowledge.user_id, knowledge.topic)
-            restored = Knowledge(
-                id=knowledge.id,
-                user_id=knowledge.user_id,
-                topic_id=topic.id,
-                title=knowledge.title,
-                content=knowledge.content,
-                created_at=knowledge.created_at,
-                updated_at=knowledge.updated_at,
+            result = await db.execute(
+                delete(Knowledge)
+                .where(Knowledge.id.in_(knowledge_ids), Knowledge.user_id == user_id)
+                .returning(Knowledge.id)
             )
-            restored.topic = topic
-
-            db.add(restored)
-            await db.flush()
-            tag_names = unique_labels(knowledge.tags)
-            for raw_tag in tag_names:
-                tag = await self._get_or_create_tag(db, knowledge.user_id, raw_tag)
-                restored.knowledge_tags.append(
-                    KnowledgeTag(knowledge_id=restored.id, tag_id=tag.id, user_id=knowledge.user_id)
-                )
+            deleted = list(result.scalars().all())
+            if index:
+                db.add_all([outbox_row(user_id, kid, OutboxOp.DELETE) for kid in deleted])
             await db.commit()
-            await db.refresh(restored)
-            return self._to_model(restored)
+            if deleted:
+                await invalidate_results(user_id)
+            return len(deleted)
 
 
 Knowledges = KnowledgeTable()
@@ -0,0 +1,214 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+
+from pydantic import BaseModel, Field
+from sqlalchemy import DateTime, Index, Integer, String, Text, delete, select, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from hippobox.core.database import Base, get_db
+from hippobox.core.result_cache import invalidate_results
+
+
+class OutboxOp(str, Enum):
+    INDEX = "index"
+    DELETE = "delete"
+
+
+class KnowledgeOutbox(Base):
+    """
+    Pending vector index work, written in the same transaction as the knowledge change.
+
+    knowledge_id is deliberately not a foreign key: a delete job outlives its row.
+    available_at is NULL once a job has used up its attempts (dead letter).
+    """
+
+    __tablename__ = "knowledge_outbox"
+    __table_args__ = (Index("ix_knowledge_outbox_available", "available_at", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    knowledge_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    op: Mapped[str] = mapped_column(String(16), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=lambda: datetime.now(timezone.utc)
+    )
+    lease_token: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class OutboxJob(BaseModel):
+    id: int = Field(..., description="Outbox row identifier")
+    user_id: int = Field(..., description="Owner's user identifier")
+    knowledge_id: int = Field(..., description="Knowledge entry to index or remove")
+    op: OutboxOp = Field(..., description="Index operation")
+    attempts: int = Field(0, description="Failed attempts so far")
+
+    class Config:
+        from_attributes = True
+
+
+def outbox_row(user_id: int, knowledge_id: int, op: OutboxOp) -> KnowledgeOutbox:
+    """
+    Build an outbox row to add to the session that writes the knowledge change.
+    """
+    return KnowledgeOutbox(
+        user_id=user_id,
+        knowledge_id=knowledge_id,
+        op=op.value,
+        attempts=0,
+        available_at=datetime.now(timezone.utc),
+    )
+
+
+class OutboxTable:
+    async def claim(self, limit: int, lease_seconds: float) -> list[OutboxJob]:
+        """
+        Lease up to limit due jobs, oldest first.
+
+        Claimed rows get a lease token and are hidden until the lease expires,
+        so several workers (or a worker that crashed mid-batch) never lose or
+        double-own a job for longer than lease_seconds.
+        """
+        now = datetime.now(timezone.utc)
+        token = str(uuid.uuid4())
+        async with get_db() as db:
+            result = await db.execute(
+                select(KnowledgeOutbox.id)
+                .where(KnowledgeOutbox.available_at <= now)
+                .order_by(KnowledgeOutbox.available_at, KnowledgeOutbox.id)
+                .limit(limit)
+            )
+            ids = list(result.scalars().all())
+            if not ids:
+                return []
+
+            await db.execute(
+                update(KnowledgeOutbox)
+                .where(KnowledgeOutbox.id.in_(ids), KnowledgeOutbox.available_at <= now)
+                .values(lease_token=token, available_at=now + timedelta(seconds=lease_seconds))
+            )
+            await db.commit()
+
+            result = await db.execute(
+                select(KnowledgeOutbox).where(KnowledgeOutbox.lease_token == token).order_by(KnowledgeOutbox.id)
+            )
+            return [OutboxJob.model_validate(row) for row in result.scalars().all()]
+
+    async def retry(self, jobs: list[OutboxJob], error: str, max_attempts: int, backoff: float, backoff_max: float):
+        """
+        Record a failed attempt and reschedule with exponential backoff.
+        Jobs that reach max_attempts are parked (available_at NULL).
+
+        ### Returns:
+
+            Knowledge ids whose jobs were parked.
+        """
+        now = datetime.now(timezone.utc)
+        parked: list[int] = []
+        async with get_db() as db:
+            for job in jobs:
+                attempts = job.attempts + 1
+                if attempts >= max_attempts:
+                    available_at = None
+                    parked.append(job.knowledge_id)
+                else:
+                    available_at = now + timedelta(seconds=min(backoff_max, backoff * 2 ** (attempts - 1)))
+                await db.execute(
+                    update(KnowledgeOutbox)
+                    .where(KnowledgeOutbox.id == job.id)
+                    .values(
+                        attempts=attempts,
+                        available_at=available_at,
+                        lease_token=None,
+                        last_error=error[:2000],
+                    )
+                )
+            await db.commit()
+        return parked
+
+    async def _finish(self, jobs_done, knowledge_ids: list[int]):
+        from hippobox.models.knowledge import IndexStatus, Knowledge
+
+        user_ids: list[int] = []
+        async with get_db() as db:
+            if jobs_done is not None:
+                await db.execute(delete(KnowledgeOutbox).where(jobs_done))
+            if knowledge_ids:
+                result = await db.execute(select(Knowledge.user_id).where(Knowledge.id.in_(knowledge_ids)).distinct())
+                user_ids = list(result.scalars().all())
+                # A successful index supersedes jobs of the same entries that were parked earlier.
+                await db.execute(
+                    delete(KnowledgeOutbox).where(
+                        KnowledgeOutbox.knowledge_id.in_(knowledge_ids), KnowledgeOutbox.available_at.is_(None)
+                    )
+                )
+                # updated_at is passed through: index bookkeeping is not an edit of the entry.
+                queued = select(KnowledgeOutbox.id).where(KnowledgeOutbox.knowledge_id == Knowledge.id).exists()
+                await db.execute(
+                    update(Knowledge)
+                    .where(Knowledge.id.in_(knowledge_ids), ~queued)
+                    .values(index_status=IndexStatus.INDEXED.value, updated_at=Knowledge.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+        # Vector results change once the new points are written.
+        await invalidate_results(*user_ids)
+
+    async def complete(self, jobs: list[OutboxJob]):
+        """
+        Remove finished jobs and mark their entries indexed, unless newer work
+        for an entry was queued meanwhile (it stays pending until that runs).
+        """
+        if not jobs:
+            return
+        knowledge_ids = list({job.knowledge_id for job in jobs if job.op == OutboxOp.INDEX})
+        await self._finish(KnowledgeOutbox.id.in_([job.id for job in jobs]), knowledge_ids)
+
+    async def complete_entries(self, knowledge_ids: list[int]):
+        """
+        Finish the index jobs of entries that were indexed outside the worker.
+        """
+        if not knowledge_ids:
+            return
+        await self._finish(
+            KnowledgeOutbox.knowledge_id.in_(knowledge_ids) & (KnowledgeOutbox.op == OutboxOp.INDEX.value),
+            knowledge_ids,
+        )
+
+    async def mark_indexed(self, knowledge_ids: list[int]):
+        """
+        Mark entries indexed after a reindex wrote them, leaving entries with queued work pending.
+        """
+        if not knowledge_ids:
+            return
+        await self._finish(None, knowledge_ids)
+
+    async def drop(self, job_ids: list[int]):
+        if not job_ids:
+            return
+        async with get_db() as db:
+            await db.execute(delete(KnowledgeOutbox).where(KnowledgeOutbox.id.in_(job_ids)))
+            await db.commit()
+
+    async def mark_failed(self, knowledge_ids: list[int]):
+        from hippobox.models.knowledge import IndexStatus, Knowledge
+
+        if not knowledge_ids:
+            return
+        async with get_db() as db:
+            result = await db.execute(
+                update(Knowledge)
+                .where(Knowledge.id.in_(knowledge_ids))
+                .values(index_status=IndexStatus.FAILED.value, updated_at=Knowledge.updated_at)
+                .returning(Knowledge.user_id)
+                .execution_options(synchronize_session=False)
+            )
+            user_ids = set(result.scalars().all())
+            await db.commit()
+        await invalidate_results(*user_ids)
+
+
+Outbox = OutboxTable()
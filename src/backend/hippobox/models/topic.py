@@ -9,6 +9,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from hippobox.core.database import Base, get_db
+from hippobox.core.result_cache import invalidate_results
+from hippobox.models.outbox import OutboxOp, outbox_row
 from hippobox.utils.knowledge_labels import DEFAULT_TOPIC_NAME, DEFAULT_TOPIC_NORMALIZED, clean_label, normalize_label
 
 # for sqlalchemy type checking
@@ -60,13 +62,24 @@ class TopicTable:
         )
 
     async def get(self, user_id: int, topic_id: int) -> TopicResponse | None:
-        async with get_db() as db:
+        async with get_db(read_only=True) as db:
             result = await db.execute(select(Topic).where(Topic.id == topic_id, Topic.user_id == user_id))
             topic = result.scalar_one_or_none()
             return self._to_model(topic) if topic else None
 
+    async def get_by_name(self, user_id: int, name: str) -> TopicResponse | None:
+        async with get_db(read_only=True) as db:
+            result = await db.execute(
+                select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == normalize_label(name))
+            )
+            topic = result.scalar_one_or_none()
+            return self._to_model(topic) if topic else None
+
+    async def get_default(self, user_id: int) -> TopicResponse | None:
+        return await self.get_by_name(user_id, DEFAULT_TOPIC_NORMALIZED)
+
     async def list(self, user_id: int) -> list[TopicResponse]:
-        async with get_db() as db:
+        async with get_db(read_only=True) as db:
             result = await db.execute(
                 select(Topic).where(Topic.user_id == user_id).order_by(Topic.normalized_name.asc())
             )
@@ -107,10 +120,17 @@ class TopicTable:
             except IntegrityError:
                 await db.rollback()
                 raise
+            # Searches filter by topic name and return it in every result.
+            await invalidate_results(user_id)
             await db.refresh(topic)
             return self._to_model(topic)
 
-    async def delete(self, user_id: int, topic_id: int) -> bool:
+    async def delete(self, user_id: int, topic_id: int, index: bool = True) -> bool:
+        """
+        Delete a topic, moving its entries to the default topic. With index,
+        the moved entries are queued for reindexing in the same transaction
+        so their topic_id filter field follows.
+        """
         async with get_db() as db:
             result = await db.execute(select(Topic).where(Topic.id == topic_id, Topic.user_id == user_id))
             topic = result.scalar_one_or_none()
@@ -132,16 +152,25 @@ class TopicTable:
                 await db.flush()
 
             if topic.id != default_topic.id:
-                from hippobox.models.knowledge import Knowledge
+                from hippobox.models.knowledge import IndexStatus, Knowledge
 
-                await db.execute(
+                values = {
+                    "topic_id": default_topic.id,
+                    "index_status": IndexStatus.PENDING.value if index else IndexStatus.DISABLED.value,
+                }
+                result = await db.execute(
                     update(Knowledge)
                     .where(Knowledge.user_id == user_id, Knowledge.topic_id == topic.id)
-                    .values(topic_id=default_topic.id)
+                    .values(**values)
+                    .returning(Knowledge.id)
                 )
+                moved = list(result.scalars().all())
+                if index:
+                    db.add_all([outbox_row(user_id, kid, OutboxOp.INDEX) for kid in moved])
 
             await db.delete(topic)
             await db.commit()
+            await invalidate_results(user_id)
             return True
 
 
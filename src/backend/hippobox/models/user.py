@@ -8,6 +8,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Mapped, mapped_column
 
 from hippobox.core.database import Base, get_db
+from hippobox.core.principal_cache import ADMIN_CACHE_KEY, Principals, user_cache_key
 from hippobox.core.validation import (
     EMAIL_REGEX,
     NAME_MAX_LENGTH,
@@ -296,6 +297,7 @@ class UserTable:
 
             await db.commit()
             await db.refresh(user)
+            await Principals.invalidate(user_cache_key(user_id), ADMIN_CACHE_KEY)
             return UserModel.model_validate(user)
 
     async def update_profile(self, user_id: int, name: str) -> UserModel | None:
@@ -324,6 +326,7 @@ class UserTable:
                 raise AuthException(AuthErrorCode.CREATE_FAILED, str(e))
 
             await db.refresh(user)
+            await Principals.invalidate(user_cache_key(user_id), ADMIN_CACHE_KEY)
             return UserModel.model_validate(user)
 
     async def delete(self, user_id: int) -> bool:
@@ -335,6 +338,7 @@ class UserTable:
 
             await db.delete(user)
             await db.commit()
+            await Principals.invalidate(user_cache_key(user_id), ADMIN_CACHE_KEY)
             return True
 
 
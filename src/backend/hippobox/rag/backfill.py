@@ -0,0 +1,76 @@
+import logging
+
+from hippobox.core.settings import SETTINGS
+from hippobox.models.knowledge import KnowledgeModel, Knowledges
+from hippobox.rag.qdrant import Qdrant
+from hippobox.utils.preprocess import CHUNK_FIELDS, build_metadata, chunk_snippet
+
+log = logging.getLogger("qdrant")
+
+
+def _rewritten(point, knowledge: KnowledgeModel) -> dict:
+    stored = point.payload.get("metadata") or {}
+    metadata = build_metadata(knowledge)
+    # Points written before chunking embed the whole entry as its only chunk.
+    metadata.update({"chunk_index": 0, "chunk_count": 1})
+    metadata.update({field: stored[field] for field in CHUNK_FIELDS if field in stored})
+    text = point.payload.get("text")
+    snippet = chunk_snippet(text) if text else point.payload.get("snippet")
+    return {"id": point.id, "metadata": metadata, "snippet": snippet}
+
+
+async def backfill_knowledge_payload(qdrant: Qdrant, batch_size: int = 500) -> dict:
+    """
+    Rewrite existing points to the current payload schema.
+
+    Ensures the payload indexes exist on the knowledge collection, then
+    replaces the payload of every point of each entry with metadata built
+    from its SQL row (ids, owner, topic/tag ids, timestamps) plus the stored
+    chunk fields. Chunk points are found by their knowledge_id; points
+    written before payload filtering and chunking carry no knowledge_id and
+    are found by their id, which is the entry's id, and become the entry's
+    single chunk. Full-text payloads and the title / topic / tag names of
+    older versions are dropped; with QDRANT_PAYLOAD_SNIPPET_CHARS the
+    snippet is cut from the old text. Vectors are kept, so search works
+    right away; `hippobox reindex` later re-embeds legacy points per chunk
+    and embeds the entries counted as missing.
+    """
+    stats = {"updated": 0, "missing": 0}
+
+    if not await qdrant.has_collection("knowledge"):
+        log.info("Knowledge collection does not exist; nothing to backfill")
+        return stats
+
+    await qdrant.create_payload_indexes("knowledge")
+
+    with_payload = ["metadata", "snippet", "text"] if SETTINGS.QDRANT_PAYLOAD_SNIPPET_CHARS > 0 else ["metadata"]
+    async for batch in Knowledges.iter_batches(batch_size):
+        by_id = {k.id: k for k in batch}
+        found: set[int] = set()
+        seen = set()
+
+        pages = qdrant.iter_points("knowledge", {"knowledge_id": list(by_id)}, with_payload=with_payload)
+        async for page in pages:
+            items = []
+            for point in page:
+                knowledge = by_id.get((point.payload.get("metadata") or {}).get("knowledge_id"))
+                if knowledge is None:
+                    continue
+                items.append(_rewritten(point, knowledge))
+                found.add(knowledge.id)
+                seen.add(point.id)
+            if items:
+                await qdrant.batch_overwrite_payload("knowledge", items)
+                stats["updated"] += len(items)
+
+        legacy = await qdrant.retrieve("knowledge", list(by_id), with_payload=with_payload)
+        items = [_rewritten(point, by_id[point.id]) for point in legacy if point.id not in seen]
+        if items:
+            await qdrant.batch_overwrite_payload("knowledge", items)
+            stats["updated"] += len(items)
+            found.update(item["id"] for item in items)
+
+        stats["missing"] += len(by_id) - len(found)
+        log.info(f"Rewrote payload of {stats['updated']} points ({stats['missing']} entries missing)")
+
+    return stats
@@ -0,0 +1,143 @@
+import hashlib
+import logging
+import re
+from functools import lru_cache
+
+from pydantic import BaseModel, Field
+
+log = logging.getLogger("embedding")
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*\S)\s*$")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+WORD_RE = re.compile(r"\S+\s*")
+
+
+class Chunk(BaseModel):
+    index: int = Field(..., description="Position of the chunk within the document")
+    heading: str = Field("", description="Markdown heading path the chunk belongs to")
+    text: str = Field(..., description="Text that is embedded for this chunk")
+    hash: str = Field(..., description="sha256 of the chunk text")
+
+
+class _Tokenizer:
+    """
+    Token counting used to size chunks.
+
+    Uses tiktoken when it is installed and its encoding is available, otherwise
+    falls back to whitespace-delimited words, which over-counts slightly
+    relative to BPE tokens and therefore stays under the model limit.
+    """
+
+    def __init__(self):
+        self.encoding = None
+        try:
+            import tiktoken
+
+            self.encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            log.info(f"tiktoken unavailable, chunking by words: {e}")
+
+    def encode(self, text: str) -> list:
+        if self.encoding is not None:
+            return self.encoding.encode(text)
+        return WORD_RE.findall(text)
+
+    def decode(self, tokens: list) -> str:
+        if self.encoding is not None:
+            return self.encoding.decode(tokens)
+        return "".join(tokens)
+
+
+@lru_cache(maxsize=1)
+def get_tokenizer() -> _Tokenizer:
+    return _Tokenizer()
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def split_sections(content: str) -> list[tuple[str, str]]:
+    """
+    Split markdown into (heading path, section text) pairs.
+    Headings inside fenced code blocks are ignored.
+    """
+    sections: list[tuple[str, str]] = []
+    stack: list[tuple[int, str]] = []
+    lines: list[str] = []
+    in_fence = False
+
+    def flush():
+        text = "\n".join(lines).strip()
+        if text:
+            sections.append((" > ".join(title for _, title in stack), text))
+        lines.clear()
+
+    for line in content.splitlines():
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line)
+        if match:
+            flush()
+            level = len(match.group(1))
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, match.group(2)))
+        lines.append(line)
+    flush()
+
+    return sections
+
+
+def chunk_markdown(content: str, max_tokens: int, overlap: int) -> list[Chunk]:
+    """
+    Split content into embedding-sized chunks.
+
+    Consecutive small sections are packed together up to max_tokens; a section
+    larger than that is cut into token windows that overlap by `overlap`
+    tokens, each prefixed with its heading path for context.
+    """
+    if not 0 <= overlap < max_tokens:
+        # A step of (nearly) one token would embed a near-copy of the section per token.
+        raise ValueError(f"Chunk overlap {overlap} must be at least 0 and below max_tokens {max_tokens}")
+    tokenizer = get_tokenizer()
+    step = max_tokens - overlap
+    pieces: list[tuple[str, str]] = []
+
+    buffer: list[str] = []
+    buffer_heading = ""
+    buffer_tokens = 0
+
+    def flush_buffer():
+        nonlocal buffer_tokens
+        if buffer:
+            pieces.append((buffer_heading, "\n\n".join(buffer)))
+        buffer.clear()
+        buffer_tokens = 0
+
+    for heading, text in split_sections(content):
+        tokens = tokenizer.encode(text)
+
+        if len(tokens) > max_tokens:
+            flush_buffer()
+            for start in range(0, len(tokens), step):
+                window = tokenizer.decode(tokens[start : start + max_tokens]).strip()
+                if start > 0 and heading:
+                    window = f"{heading}\n\n{window}"
+                pieces.append((heading, window))
+                if start + max_tokens >= len(tokens):
+                    break
+            continue
+
+        if buffer and buffer_tokens + len(tokens) > max_tokens:
+            flush_buffer()
+        if not buffer:
+            buffer_heading = heading
+        buffer.append(text)
+        buffer_tokens += len(tokens)
+
+    flush_buffer()
+
+    return [
+        Chunk(index=i, heading=heading, text=text, hash=hash_text(text)) for i, (heading, text) in enumerate(pieces)
+    ]
@@ -1,37 +1,68 @@
-from openai import OpenAI
+import asyncio
+import logging
 
+from hippobox.core.metrics import EMBEDDING_REQUEST_SECONDS, EMBEDDING_TEXTS, observe
 from hippobox.core.settings import SETTINGS
+from hippobox.rag.embedding_cache import EmbeddingCache
+from hippobox.rag.embedding_providers import EmbeddingProvider, get_embedding_provider
+
+log = logging.getLogger("embedding")
 
 
 class Embedding:
-    def __init__(self):
-        self.client = OpenAI(api_key=SETTINGS.OPENAI_API_KEY)
-        self.model = SETTINGS.EMBEDDING_MODEL
+    def __init__(self, provider: EmbeddingProvider | None = None):
+        # The provider comes from EMBEDDING_PROVIDER (openai | local).
+        self.provider = provider or get_embedding_provider()
+        self.model = self.provider.model
+        self.dimension = self.provider.dimension
+        self.batch_size = max(1, SETTINGS.EMBEDDING_BATCH_SIZE)
+
+        self.cache = None
+        if SETTINGS.EMBEDDING_CACHE_ENABLED:
+            self.cache = EmbeddingCache(
+                f"{self.provider.name}:{self.model}:{self.dimension}",
+                max_entries=SETTINGS.EMBEDDING_CACHE_MAX_ENTRIES,
+                ttl=SETTINGS.EMBEDDING_CACHE_TTL,
+                use_redis=SETTINGS.EMBEDDING_CACHE_REDIS,
+            )
+        log.info(f"Embedding provider {self.provider.name}: {self.model} ({self.dimension} dims)")
+
+    async def _request(self, texts: list[str]) -> list[list[float]]:
+        EMBEDDING_TEXTS.labels(provider=self.provider.name).inc(len(texts))
+        with observe(EMBEDDING_REQUEST_SECONDS, provider=self.provider.name):
+            return await self.provider.embed_texts(texts)
+
+    async def _request_batched(self, texts: list[str]) -> list[list[float]]:
+        # Split into provider-sized requests; the provider bounds how many run at once.
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        results = await asyncio.gather(*(self._request(batch) for batch in batches))
+        return [vector for batch in results for vector in batch]
+
+    async def _embed_cached(self, texts: list[str]) -> list[list[float]]:
+        if self.cache is None:
+            return await self._request_batched(texts)
 
-    def embed(self, text: str) -> list[float]:
+        vectors = await self.cache.get_many(texts)
+        missing = list(dict.fromkeys(text for i, text in enumerate(texts) if i not in vectors))
+        if missing:
+            embedded = dict(zip(missing, await self._request_batched(missing)))
+            await self.cache.set_many(missing, [embedded[text] for text in missing])
+            vectors.update({i: embedded[text] for i, text in enumerate(texts) if i not in vectors})
+
+        return [vectors[i] for i in range(len(texts))]
+
+    async def embed(self, text: str) -> list[float]:
         if not text or not isinstance(text, str):
             raise ValueError("Text input must be a non-empty string.")
 
-        try:
-            response = self.client.embeddings.create(
-                model=self.model,
-                input=text,
-            )
-            return response.data[0].embedding
+        return (await self._embed_cached([text]))[0]
 
-        except Exception:
-            raise
-
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         if not texts or not isinstance(texts, list):
             raise ValueError("Input must be a non-empty list of strings.")
 
-        try:
-            response = self.client.embeddings.create(
-                model=self.model,
-                input=texts,
-            )
-            return [item.embedding for item in response.data]
+        return await self._embed_cached(texts)
 
-        except Exception:
-            raise
+    async def close(self):
+        await self.provider.close()
+        log.info("Embedding client closed")
@@ -0,0 +1,131 @@
+import base64
+import hashlib
+import logging
+import time
+from array import array
+from collections import OrderedDict
+
+from hippobox.core.metrics import CACHE_LOOKUPS
+from hippobox.core.redis import RedisManager
+
+log = logging.getLogger("embedding")
+
+
+def _encode_vector(vector: list[float]) -> str:
+    return base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+
+
+def _decode_vector(value: str) -> list[float]:
+    return array("f", base64.b64decode(value)).tolist()
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache keyed by (model, sha256(text)).
+
+    The first tier is an in-process LRU bounded by max_entries; the optional
+    second tier is Redis (via RedisManager) so workers share vectors. Both
+    tiers honour ttl seconds (0 disables expiry). Redis errors are logged and
+    treated as misses.
+    """
+
+    def __init__(self, model: str, max_entries: int, ttl: int, use_redis: bool):
+        self.model = model
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.use_redis = use_redis
+        self._entries: OrderedDict[str, tuple[float | None, list[float]]] = OrderedDict()
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"emb:{self.model}:{digest}"
+
+    def _get_local(self, key: str) -> list[float] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, vector = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return vector
+
+    def _set_local(self, key: str, vector: list[float]):
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else None
+        self._entries[key] = (expires_at, vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_many(self, texts: list[str]) -> dict[int, list[float]]:
+        """
+        Return cached vectors by position in texts.
+        """
+        found: dict[int, list[float]] = {}
+        pending: dict[str, list[int]] = {}
+
+        for i, text in enumerate(texts):
+            key = self._key(text)
+            vector = self._get_local(key)
+            if vector is not None:
+                found[i] = vector
+                self.hits += 1
+                CACHE_LOOKUPS.labels(cache="embedding", result="hit").inc()
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if pending and self.use_redis:
+            keys = list(pending)
+            try:
+                redis = await RedisManager.get_client()
+                values = await redis.mget(keys)
+            except Exception as e:
+                log.warning(f"Embedding cache Redis lookup failed: {e}")
+                values = [None] * len(keys)
+
+            for key, value in zip(keys, values):
+                if value is None:
+                    continue
+                vector = _decode_vector(value)
+                self._set_local(key, vector)
+                for i in pending.pop(key):
+                    found[i] = vector
+                    self.redis_hits += 1
+                    CACHE_LOOKUPS.labels(cache="embedding", result="redis_hit").inc()
+
+        missed = sum(len(positions) for positions in pending.values())
+        self.misses += missed
+        CACHE_LOOKUPS.labels(cache="embedding", result="miss").inc(missed)
+        return found
+
+    async def set_many(self, texts: list[str], vectors: list[list[float]]):
+        keyed = {self._key(text): vector for text, vector in zip(texts, vectors)}
+        for key, vector in keyed.items():
+            self._set_local(key, vector)
+
+        if not self.use_redis or not keyed:
+            return
+
+        try:
+            redis = await RedisManager.get_client()
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, vector in keyed.items():
+                    pipe.set(key, _encode_vector(vector), ex=self.ttl if self.ttl > 0 else None)
+                await pipe.execute()
+        except Exception as e:
+            log.warning(f"Embedding cache Redis write failed: {e}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from openai import AsyncOpenAI
+
+from hippobox.core.metrics import EMBEDDING_TOKENS
+from hippobox.core.settings import SETTINGS
+
+log = logging.getLogger("embedding")
+
+# Native output sizes of the OpenAI embedding models; EMBEDDING_DIMENSION overrides them.
+OPENAI_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
+
+class EmbeddingProvider(ABC):
+    """
+    Turns one batch of texts into vectors.
+
+    Caching, validation and splitting into EMBEDDING_BATCH_SIZE batches are
+    done by Embedding; a provider only knows its model, the size of the
+    vectors it returns and how to embed a single batch.
+    """
+
+    name: str = ""
+    model: str = ""
+    dimension: int = 0
+
+    @abstractmethod
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Vectors of one batch of texts, in order, each of self.dimension floats.
+        """
+
+    async def close(self):
+        pass
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    name = "openai"
+
+    def __init__(self):
+        self.model = SETTINGS.EMBEDDING_MODEL
+        self.dimension = SETTINGS.EMBEDDING_DIMENSION or OPENAI_DIMENSIONS.get(self.model, 0)
+        if not self.dimension:
+            raise ValueError(f"Unknown dimension for embedding model {self.model}; set EMBEDDING_DIMENSION")
+        # Only the text-embedding-3 models accept a reduced output size; other
+        # (OpenAI-compatible) models just declare theirs through EMBEDDING_DIMENSION.
+        shortened = self.model.startswith("text-embedding-3") and self.dimension != OPENAI_DIMENSIONS.get(self.model)
+        self.request_dimension = self.dimension if shortened else None
+
+        # A single pooled HTTP client is reused for every call so that requests
+        # share keep-alive connections instead of re-handshaking per embedding.
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=SETTINGS.EMBEDDING_MAX_CONCURRENCY,
+                max_keepalive_connections=SETTINGS.EMBEDDING_MAX_CONCURRENCY,
+            ),
+            timeout=SETTINGS.EMBEDDING_TIMEOUT,
+        )
+        self.client = AsyncOpenAI(
+            api_key=SETTINGS.OPENAI_API_KEY,
+            base_url=SETTINGS.OPENAI_BASE_URL,
+            timeout=SETTINGS.EMBEDDING_TIMEOUT,
+            max_retries=SETTINGS.EMBEDDING_MAX_RETRIES,
+            http_client=self.http_client,
+        )
+        self.semaphore = asyncio.Semaphore(SETTINGS.EMBEDDING_MAX_CONCURRENCY)
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        kwargs = {"dimensions": self.request_dimension} if self.request_dimension else {}
+        async with self.semaphore:
+            response = await self.client.embeddings.create(model=self.model, input=texts, **kwargs)
+        if response.usage is not None:
+            EMBEDDING_TOKENS.labels(provider=self.name).inc(response.usage.total_tokens)
+        return [item.embedding for item in response.data]
+
+    async def close(self):
+        await self.client.close()
+
+
+_local_models: dict[tuple[str, str], object] = {}
+_local_models_lock = threading.Lock()
+
+
+def _load_local_model(model: str, backend: str):
+    # Loaded once per process and shared by every Embedding instance.
+    with _local_models_lock:
+        key = (model, backend)
+        if key not in _local_models:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise RuntimeError(
+                    "EMBEDDING_PROVIDER=local requires sentence-transformers: pip install 'hippobox[local]'"
+                ) from e
+
+            log.info(f"Loading local embedding model {model} ({backend})")
+            _local_models[key] = SentenceTransformer(
+                model,
+                device="cpu",
+                backend=backend,
+                cache_folder=str(SETTINGS.EMBEDDING_LOCAL_CACHE_DIR) if SETTINGS.EMBEDDING_LOCAL_CACHE_DIR else None,
+            )
+        return _local_models[key]
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """
+    Embeds on the CPU with a sentence-transformers model (torch or ONNX).
+
+    Inference runs in a thread pool of EMBEDDING_LOCAL_THREADS workers; the
+    model releases the GIL while encoding, so batches run in parallel without
+    blocking the event loop.
+    """
+
+    name = "local"
+
+    def __init__(self):
+        self.model = SETTINGS.EMBEDDING_MODEL
+        self.backend = SETTINGS.EMBEDDING_LOCAL_BACKEND
+        self._model = _load_local_model(self.model, self.backend)
+        self.dimension = self._model.get_sentence_embedding_dimension()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, SETTINGS.EMBEDDING_LOCAL_THREADS),
+            thread_name_prefix="embedding",
+        )
+
+    def _encode(self, texts: list[str]) -> list[list[float]]:
+        vectors = self._model.encode(
+            texts,
+            batch_size=len(texts),
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._encode, texts)
+
+    async def close(self):
+        self.executor.shutdown(wait=True)
+
+
+PROVIDERS: dict[str, type[EmbeddingProvider]] = {
+    OpenAIEmbeddingProvider.name: OpenAIEmbeddingProvider,
+    LocalEmbeddingProvider.name: LocalEmbeddingProvider,
+}
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    name = SETTINGS.EMBEDDING_PROVIDER.lower()
+    if name not in PROVIDERS:
+        raise ValueError(f"Invalid EMBEDDING_PROVIDER: {name}")
+    return PROVIDERS[name]()
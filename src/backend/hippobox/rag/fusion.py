@@ -0,0 +1,15 @@
+def reciprocal_rank_fusion(rankings: list[list[int]], weights: list[float], k: int = 60) -> list[int]:
+    """
+    Merge ranked id lists with weighted reciprocal rank fusion.
+
+    Each list contributes weight / (k + rank) for every id it contains, so an
+    id ranked well by several retrievers beats one ranked first by only one.
+    """
+    scores: dict[int, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        if weight <= 0:
+            continue
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + weight / (k + rank)
+
+    return sorted(scores, key=lambda item_id: scores[item_id], reverse=True)
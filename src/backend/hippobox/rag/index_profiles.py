@@ -0,0 +1,120 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+from qdrant_client.models import models
+
+
+class IndexProfile(BaseModel):
+    """
+    How a collection stores and indexes its vectors, and how it is searched.
+
+    Storage settings (on_disk, m, ef_construct, quantization) are applied
+    when a collection is created and pushed to existing collections with
+    update_collection; search settings (hnsw_ef, exact, rescore,
+    oversampling) are sent with every query.
+    """
+
+    name: str
+    on_disk: bool = Field(True, description="Keep the original vectors on disk (memory-mapped) instead of in RAM")
+    m: int = Field(16, description="HNSW edges per node; more improves recall and costs memory")
+    ef_construct: int = Field(100, description="HNSW candidate list while building; more improves graph quality")
+    hnsw_on_disk: bool = Field(False, description="Keep the HNSW graph on disk")
+    quantization: Literal["scalar", "binary"] | None = Field(None, description="Compressed copy of the vectors")
+    quantized_in_ram: bool = Field(True, description="Pin the quantized vectors in RAM")
+    rescore: bool = Field(True, description="Re-rank quantized candidates with the original vectors")
+    oversampling: float = Field(1.0, description="Candidates fetched per result before rescoring")
+    hnsw_ef: int = Field(128, description="HNSW candidate list at search time; more improves recall")
+    exact: bool = Field(False, description="Search by full scan instead of the HNSW graph")
+
+    def vector_params(self, dim: int, distance: models.Distance) -> models.VectorParams:
+        return models.VectorParams(size=dim, distance=distance, on_disk=self.on_disk)
+
+    def hnsw_config(self) -> models.HnswConfigDiff:
+        return models.HnswConfigDiff(m=self.m, ef_construct=self.ef_construct, on_disk=self.hnsw_on_disk)
+
+    def quantization_config(self) -> models.ScalarQuantization | models.BinaryQuantization | None:
+        if self.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=self.quantized_in_ram,
+                )
+            )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(binary=models.BinaryQuantizationConfig(always_ram=self.quantized_in_ram))
+        return None
+
+    def search_params(self) -> models.SearchParams:
+        quantization = None
+        if self.quantization is not None:
+            quantization = models.QuantizationSearchParams(rescore=self.rescore, oversampling=self.oversampling)
+        return models.SearchParams(hnsw_ef=self.hnsw_ef, exact=self.exact, quantization=quantization)
+
+    def matches(self, config: models.CollectionConfig) -> bool:
+        """
+        Whether a collection's stored configuration already follows this profile.
+        """
+        vectors = config.params.vectors
+        hnsw = config.hnsw_config
+        return (
+            bool(getattr(vectors, "on_disk", False)) == self.on_disk
+            and hnsw.m == self.m
+            and hnsw.ef_construct == self.ef_construct
+            and bool(hnsw.on_disk) == self.hnsw_on_disk
+            and config.quantization_config == self.quantization_config()
+        )
+
+
+PROFILES: dict[str, IndexProfile] = {
+    profile.name: profile
+    for profile in (
+        # Originals and the graph on disk, 1 bit per dimension in RAM; binary
+        # quantization suits the larger (>= 1024 dim) embedding models best.
+        IndexProfile(
+            name="low-memory",
+            on_disk=True,
+            m=16,
+            ef_construct=100,
+            hnsw_on_disk=True,
+            quantization="binary",
+            oversampling=3.0,
+            hnsw_ef=128,
+        ),
+        # Originals on disk, int8 copies (a quarter of the size) in RAM, rescored from disk.
+        IndexProfile(
+            name="balanced",
+            on_disk=True,
+            m=16,
+            ef_construct=128,
+            quantization="scalar",
+            oversampling=1.5,
+            hnsw_ef=128,
+        ),
+        # Everything in RAM with a denser graph; int8 copies speed up the traversal.
+        IndexProfile(
+            name="low-latency",
+            on_disk=False,
+            m=32,
+            ef_construct=256,
+            quantization="scalar",
+            oversampling=2.0,
+            hnsw_ef=96,
+        ),
+    )
+}
+
+
+def get_index_profile(name: str, hnsw_ef: int = 0, exact: bool = False) -> IndexProfile:
+    """
+    Look up a profile by name, with optional search-time overrides.
+    """
+    key = name.lower()
+    if key not in PROFILES:
+        raise ValueError(f"Invalid QDRANT_INDEX_PROFILE: {name} (expected one of {', '.join(PROFILES)})")
+    overrides = {}
+    if hnsw_ef:
+        overrides["hnsw_ef"] = hnsw_ef
+    if exact:
+        overrides["exact"] = True
+    return PROFILES[key].model_copy(update=overrides)
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+
+from hippobox.core.settings import SETTINGS
+from hippobox.models.knowledge import Knowledges
+from hippobox.models.outbox import Outbox, OutboxJob, OutboxOp
+from hippobox.rag.indexing import KnowledgeIndexer
+
+log = logging.getLogger("knowledge")
+
+
+class IndexWorker:
+    """
+    Drains the knowledge outbox into Qdrant.
+
+    Jobs are leased in batches of INDEX_WORKER_BATCH_SIZE; the newest job of
+    an entry decides what happens to it, and the entry is re-read from SQL so
+    a burst of edits is indexed once. A batch is indexed with one embedding
+    pass; if that fails, its entries are retried one by one so a single bad
+    entry does not hold back the rest. Failed jobs back off exponentially and
+    are parked, with the entry marked failed, after INDEX_WORKER_MAX_ATTEMPTS.
+    """
+
+    def __init__(self, indexer: KnowledgeIndexer, batch_size: int | None = None):
+        self.indexer = indexer
+        self.batch_size = max(1, batch_size or SETTINGS.INDEX_WORKER_BATCH_SIZE)
+        self.poll_interval = SETTINGS.INDEX_WORKER_POLL_INTERVAL
+        self.lease_seconds = SETTINGS.INDEX_WORKER_LEASE
+        self.max_attempts = max(1, SETTINGS.INDEX_WORKER_MAX_ATTEMPTS)
+        self.backoff = SETTINGS.INDEX_WORKER_BACKOFF
+        self.backoff_max = SETTINGS.INDEX_WORKER_BACKOFF_MAX
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    async def run_once(self) -> int:
+        """
+        Process one batch of due jobs and return how many were claimed.
+        """
+        jobs = await Outbox.claim(self.batch_size, self.lease_seconds)
+        if not jobs:
+            return 0
+
+        latest: dict[int, OutboxJob] = {}
+        for job in jobs:
+            latest[job.knowledge_id] = job
+        superseded = [job for job in jobs if latest[job.knowledge_id].id != job.id]
+        await Outbox.drop([job.id for job in superseded])
+
+        errors: dict[int, str] = {}
+
+        deletes = [job.knowledge_id for job in latest.values() if job.op == OutboxOp.DELETE]
+        if deletes:
+            try:
+                await self.indexer.delete_many(deletes)
+            except Exception as e:
+                errors.update({kid: str(e) for kid in deletes})
+
+        by_user: dict[int, list[int]] = {}
+        for job in latest.values():
+            if job.op == OutboxOp.INDEX:
+                by_user.setdefault(job.user_id, []).append(job.knowledge_id)
+        # Entries deleted since the job was queued have a delete job of their own.
+        knowledges = [k for user_id, ids in by_user.items() for k in await Knowledges.get_many(user_id, ids)]
+        if knowledges:
+            try:
+                await self.indexer.index_many(knowledges)
+            except Exception as e:
+                log.warning(f"Batch indexing of {len(knowledges)} entries failed, retrying one by one: {e}")
+                for knowledge in knowledges:
+                    try:
+                        await self.indexer.index(knowledge)
+                    except Exception as item_error:
+                        errors[knowledge.id] = str(item_error)
+
+        done = [job for kid, job in latest.items() if kid not in errors]
+        failed = [job for kid, job in latest.items() if kid in errors]
+        await Outbox.complete(done)
+
+        for job in failed:
+            log.warning(
+                f"Index job {job.op.value} id={job.knowledge_id} failed (attempt {job.attempts + 1}): "
+                f"{errors[job.knowledge_id]}"
+            )
+            parked = await Outbox.retry(
+                [job], errors[job.knowledge_id], self.max_attempts, self.backoff, self.backoff_max
+            )
+            if parked:
+                log.error(f"Index job {job.op.value} id={job.knowledge_id} parked after {self.max_attempts} attempts")
+                await Outbox.mark_failed(parked)
+
+        log.info(f"Index worker processed {len(jobs)} jobs ({len(done)} done, {len(failed)} failed)")
+        return len(jobs)
+
+    async def drain(self) -> int:
+        """
+        Process batches until no job is due. Returns the number of jobs claimed.
+        """
+        total = 0
+        while True:
+            claimed = await self.run_once()
+            if not claimed:
+                return total
+            total += claimed
+
+    async def _run(self):
+        # A batch in progress is never cancelled: stop() sets the event and the
+        # loop exits once the current batch is written.
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                log.exception(f"Index worker batch failed: {e}")
+                claimed = 0
+            if claimed:
+                continue
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if self._task is None:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+            log.info("Index worker started")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        log.info("Index worker stopped")
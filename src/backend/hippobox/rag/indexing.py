@@ -0,0 +1,177 @@
+import logging
+import uuid
+
+from hippobox.core.settings import SETTINGS
+from hippobox.models.knowledge import KnowledgeModel
+from hippobox.rag.chunking import Chunk, chunk_markdown, hash_text
+from hippobox.rag.embedding import Embedding
+from hippobox.rag.qdrant import Qdrant
+from hippobox.utils.preprocess import build_chunk_point
+
+log = logging.getLogger("knowledge")
+
+COLLECTION = "knowledge"
+CHUNK_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "hippobox/knowledge-chunk")
+
+
+def chunk_point_id(knowledge_id: int, index: int) -> str:
+    return str(uuid.uuid5(CHUNK_NAMESPACE, f"{knowledge_id}:{index}"))
+
+
+def pool_scores(ids: list, scores: list[list[float]], pooling: str) -> list[int]:
+    """
+    Rank parent knowledge ids from their grouped chunk scores.
+    """
+    if pooling == "sum":
+        pooled = [sum(group) for group in scores]
+    else:
+        pooled = [max(group) if group else 0.0 for group in scores]
+    ranked = sorted(zip(ids, pooled), key=lambda pair: pair[1], reverse=True)
+    return [int(kid) for kid, _ in ranked]
+
+
+class KnowledgeIndexer:
+    """
+    Writes knowledge entries to Qdrant as one point per chunk.
+    """
+
+    def __init__(self, embedding: Embedding, qdrant: Qdrant, collection: str = COLLECTION):
+        if not 0 <= SETTINGS.CHUNK_OVERLAP_TOKENS < SETTINGS.CHUNK_MAX_TOKENS:
+            raise ValueError(
+                f"Invalid CHUNK_OVERLAP_TOKENS: {SETTINGS.CHUNK_OVERLAP_TOKENS} "
+                f"(must be at least 0 and below CHUNK_MAX_TOKENS={SETTINGS.CHUNK_MAX_TOKENS})"
+            )
+        self.embedding = embedding
+        self.qdrant = qdrant
+        self.collection = collection
+
+    async def ensure_collection(self):
+        """
+        Create or verify the collection for the embedding's vectors; see Qdrant.ensure_collection.
+        """
+        await self.qdrant.ensure_collection(self.collection, self.embedding.dimension)
+
+    def chunk(self, knowledge: KnowledgeModel) -> list[Chunk]:
+        chunks = chunk_markdown(knowledge.content, SETTINGS.CHUNK_MAX_TOKENS, SETTINGS.CHUNK_OVERLAP_TOKENS)
+        if not chunks:
+            chunks = [Chunk(index=0, text=knowledge.title, hash=hash_text(knowledge.title))]
+        return chunks
+
+    async def index(self, knowledge: KnowledgeModel, reuse_existing: bool = True) -> dict:
+        return await self.index_many([knowledge], reuse_existing=reuse_existing)
+
+    async def index_many(
+        self,
+        knowledges: list[KnowledgeModel],
+        vectors: dict[str, list[float]] | None = None,
+        reuse_existing: bool = True,
+    ) -> dict:
+        """
+        Upsert the chunk points of a batch of entries.
+
+        Vectors of chunks whose text hash is unchanged are reused from the
+        existing points, or from vectors (chunk hash -> vector, e.g. from an
+        export); only new or edited chunks are embedded, together for the
+        whole batch. Points are written in upserts of QDRANT_UPSERT_BATCH_SIZE,
+        and points left over from a previous, longer version are deleted.
+        """
+        if not knowledges:
+            return {"chunks": 0, "embedded": 0}
+
+        # Vectors of another size (a different model or dimension setting) are re-embedded.
+        dimension = self.embedding.dimension
+        vectors = {h: v for h, v in (vectors or {}).items() if len(v) == dimension}
+        existing = []
+        if reuse_existing and await self.qdrant.has_collection(self.collection):
+            existing = await self.qdrant.scroll_points(
+                self.collection,
+                {"knowledge_id": [k.id for k in knowledges]},
+                with_payload=["metadata"],
+                with_vectors=True,
+            )
+        for point in existing:
+            chunk_hash = (point.payload.get("metadata") or {}).get("chunk_hash")
+            if chunk_hash and point.vector and len(point.vector) == dimension:
+                vectors.setdefault(chunk_hash, point.vector)
+
+        chunked = [(knowledge, self.chunk(knowledge)) for knowledge in knowledges]
+        texts = list({c.hash: c.text for _, chunks in chunked for c in chunks if c.hash not in vectors}.items())
+        if texts:
+            embedded = await self.embedding.embed_batch([text for _, text in texts])
+            vectors.update({chunk_hash: vector for (chunk_hash, _), vector in zip(texts, embedded)})
+
+        items = [
+            build_chunk_point(
+                knowledge,
+                chunk,
+                len(chunks),
+                vectors[chunk.hash],
+                chunk_point_id(knowledge.id, chunk.index),
+            )
+            for knowledge, chunks in chunked
+            for chunk in chunks
+        ]
+        batch_size = max(1, SETTINGS.QDRANT_UPSERT_BATCH_SIZE)
+        for start in range(0, len(items), batch_size):
+            await self.qdrant.upsert(self.collection, items[start : start + batch_size], self.embedding.dimension)
+
+        if reuse_existing:
+            new_ids = {item["id"] for item in items}
+            # knowledge.id is the point id used before chunking; drop it if still present.
+            stale = [p.id for p in existing if p.id not in new_ids] + [k.id for k in knowledges]
+            await self.qdrant.delete(self.collection, stale)
+
+        log.info(f"Indexed {len(knowledges)} knowledge entries: {len(items)} chunks, {len(texts)} embedded")
+        return {"chunks": len(items), "embedded": len(texts)}
+
+    async def chunk_vectors(self, user_id: int, knowledge_ids: list[int]) -> dict[int, list[dict]]:
+        """
+        Return the stored chunks of several entries, keyed by knowledge id.
+        """
+        if not knowledge_ids or not await self.qdrant.has_collection(self.collection):
+            return {}
+
+        points = await self.qdrant.scroll_points(
+            self.collection,
+            {"user_id": user_id, "knowledge_id": knowledge_ids},
+            with_payload=["metadata"],
+            with_vectors=True,
+        )
+        chunks: dict[int, list[dict]] = {}
+        for point in points:
+            metadata = point.payload.get("metadata") or {}
+            if "chunk_hash" not in metadata or not point.vector:
+                continue
+            chunks.setdefault(metadata["knowledge_id"], []).append(
+                {"index": metadata.get("chunk_index", 0), "hash": metadata["chunk_hash"], "vector": point.vector}
+            )
+        for entries in chunks.values():
+            entries.sort(key=lambda c: c["index"])
+        return chunks
+
+    async def delete(self, knowledge_id: int):
+        await self.delete_many([knowledge_id])
+
+    async def delete_many(self, knowledge_ids: list[int]):
+        if not knowledge_ids or not await self.qdrant.has_collection(self.collection):
+            return
+        await self.qdrant.delete_by_filter(self.collection, {"knowledge_id": knowledge_ids})
+        await self.qdrant.delete(self.collection, knowledge_ids)
+
+    async def search(self, query: str, limit: int, filter_dict: dict) -> list[int]:
+        """
+        Return knowledge ids ranked by their pooled chunk scores.
+        """
+        if not await self.qdrant.has_collection(self.collection):
+            # Nothing has been indexed yet; the first entries are still in the outbox.
+            return []
+        vector = await self.embedding.embed(query)
+        results = await self.qdrant.search_groups(
+            self.collection,
+            vector,
+            group_by="knowledge_id",
+            limit=limit,
+            group_size=SETTINGS.SEARCH_CHUNK_GROUP_SIZE,
+            filter_dict=filter_dict,
+        )
+        return pool_scores(results["ids"], results["scores"], SETTINGS.SEARCH_CHUNK_POOLING)
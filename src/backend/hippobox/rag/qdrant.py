@@ -1,152 +1,423 @@
 import logging
 from pathlib import Path
+from typing import AsyncIterator
 
-from qdrant_client import QdrantClient as QClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.models import PointStruct
 from qdrant_client.models import models
 
+from hippobox.core.metrics import QDRANT_SECONDS, observe
 from hippobox.core.settings import SETTINGS
+from hippobox.rag.index_profiles import IndexProfile, get_index_profile
 
 log = logging.getLogger("qdrant")
 
-NO_LIMIT = 999999999
+# Payload fields that searches filter on; every collection keeps an index for each.
+PAYLOAD_INDEXES: dict[str, models.IntegerIndexParams] = {
+    field_name: models.IntegerIndexParams(type=models.IntegerIndexType.INTEGER, lookup=True, range=False)
+    for field_name in ("metadata.user_id", "metadata.knowledge_id", "metadata.topic_id", "metadata.tag_ids")
+}
+
+DISTANCE = models.Distance.COSINE
+
+
+class CollectionSchemaError(RuntimeError):
+    """
+    An existing collection does not match the configured vectors.
+    """
 
 
 class Qdrant:
-    def __init__(self):
+    """
+    Async wrapper around the knowledge collections.
+
+    Every call awaits AsyncQdrantClient, so vector round-trips overlap with
+    other requests instead of blocking the event loop. A server is reached
+    over REST, or over gRPC with QDRANT_PREFER_GRPC; either transport keeps
+    a pool of connections (QDRANT_POOL_SIZE) open for the life of the client.
+
+    Collections are created, and searched, with the index profile named by
+    QDRANT_INDEX_PROFILE unless another profile is passed in.
+    """
+
+    def __init__(self, profile: IndexProfile | None = None):
         self.prefix = "hp"
         self.mode = SETTINGS.QDRANT_MODE.lower()
+        self.profile = profile or get_index_profile(
+            SETTINGS.QDRANT_INDEX_PROFILE, hnsw_ef=SETTINGS.QDRANT_HNSW_EF, exact=SETTINGS.QDRANT_EXACT_SEARCH
+        )
 
         if self.mode == "local":
             storage_path: Path = SETTINGS.QDRANT_LOCAL_PATH
             storage_path.mkdir(parents=True, exist_ok=True)
             log.info(f"Using LOCAL storage: {storage_path}")
 
-            self.client = QClient(path=str(storage_path))
+            self.client = AsyncQdrantClient(path=str(storage_path))
 
         elif self.mode == "docker":
             url = SETTINGS.QDRANT_URL
-            log.info(f"Using REMOTE/DOCKER: {url}")
-            self.client = QClient(url=url)
+            transport = f"gRPC :{SETTINGS.QDRANT_GRPC_PORT}" if SETTINGS.QDRANT_PREFER_GRPC else "REST"
+            log.info(f"Using REMOTE/DOCKER: {url} ({transport})")
+            self.client = AsyncQdrantClient(
+                url=url,
+                grpc_port=SETTINGS.QDRANT_GRPC_PORT,
+                prefer_grpc=SETTINGS.QDRANT_PREFER_GRPC,
+                api_key=SETTINGS.QDRANT_API_KEY or None,
+                timeout=SETTINGS.QDRANT_TIMEOUT,
+                pool_size=SETTINGS.QDRANT_POOL_SIZE or None,
+            )
 
         else:
             raise ValueError(f"Invalid QDRANT_MODE: {self.mode}")
 
+        # Collections (or aliases) known to exist, so writes skip the existence check.
+        self._collections: set[str] = set()
+
+    async def close(self):
+        await self.client.close()
+        log.info("Qdrant client closed")
+
     def _full_name(self, name: str):
         return f"{self.prefix}_{name}"
 
+    def _payload(self, item: dict) -> dict:
+        payload = {"metadata": item["metadata"]}
+        if item.get("snippet"):
+            payload["snippet"] = item["snippet"]
+        return payload
+
     def _create_points(self, items: list[dict]):
-        return [
-            PointStruct(
-                id=item["id"],
-                vector=item["vector"],
-                payload={"text": item["text"], "metadata": item["metadata"]},
+        return [PointStruct(id=item["id"], vector=item["vector"], payload=self._payload(item)) for item in items]
+
+    def _search_params(self) -> models.SearchParams | None:
+        # Local mode always searches by full scan and warns about search params.
+        return None if self.mode == "local" else self.profile.search_params()
+
+    def _build_filter(self, filter_dict: dict | None) -> models.Filter | None:
+        if not filter_dict:
+            return None
+        conditions = [
+            models.FieldCondition(
+                key=f"metadata.{k}",
+                match=models.MatchAny(any=v) if isinstance(v, list) else models.MatchValue(value=v),
             )
-            for item in items
+            for k, v in filter_dict.items()
         ]
+        return models.Filter(must=conditions)
+
+    def _payload_selector(
+        self, with_payload: bool | list[str], without_payload: list[str] | None
+    ) -> bool | list[str] | models.PayloadSelectorExclude:
+        if without_payload:
+            return models.PayloadSelectorExclude(exclude=without_payload)
+        return with_payload
 
-    def create_collection(self, name: str, dim: int):
+    async def create_payload_indexes(self, name: str, field_names: list[str] | None = None):
         cname = self._full_name(name)
+        if self.mode == "local":
+            # Local mode filters by full scan and ignores payload indexes.
+            return
+        for field_name in field_names if field_names is not None else PAYLOAD_INDEXES:
+            await self.client.create_payload_index(
+                collection_name=cname,
+                field_name=field_name,
+                field_schema=PAYLOAD_INDEXES[field_name],
+            )
+        log.info(f"Payload indexes ensured: {cname}")
 
-        self.client.create_collection(
+    async def create_collection(self, name: str, dim: int):
+        cname = self._full_name(name)
+
+        await self.client.create_collection(
             collection_name=cname,
-            vectors_config=models.VectorParams(
-                size=dim,
-                distance=models.Distance.COSINE,
-                on_disk=True,
-            ),
-            hnsw_config=models.HnswConfigDiff(m=16),
+            vectors_config=self.profile.vector_params(dim, DISTANCE),
+            hnsw_config=self.profile.hnsw_config(),
+            quantization_config=self.profile.quantization_config(),
         )
 
-        self.client.create_payload_index(
+        await self.create_payload_indexes(name)
+        self._collections.add(name)
+
+        log.info(f"Collection created: {cname} (index profile {self.profile.name})")
+
+    async def ensure_collection(self, name: str, dim: int):
+        """
+        Create the collection, or verify an existing one against the
+        configured vectors and add any payload index it lacks.
+
+        Raises CollectionSchemaError when the stored vectors have another
+        size or distance, e.g. after switching the embedding model.
+        """
+        cname = self._full_name(name)
+        if not await self.client.collection_exists(cname):
+            await self.create_collection(name, dim)
+            return
+
+        info = await self.client.get_collection(cname)
+        vectors = info.config.params.vectors
+        if not isinstance(vectors, models.VectorParams):
+            raise CollectionSchemaError(f"Collection {cname} uses named vectors; expected a single unnamed vector")
+        if vectors.size != dim or vectors.distance != DISTANCE:
+            raise CollectionSchemaError(
+                f"Collection {cname} stores {vectors.size}-dim {vectors.distance.value} vectors, but the embedding "
+                f"model produces {dim}-dim {DISTANCE.value} vectors; run `hippobox reindex --rebuild` to re-embed "
+                f"into a new collection"
+            )
+
+        missing = [field for field in PAYLOAD_INDEXES if field not in (info.payload_schema or {})]
+        if missing:
+            await self.create_payload_indexes(name, missing)
+        if self.mode != "local" and not self.profile.matches(info.config):
+            await self.apply_profile(name)
+        self._collections.add(name)
+        log.info(f"Collection verified: {cname} ({vectors.size} dims, {vectors.distance.value})")
+
+    async def apply_profile(self, name: str):
+        """
+        Move an existing collection to the current index profile.
+
+        Qdrant rebuilds the HNSW graph and the quantized vectors in the
+        background; the collection keeps serving searches meanwhile.
+        """
+        cname = self._full_name(name)
+        await self.client.update_collection(
             collection_name=cname,
-            field_name="metadata.id",
-            field_schema=models.KeywordIndexParams(
-                type=models.KeywordIndexType.KEYWORD,
-                on_disk=True,
-            ),
+            vectors_config={"": models.VectorParamsDiff(on_disk=self.profile.on_disk)},
+            hnsw_config=self.profile.hnsw_config(),
+            quantization_config=self.profile.quantization_config() or models.Disabled.DISABLED,
         )
+        log.info(f"Index profile {self.profile.name} applied to {cname}; segments are re-optimized in the background")
 
-        log.info(f"Collection created: {cname}")
-
-    def has_collection(self, name: str) -> bool:
+    async def has_collection(self, name: str) -> bool:
+        if name in self._collections:
+            return True
         cname = self._full_name(name)
-        return self.client.collection_exists(cname)
+        if await self.client.collection_exists(cname):
+            self._collections.add(name)
+            return True
+        return False
 
-    def delete_collection(self, name: str):
+    async def delete_collection(self, name: str):
         cname = self._full_name(name)
-        return self.client.delete_collection(collection_name=cname)
+        self._collections.discard(name)
+        return await self.client.delete_collection(collection_name=cname)
 
-    def insert(self, name: str, items: list[dict]):
-        dim = len(items[0]["vector"])
-        if not self.has_collection(name):
-            self.create_collection(name, dim)
+    async def upsert(self, name: str, items: list[dict], dim: int):
+        if name not in self._collections:
+            await self.ensure_collection(name, dim)
 
         points = self._create_points(items)
         cname = self._full_name(name)
 
-        self.client.upload_points(cname, points)
+        try:
+            with observe(QDRANT_SECONDS, op="upsert"):
+                return await self.client.upsert(cname, points)
+        except Exception:
+            # The collection may have been dropped by another process; check again next time.
+            self._collections.discard(name)
+            raise
 
-    def upsert(self, name: str, items: list[dict]):
-        dim = len(items[0]["vector"])
-        if not self.has_collection(name):
-            self.create_collection(name, dim)
+    async def delete(self, name: str, ids: list[str]):
+        cname = self._full_name(name)
+        with observe(QDRANT_SECONDS, op="delete"):
+            return await self.client.delete(
+                collection_name=cname,
+                points_selector=models.PointIdsList(points=ids),
+            )
 
-        points = self._create_points(items)
+    async def batch_overwrite_payload(self, name: str, items: list[dict]):
+        """
+        Replace the whole payload of each point (id, metadata, snippet) in one request, keeping its vector.
+        """
         cname = self._full_name(name)
+        operations = [
+            models.OverwritePayloadOperation(
+                overwrite_payload=models.SetPayload(payload=self._payload(item), points=[item["id"]]),
+            )
+            for item in items
+        ]
+        with observe(QDRANT_SECONDS, op="set_payload"):
+            return await self.client.batch_update_points(collection_name=cname, update_operations=operations)
 
-        return self.client.upsert(cname, points)
+    async def delete_by_filter(self, name: str, filter_dict: dict):
+        cname = self._full_name(name)
+        with observe(QDRANT_SECONDS, op="delete"):
+            return await self.client.delete(
+                collection_name=cname,
+                points_selector=models.FilterSelector(filter=self._build_filter(filter_dict)),
+            )
 
-    def delete(self, name: str, ids: list[str]):
+    async def iter_points(
+        self,
+        name: str,
+        filter_dict: dict | None = None,
+        with_payload: bool | list[str] = True,
+        with_vectors: bool = False,
+        page_size: int | None = None,
+        without_payload: list[str] | None = None,
+    ) -> AsyncIterator[list[models.Record]]:
+        """
+        Yield the matching points page by page, following the scroll offset.
+
+        Only one page (page_size points, QDRANT_SCROLL_PAGE_SIZE by default)
+        is held at a time. with_payload takes a list of fields to include
+        (e.g. ["metadata.knowledge_id"]), without_payload a list to leave out
+        (e.g. ["snippet"]); vectors are skipped unless with_vectors is set. The
+        filter requires every field to match.
+        """
         cname = self._full_name(name)
-        return self.client.delete(
-            collection_name=cname,
-            points_selector=models.PointIdsList(points=ids),
-        )
+        scroll_filter = self._build_filter(filter_dict)
+        payload = self._payload_selector(with_payload, without_payload)
+        limit = max(1, page_size or SETTINGS.QDRANT_SCROLL_PAGE_SIZE)
+        offset = None
+        while True:
+            with observe(QDRANT_SECONDS, op="scroll"):
+                page, offset = await self.client.scroll(
+                    collection_name=cname,
+                    scroll_filter=scroll_filter,
+                    limit=limit,
+                    offset=offset,
+                    with_payload=payload,
+                    with_vectors=with_vectors,
+                )
+            if page:
+                yield page
+            if offset is None:
+                return
+
+    async def retrieve(self, name: str, ids: list, with_payload: bool | list[str] = True) -> list[models.Record]:
+        """
+        The points with these ids that exist, without their vectors.
+        """
+        cname = self._full_name(name)
+        with observe(QDRANT_SECONDS, op="retrieve"):
+            return await self.client.retrieve(
+                collection_name=cname,
+                ids=ids,
+                with_payload=with_payload,
+                with_vectors=False,
+            )
+
+    async def scroll_points(
+        self,
+        name: str,
+        filter_dict: dict,
+        with_payload: bool | list[str] = True,
+        with_vectors: bool = False,
+        page_size: int | None = None,
+    ) -> list[models.Record]:
+        """
+        Collect every matching point; for filters that select a bounded set, like one batch of entries.
+        """
+        return [
+            point
+            async for page in self.iter_points(
+                name, filter_dict, with_payload=with_payload, with_vectors=with_vectors, page_size=page_size
+            )
+            for point in page
+        ]
 
-    def search(self, name: str, vector: list[float], limit: int = 5):
+    async def alias_target(self, name: str) -> str | None:
+        """
+        Return the collection an alias points to, or None if name is not an alias.
+        """
         cname = self._full_name(name)
-        result = self.client.query_points(
-            collection_name=cname,
-            query=vector,
-            limit=limit,
+        for alias in (await self.client.get_aliases()).aliases:
+            if alias.alias_name == cname:
+                return alias.collection_name.removeprefix(f"{self.prefix}_")
+        return None
+
+    async def swap_alias(self, name: str, target: str) -> str | None:
+        """
+        Point the alias name at target in one atomic alias update.
+
+        Returns the collection the alias pointed to before. If name is still
+        a plain collection (before the first rebuild), that collection is
+        deleted first and None is returned.
+        """
+        cname = self._full_name(name)
+        previous = await self.alias_target(name)
+        operations = []
+        if previous is not None:
+            operations.append(models.DeleteAliasOperation(delete_alias=models.DeleteAlias(alias_name=cname)))
+        elif await self.client.collection_exists(cname):
+            log.warning(f"Replacing collection {cname} with an alias; it is briefly unavailable")
+            await self.client.delete_collection(cname)
+        self._collections.discard(name)
+        operations.append(
+            models.CreateAliasOperation(
+                create_alias=models.CreateAlias(collection_name=self._full_name(target), alias_name=cname)
+            )
         )
+        await self.client.update_collection_aliases(change_aliases_operations=operations)
+        self._collections.add(name)
+        log.info(f"Alias {cname} -> {self._full_name(target)}")
+        return previous
+
+    async def search_groups(
+        self,
+        name: str,
+        vector: list[float],
+        group_by: str,
+        limit: int = 5,
+        group_size: int = 1,
+        filter_dict: dict | None = None,
+    ):
+        cname = self._full_name(name)
+        with observe(QDRANT_SECONDS, op="search_groups"):
+            result = await self.client.query_points_groups(
+                collection_name=cname,
+                query=vector,
+                group_by=f"metadata.{group_by}",
+                query_filter=self._build_filter(filter_dict),
+                limit=limit,
+                group_size=group_size,
+                with_payload=False,
+                search_params=self._search_params(),
+            )
 
-        points = result.points
+        groups = result.groups
         return {
-            "ids": [p.id for p in points],
-            "documents": [p.payload.get("text") for p in points],
-            "metadatas": [p.payload.get("metadata") for p in points],
-            "scores": [p.score for p in points],
+            "ids": [g.id for g in groups],
+            "scores": [[hit.score for hit in g.hits] for g in groups],
         }
 
-    def query(self, name: str, filter_dict: dict):
+    async def search(
+        self,
+        name: str,
+        vector: list[float],
+        limit: int = 5,
+        filter_dict: dict | None = None,
+        with_payload: bool | list[str] = False,
+    ):
+        """
+        Nearest points with their scores. Entries are read back from SQL, so
+        no payload is transferred unless fields are asked for, e.g.
+        ["metadata.knowledge_id", "snippet"].
+        """
         cname = self._full_name(name)
-
-        conditions = [
-            models.FieldCondition(
-                key=f"metadata.{k}",
-                match=models.MatchValue(value=v),
+        with observe(QDRANT_SECONDS, op="search"):
+            result = await self.client.query_points(
+                collection_name=cname,
+                query=vector,
+                query_filter=self._build_filter(filter_dict),
+                limit=limit,
+                with_payload=with_payload,
+                search_params=self._search_params(),
             )
-            for k, v in filter_dict.items()
-        ]
-
-        scroll_res = self.client.scroll(
-            collection_name=cname,
-            scroll_filter=models.Filter(should=conditions),
-            limit=NO_LIMIT,
-        )
 
-        points = scroll_res[0]
+        points = result.points
         return {
             "ids": [p.id for p in points],
-            "documents": [p.payload.get("text") for p in points],
-            "metadatas": [p.payload.get("metadata") for p in points],
+            "metadatas": [(p.payload or {}).get("metadata") for p in points],
+            "snippets": [(p.payload or {}).get("snippet") for p in points],
+            "scores": [p.score for p in points],
         }
 
-    def reset(self):
-        col_list = self.client.get_collections().collections
+    async def reset(self):
+        col_list = (await self.client.get_collections()).collections
         for col in col_list:
             if col.name.startswith(self.prefix):
-                self.client.delete_collection(col.name)
+                await self.client.delete_collection(col.name)
                 log.info(f"Deleted: {col.name}")
+        self._collections.clear()
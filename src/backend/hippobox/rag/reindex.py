@@ -0,0 +1,298 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable
+
+from pydantic import BaseModel, Field
+
+from hippobox.core.redis import RedisManager
+from hippobox.core.settings import SETTINGS
+from hippobox.models.knowledge import IndexStatus, KnowledgeModel, Knowledges
+from hippobox.models.outbox import Outbox
+from hippobox.rag.embedding import Embedding
+from hippobox.rag.indexing import COLLECTION, KnowledgeIndexer, chunk_point_id
+from hippobox.rag.qdrant import Qdrant
+from hippobox.utils.preprocess import CHUNK_FIELDS, build_metadata
+
+log = logging.getLogger("qdrant")
+
+# Payload fields compared against SQL; a mismatch rewrites the entry's points (vectors are reused).
+SYNC_FIELDS = ("user_id", "topic_id", "tag_ids")
+
+
+class ReindexStatus(BaseModel):
+    running: bool = Field(False, description="Whether a reindex is in progress")
+    rebuild: bool = Field(False, description="Whether the collection is rebuilt behind an alias")
+    dry_run: bool = Field(False, description="Only count differences, change nothing")
+    phase: str | None = Field(None, description="rebuild | reconcile | orphans")
+    collection: str | None = Field(None, description="Collection being built by a rebuild")
+    total: int = Field(0, description="Knowledge entries to scan")
+    scanned: int = Field(0, description="Entries (or, for orphans, points) scanned in the current phase")
+    reindexed: int = Field(0, description="Entries whose points were missing or stale and were rewritten")
+    orphans: int = Field(0, description="Points without a knowledge entry that were deleted")
+    rate: float = Field(0.0, description="Scanned per second in the current phase")
+    started_at: datetime | None = Field(None, description="Start time")
+    finished_at: datetime | None = Field(None, description="End time")
+    error: str | None = Field(None, description="Failure reason, if the run failed")
+
+
+class KnowledgeReindexer:
+    """
+    Reconciles the knowledge collection with SQL.
+
+    Entries are read in id batches and compared with their points, fetched
+    with a filtered, paginated scroll: an entry is rewritten when a chunk
+    point is missing or extra, its chunk hash differs, or a filter field in
+    the payload is out of date. Unchanged chunks keep their vectors, so only
+    missing or edited text is embedded. A scroll over the whole collection
+    then deletes points whose entry no longer exists.
+
+    With rebuild, every entry is first embedded into a new collection, the
+    alias is swapped to it atomically and the old collection is dropped;
+    the reconcile pass afterwards picks up writes made during the build.
+    """
+
+    def __init__(self, embedding: Embedding, qdrant: Qdrant, batch_size: int | None = None):
+        self.embedding = embedding
+        self.qdrant = qdrant
+        self.indexer = KnowledgeIndexer(embedding, qdrant)
+        self.batch_size = max(1, batch_size or SETTINGS.REINDEX_BATCH_SIZE)
+
+    def _in_sync(self, knowledge: KnowledgeModel, points: dict) -> bool:
+        expected = {chunk_point_id(knowledge.id, c.index): c.hash for c in self.indexer.chunk(knowledge)}
+        if set(points) != set(expected):
+            return False
+
+        metadata = build_metadata(knowledge)
+        fields = {*metadata, *CHUNK_FIELDS}
+        for point_id, chunk_hash in expected.items():
+            stored = points[point_id]
+            if set(stored) != fields:
+                # Written with an older payload schema.
+                return False
+            if stored.get("chunk_hash") != chunk_hash or stored.get("chunk_count") != len(expected):
+                return False
+            if any(stored.get(field) != metadata[field] for field in SYNC_FIELDS):
+                return False
+        return True
+
+    def _begin_phase(self, status: ReindexStatus, phase: str) -> float:
+        status.phase = phase
+        status.scanned = 0
+        status.rate = 0.0
+        return time.monotonic()
+
+    def _report(self, status: ReindexStatus, started: float, on_progress: Callable | None):
+        status.rate = round(status.scanned / max(time.monotonic() - started, 1e-6), 1)
+        log.info(
+            f"Reindex {status.phase}: {status.scanned}/{status.total} entries, {status.reindexed} reindexed, "
+            f"{status.orphans} orphans, {status.rate}/s"
+        )
+        if on_progress:
+            on_progress(status)
+
+    async def _rebuild(self, status: ReindexStatus, on_progress: Callable | None):
+        target = f"{COLLECTION}_{datetime.now(timezone.utc):%Y%m%d%H%M%S}"
+        status.collection = target
+        indexer = KnowledgeIndexer(self.embedding, self.qdrant, collection=target)
+
+        started = self._begin_phase(status, "rebuild")
+        # Created up front, so even an empty table ends up with a collection of the current vector size.
+        await indexer.ensure_collection()
+        async for batch in Knowledges.iter_batches(self.batch_size):
+            await indexer.index_many(batch, reuse_existing=False)
+            status.scanned += len(batch)
+            self._report(status, started, on_progress)
+
+        previous = await self.qdrant.swap_alias(COLLECTION, target)
+        if previous and previous != target:
+            await self.qdrant.delete_collection(previous)
+            log.info(f"Dropped previous collection {previous}")
+
+    async def _reconcile(self, status: ReindexStatus, on_progress: Callable | None):
+        started = self._begin_phase(status, "reconcile")
+        has_collection = await self.qdrant.has_collection(COLLECTION)
+
+        async for batch in Knowledges.iter_batches(self.batch_size):
+            points: dict[int, dict] = {}
+            if has_collection:
+                pages = self.qdrant.iter_points(
+                    COLLECTION,
+                    {"knowledge_id": [k.id for k in batch]},
+                    with_payload=["metadata"],
+                    page_size=self.batch_size,
+                )
+                async for page in pages:
+                    for point in page:
+                        metadata = point.payload.get("metadata") or {}
+                        points.setdefault(metadata.get("knowledge_id"), {})[str(point.id)] = metadata
+
+            stale = [k for k in batch if not self._in_sync(k, points.get(k.id, {}))]
+            if stale and not status.dry_run:
+                await self.indexer.index_many(stale)
+                has_collection = True
+
+            if not status.dry_run:
+                # Covers entries written while VDB_ENABLED was off, which have no outbox job.
+                rewritten = {k.id for k in stale}
+                await Outbox.mark_indexed(
+                    [k.id for k in batch if k.id in rewritten or k.index_status != IndexStatus.INDEXED]
+                )
+
+            status.reindexed += len(stale)
+            status.scanned += len(batch)
+            self._report(status, started, on_progress)
+
+    async def _delete_orphans(self, status: ReindexStatus, on_progress: Callable | None):
+        started = self._begin_phase(status, "orphans")
+        if not await self.qdrant.has_collection(COLLECTION):
+            return
+
+        pages = self.qdrant.iter_points(COLLECTION, with_payload=["metadata.knowledge_id"], page_size=self.batch_size)
+        async for page in pages:
+            owners = {point.id: (point.payload.get("metadata") or {}).get("knowledge_id") for point in page}
+            existing = await Knowledges.existing_ids([kid for kid in owners.values() if isinstance(kid, int)])
+            orphans = [point_id for point_id, kid in owners.items() if kid not in existing]
+            if orphans and not status.dry_run:
+                await self.qdrant.delete(COLLECTION, orphans)
+
+            status.orphans += len(orphans)
+            status.scanned += len(page)
+            self._report(status, started, on_progress)
+
+    async def run(
+        self,
+        rebuild: bool = False,
+        dry_run: bool = False,
+        status: ReindexStatus | None = None,
+        on_progress: Callable[[ReindexStatus], None] | None = None,
+    ) -> ReindexStatus:
+        if rebuild and dry_run:
+            raise ValueError("A rebuild cannot be a dry run")
+
+        status = status or ReindexStatus()
+        status.running, status.rebuild, status.dry_run = True, rebuild, dry_run
+        status.started_at = datetime.now(timezone.utc)
+        status.total = await Knowledges.count()
+        try:
+            if rebuild:
+                await self._rebuild(status, on_progress)
+            elif not dry_run:
+                # Rewriting points into a collection of another vector size fails; a rebuild is needed.
+                await self.indexer.ensure_collection()
+            await self._reconcile(status, on_progress)
+            await self._delete_orphans(status, on_progress)
+        except Exception as e:
+            status.error = str(e)
+            raise
+        finally:
+            status.running = False
+            status.finished_at = datetime.now(timezone.utc)
+
+        log.info(
+            f"Reindex finished: {status.total} entries, {status.reindexed} reindexed, {status.orphans} orphans"
+            f"{' (dry run)' if dry_run else ''}"
+        )
+        return status
+
+
+# Shared by every worker: the status of the current or last run, and the lock of the running one.
+STATUS_KEY = "reindex:status"
+LOCK_KEY = "reindex:lock"
+# The lock is a lease the running worker renews; if that worker dies it expires.
+LOCK_TTL = 30
+SYNC_INTERVAL = 2.0
+
+
+class ReindexJob:
+    """
+    The reindex started from the admin API; one runs at a time.
+
+    The status and the lock live in Redis, so with several workers the run
+    is reported by any of them and a second start is refused wherever it
+    lands. The worker that runs it writes its progress back every
+    SYNC_INTERVAL seconds and renews the lock; a run whose lock expired
+    without a recorded end is reported as interrupted.
+    """
+
+    def __init__(self):
+        self.status = ReindexStatus()
+        self._task: asyncio.Task | None = None
+        self._token: str | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self, embedding: Embedding, qdrant: Qdrant, rebuild: bool = False, dry_run: bool = False):
+        redis = await RedisManager.get_client()
+        token = uuid.uuid4().hex
+        if self.running or not await redis.set(LOCK_KEY, token, nx=True, ex=LOCK_TTL):
+            raise RuntimeError("A reindex is already running")
+
+        self._token = token
+        self.status = ReindexStatus(
+            running=True, rebuild=rebuild, dry_run=dry_run, started_at=datetime.now(timezone.utc)
+        )
+        await redis.set(STATUS_KEY, self.status.model_dump_json())
+        reindexer = KnowledgeReindexer(embedding, qdrant)
+        self._task = asyncio.create_task(self._run(reindexer, rebuild, dry_run))
+        return self.status
+
+    async def get_status(self) -> ReindexStatus:
+        if self.running:
+            return self.status
+
+        redis = await RedisManager.get_client()
+        raw = await redis.get(STATUS_KEY)
+        if raw is None:
+            return self.status
+        status = ReindexStatus.model_validate_json(raw)
+        if status.running and not await redis.exists(LOCK_KEY):
+            # The worker running it stopped without recording the end.
+            status.running = False
+            status.error = status.error or "Interrupted"
+        return status
+
+    async def _sync(self, release: bool = False):
+        try:
+            redis = await RedisManager.get_client()
+            await redis.set(STATUS_KEY, self.status.model_dump_json())
+            if await redis.get(LOCK_KEY) == self._token:
+                if release:
+                    await redis.delete(LOCK_KEY)
+                else:
+                    await redis.expire(LOCK_KEY, LOCK_TTL)
+        except Exception as e:
+            log.warning(f"Failed to store reindex status: {e}")
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(SYNC_INTERVAL)
+            await self._sync()
+
+    async def _run(self, reindexer: KnowledgeReindexer, rebuild: bool, dry_run: bool):
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            await reindexer.run(rebuild=rebuild, dry_run=dry_run, status=self.status)
+        except asyncio.CancelledError:
+            self.status.error = "Cancelled"
+        except Exception as e:
+            log.exception(f"Reindex failed: {e}")
+        finally:
+            heartbeat.cancel()
+            await self._sync(release=True)
+
+    async def cancel(self):
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+Reindex = ReindexJob()
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, status
 
 from hippobox.errors.admin import AdminException
 from hippobox.errors.service import exceptions_to_http
 from hippobox.models.user import UserModel, UserResponse
+from hippobox.rag.reindex import ReindexStatus
 from hippobox.services.admin import AdminService, get_admin_service
 from hippobox.utils.auth import require_admin
 
@@ -37,3 +38,55 @@ async def delete_user(
         return {"message": "User deleted successfully."}
     except AdminException as e:
         raise exceptions_to_http(e)
+
+
+# -------------------------------------------
+# Vector index
+# -------------------------------------------
+@router.post("/reindex", response_model=ReindexStatus, status_code=status.HTTP_202_ACCEPTED)
+async def start_reindex(
+    rebuild: bool = Query(False, description="Embed everything into a new collection and swap the alias to it"),
+    dry_run: bool = Query(False, description="Only count missing, stale and orphan points"),
+    _: UserResponse = Depends(require_admin),
+    service: AdminService = Depends(get_admin_service),
+):
+    """
+    Reconcile the vector index with the knowledge table in the background.
+
+    ### Returns:
+
+        The status of the started run; poll GET /reindex for progress.
+    """
+    try:
+        return await service.start_reindex(rebuild=rebuild, dry_run=dry_run)
+    except AdminException as e:
+        raise exceptions_to_http(e)
+
+
+@router.get("/reindex", response_model=ReindexStatus)
+async def get_reindex_status(
+    _: UserResponse = Depends(require_admin),
+    service: AdminService = Depends(get_admin_service),
+):
+    """
+    Progress and throughput of the current or last reindex, whichever worker runs it.
+    """
+    return await service.get_reindex_status()
+
+
+# -------------------------------------------
+# Caches
+# -------------------------------------------
+@router.get("/caches", response_model=dict[str, dict | None])
+async def get_cache_stats(
+    _: UserResponse = Depends(require_admin),
+    service: AdminService = Depends(get_admin_service),
+):
+    """
+    Hit and miss counters of this worker's search, stats and embedding caches.
+
+    ### Returns:
+
+        {"search": {...}, "stats": {...}, "embedding": {...}}; a disabled cache is null.
+    """
+    return service.get_cache_stats()
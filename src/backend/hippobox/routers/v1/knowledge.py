@@ -1,22 +1,47 @@
+from datetime import date
 from enum import Enum
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
 from hippobox.core.settings import SETTINGS
-from hippobox.errors.knowledge import KnowledgeException
+from hippobox.errors.knowledge import KnowledgeErrorCode, KnowledgeException
 from hippobox.errors.service import exceptions_to_http
-from hippobox.models.knowledge import KnowledgeForm, KnowledgeResponse, KnowledgeUpdate
+from hippobox.models.knowledge import (
+    ExportFormat,
+    KnowledgeForm,
+    KnowledgeImportForm,
+    KnowledgeImportResult,
+    KnowledgeOrder,
+    KnowledgePage,
+    KnowledgeResponse,
+    KnowledgeStats,
+    KnowledgeUpdate,
+    KnowledgeView,
+    SearchMode,
+    StatsBucket,
+)
 from hippobox.models.user import UserResponse
 from hippobox.services.knowledge import KnowledgeService, get_knowledge_service
 from hippobox.utils.auth import get_current_user
 
 router = APIRouter()
 
+PAGE_LIMIT_DEFAULT = 50
+PAGE_LIMIT_MAX = 200
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.TAR: "application/x-tar",
+}
+
 
 class OperationID(str, Enum):
     search_knowledge = "search_knowledge"
     create_knowledge = "create_knowledge"
+    import_knowledge = "import_knowledge"
     get_knowledge_list = "get_knowledge_list"
+    get_knowledge_stats = "get_knowledge_stats"
     get_knowledge_by_title = "get_knowledge_by_title"
     get_knowledge_by_topic = "get_knowledge_by_topic"
     get_knowledge_by_tag = "get_knowledge_by_tag"
@@ -31,13 +56,15 @@ class OperationID(str, Enum):
     "/search",
     response_model=list[KnowledgeResponse],
     operation_id=OperationID.search_knowledge,
-    include_in_schema=SETTINGS.VDB_ENABLED,
 )
 async def search_knowledge(
     query: str,
     topic: str | None = None,
     tag: str | None = None,
     limit: int = 1,
+    mode: SearchMode | None = None,
+    vector_weight: float = Query(1.0, ge=0),
+    lexical_weight: float = Query(1.0, ge=0),
     current_user: UserResponse = Depends(get_current_user),
     service: KnowledgeService = Depends(get_knowledge_service),
 ):
@@ -46,17 +73,22 @@ async def search_knowledge(
 
     ### Args:
 
-        query (str): Semantic search query.
+        query (str): Search query.
         topic (str | None = None): Optional topic filter.
         tag (str | None = None): Optional tag filter.
         limit (int = 1): Number of search results to return.
+        mode (vector | lexical | hybrid | None = None): Retrieval mode.
+            Defaults to hybrid, or lexical when the vector DB is disabled.
+        vector_weight (float = 1.0): Weight of the vector ranking in hybrid fusion.
+        lexical_weight (float = 1.0): Weight of the keyword ranking in hybrid fusion.
 
     ### Returns:
 
         knowledge (KnowledgeResponse): The successfully retrieved knowledge object.
 
-    This endpoint performs vector similarity search on Qdrant
-    and returns ranked knowledge entries.
+    Vector mode runs similarity search on Qdrant, lexical mode runs keyword
+    search on the SQL full-text index (good for exact identifiers and error
+    codes), and hybrid merges both with reciprocal rank fusion.
     """
     try:
         return await service.search(
@@ -65,6 +97,9 @@ async def search_knowledge(
             topic=topic,
             tag=tag,
             limit=limit,
+            mode=mode,
+            vector_weight=vector_weight,
+            lexical_weight=lexical_weight,
         )
     except KnowledgeException as e:
         raise exceptions_to_http(e)
@@ -102,29 +137,149 @@ async def create_knowledge(
         raise exceptions_to_http(e)
 
 
+# -----------------------------
+# Post: Bulk Import
+# -----------------------------
+@router.post("/import", response_model=KnowledgeImportResult, operation_id=OperationID.import_knowledge)
+async def import_knowledge(
+    form: KnowledgeImportForm,
+    current_user: UserResponse = Depends(get_current_user),
+    service: KnowledgeService = Depends(get_knowledge_service),
+):
+    """
+    Create many knowledge entries in one request.
+
+    ### Args:
+
+        items (list[KnowledgeForm]): Entries with topic, tags, title and content,
+            at most IMPORT_MAX_ITEMS per request.
+
+    ### Returns:
+
+        result (KnowledgeImportResult): Counts, ids of the stored entries and
+            per-item errors (invalid entry, duplicate title, failed batch).
+
+    Entries are stored in batched transactions and embedded in batches, so
+    importing a large note collection takes a handful of requests instead of
+    one per note. An entry that fails does not stop the others.
+    """
+    if len(form.items) > SETTINGS.IMPORT_MAX_ITEMS:
+        raise exceptions_to_http(
+            KnowledgeException(
+                KnowledgeErrorCode.IMPORT_TOO_LARGE,
+                f"At most {SETTINGS.IMPORT_MAX_ITEMS} entries per request",
+            )
+        )
+    return await service.import_knowledge(current_user.id, form.items)
+
+
 # -----------------------------
 # Get: List All
 # -----------------------------
-@router.get("/list", response_model=list[KnowledgeResponse], operation_id=OperationID.get_knowledge_list)
+@router.get("/list", response_model=KnowledgePage, operation_id=OperationID.get_knowledge_list)
 async def get_knowledge_list(
+    limit: int = Query(PAGE_LIMIT_DEFAULT, ge=1, le=PAGE_LIMIT_MAX),
+    cursor: str | None = None,
+    order: KnowledgeOrder = KnowledgeOrder.CREATED_DESC,
+    view: KnowledgeView = KnowledgeView.SUMMARY,
     current_user: UserResponse = Depends(get_current_user),
     service: KnowledgeService = Depends(get_knowledge_service),
 ):
     """
-    Retrieve all stored knowledge entries.
+    Retrieve stored knowledge entries one page at a time.
+
+    ### Args:
+
+        limit (int = 50): Page size, at most 200.
+        cursor (str | None = None): next_cursor returned by the previous page.
+        order (created_desc | created_asc | updated_desc | updated_asc = created_desc): Sort order.
+            A cursor is only valid for the order it was issued with.
+        view (summary | full = summary): summary returns a content snippet, full returns the content.
 
     ### Returns:
 
-        List of all knowledge entries sorted by creation date.
+        page (KnowledgePage): Entries of this page and the cursor of the next one (null on the last page).
 
-    Useful for browsing or building UI item lists.
+    Useful for browsing or building UI item lists. Use the summary view to
+    scan titles cheaply, then fetch single entries by id for full content.
     """
     try:
-        return await service.get_knowledge_list(current_user.id)
+        return await service.get_knowledge_list(current_user.id, limit, cursor=cursor, order=order, view=view)
     except KnowledgeException as e:
         raise exceptions_to_http(e)
 
 
+# -----------------------------
+# Get: Stats
+# -----------------------------
+@router.get("/stats", response_model=KnowledgeStats, operation_id=OperationID.get_knowledge_stats)
+async def get_knowledge_stats(
+    bucket: StatsBucket = StatsBucket.DAY,
+    since: date | None = None,
+    utc_offset: int = Query(0, ge=-840, le=840),
+    tag_limit: int = Query(50, ge=0, le=500),
+    current_user: UserResponse = Depends(get_current_user),
+    service: KnowledgeService = Depends(get_knowledge_service),
+):
+    """
+    Summarize the stored knowledge: totals, content size, entries per topic
+    and tag, and an activity histogram.
+
+    ### Args:
+
+        bucket (day | week = day): Size of the activity periods; weeks start on Monday.
+        since (date | None = None): First local day of the activity histogram, a year ago by default.
+        utc_offset (int = 0): Minutes east of UTC used to assign entries to local days.
+        tag_limit (int = 50): Number of most used tags to list.
+
+    ### Returns:
+
+        stats (KnowledgeStats): Aggregates computed in SQL, without entry content.
+
+    Use this for dashboards and for an overview of which topics and tags
+    exist before browsing or searching.
+    """
+    return await service.get_stats(
+        current_user.id, bucket=bucket, since=since, utc_offset=utc_offset, tag_limit=tag_limit
+    )
+
+
+# -----------------------------
+# Get: Export
+# -----------------------------
+@router.get("/export", response_class=StreamingResponse)
+async def export_knowledge(
+    format: ExportFormat = ExportFormat.NDJSON,
+    include_vectors: bool = False,
+    current_user: UserResponse = Depends(get_current_user),
+    service: KnowledgeService = Depends(get_knowledge_service),
+):
+    """
+    Download every knowledge entry of the current user.
+
+    ### Args:
+
+        format (ndjson | tar = ndjson): One JSON object per line, or a tar of
+            markdown notes with front matter, grouped in folders by topic.
+        include_vectors (bool = False): Add the stored chunk vectors to each
+            NDJSON line so that re-importing skips embedding.
+
+    The response is streamed while rows are read, so exports of any size
+    use constant memory. Both formats can be loaded back with `hippobox import`.
+    """
+    try:
+        stream = await service.export_knowledge(current_user.id, format, include_vectors)
+    except KnowledgeException as e:
+        raise exceptions_to_http(e)
+
+    filename = f"hippobox-knowledge.{'ndjson' if format == ExportFormat.NDJSON else 'tar'}"
+    return StreamingResponse(
+        stream,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # -----------------------------
 # Get: By ID
 # -----------------------------
@@ -177,23 +332,31 @@ async def get_knowledge_by_title(
 # -----------------------------
 # Get: By Topic
 # -----------------------------
-@router.get("/topic/{topic}", response_model=list[KnowledgeResponse], operation_id=OperationID.get_knowledge_by_topic)
+@router.get("/topic/{topic}", response_model=KnowledgePage, operation_id=OperationID.get_knowledge_by_topic)
 async def get_by_topic(
     topic: str,
+    limit: int = Query(PAGE_LIMIT_DEFAULT, ge=1, le=PAGE_LIMIT_MAX),
+    cursor: str | None = None,
+    order: KnowledgeOrder = KnowledgeOrder.CREATED_DESC,
+    view: KnowledgeView = KnowledgeView.SUMMARY,
     current_user: UserResponse = Depends(get_current_user),
     service: KnowledgeService = Depends(get_knowledge_service),
 ):
     """
-    Retrieve all knowledge entries under a specific topic.
+    Retrieve knowledge entries under a specific topic, one page at a time.
     Topics group entries into categories.
 
+    Paging options (limit, cursor, order, view) are the same as /list.
+
     Examples:
     - 'docker'
     - 'fastapi'
     - 'database'
     """
     try:
-        return await service.get_by_topic(current_user.id, topic)
+        return await service.get_knowledge_list(
+            current_user.id, limit, cursor=cursor, order=order, view=view, topic=topic
+        )
     except KnowledgeException as e:
         raise exceptions_to_http(e)
 
@@ -201,23 +364,29 @@ async def get_by_topic(
 # -----------------------------
 # Get: By Tag
 # -----------------------------
-@router.get("/tag/{tag}", response_model=list[KnowledgeResponse], operation_id=OperationID.get_knowledge_by_tag)
+@router.get("/tag/{tag}", response_model=KnowledgePage, operation_id=OperationID.get_knowledge_by_tag)
 async def get_by_tag(
     tag: str,
+    limit: int = Query(PAGE_LIMIT_DEFAULT, ge=1, le=PAGE_LIMIT_MAX),
+    cursor: str | None = None,
+    order: KnowledgeOrder = KnowledgeOrder.CREATED_DESC,
+    view: KnowledgeView = KnowledgeView.SUMMARY,
     current_user: UserResponse = Depends(get_current_user),
     service: KnowledgeService = Depends(get_knowledge_service),
 ):
     """
-    Retrieve all knowledge entries associated with a given tag.
+    Retrieve knowledge entries associated with a given tag, one page at a time.
     Tags represent keyword-level grouping, separate from topics.
 
+    Paging options (limit, cursor, order, view) are the same as /list.
+
     Examples:
     - 'server'
     - 'llm'
     - 'react'
     """
     try:
-        return await service.get_by_tag(current_user.id, tag)
+        return await service.get_knowledge_list(current_user.id, limit, cursor=cursor, order=order, view=view, tag=tag)
     except KnowledgeException as e:
         raise exceptions_to_http(e)
 
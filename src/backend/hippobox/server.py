@@ -1,20 +1,25 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Response, status
 from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi_mcp import FastApiMCP
+from hippobox.core.api_key_usage import APIKeyUsage
 from hippobox.core.bootstrap_admin import (
     ensure_admin_for_login_disabled,
     ensure_default_admin_from_settings,
 )
 from hippobox.core.database import dispose_db, init_db
 from hippobox.core.logging_config import setup_logger
+from hippobox.core.metrics import MetricsMiddleware, render_metrics
 from hippobox.core.redis import RedisManager
 from hippobox.core.settings import SETTINGS
 from hippobox.rag.embedding import Embedding
+from hippobox.rag.index_worker import IndexWorker
+from hippobox.rag.indexing import KnowledgeIndexer
 from hippobox.rag.qdrant import Qdrant
+from hippobox.rag.reindex import Reindex
 from hippobox.routers.v1 import admin, api_key, auth, knowledge, topic
 from hippobox.routers.v1.knowledge import OperationID
 
@@ -43,6 +48,7 @@ async def lifespan(app: FastAPI):
     log.info("Database initialized")
     await ensure_admin_for_login_disabled()
     await ensure_default_admin_from_settings()
+    APIKeyUsage.start()
 
     if SETTINGS.VDB_ENABLED:
         try:
@@ -62,15 +68,41 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             log.error(f"Embedding initialization failed: {e}")
             raise
+
+        indexer = KnowledgeIndexer(embedding, qdrant)
+        try:
+            # Once per process: later writes skip the existence check, and a
+            # collection left over from another embedding model fails here.
+            await indexer.ensure_collection()
+
+        except Exception as e:
+            log.error(f"Qdrant collection bootstrap failed: {e}")
+            raise
+
+        if SETTINGS.INDEX_WORKER_ENABLED:
+            app.state.INDEX_WORKER = IndexWorker(indexer)
+            app.state.INDEX_WORKER.start()
+        else:
+            app.state.INDEX_WORKER = None
+            log.info("In-process index worker disabled; run `hippobox worker` to drain the outbox")
     else:
         app.state.QDRANT = None
         app.state.EMBEDDING = None
+        app.state.INDEX_WORKER = None
         log.info("VDB disabled; skipping Qdrant and embedding initialization")
 
     log.info("HippoBox Server Lifespan Startup")
     try:
         yield
     finally:
+        await Reindex.cancel()
+        if app.state.INDEX_WORKER is not None:
+            await app.state.INDEX_WORKER.stop()
+        if app.state.EMBEDDING is not None:
+            await app.state.EMBEDDING.close()
+        if app.state.QDRANT is not None:
+            await app.state.QDRANT.close()
+        await APIKeyUsage.stop()
         await dispose_db()
         await RedisManager.close()
         log.info("HippoBox Server Lifespan Shutdown")
@@ -125,13 +157,21 @@ def create_app() -> FastAPI:
         tags=["Admin"],
     )
 
+    if SETTINGS.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            body, content_type = render_metrics()
+            return Response(content=body, media_type=content_type)
+
     @app.get("/ping", operation_id="ping_tool")
     async def ping():
         return {"status": "ok", "message": "pong"}
 
     include_operations = [
         "ping_tool",
-        *[op.value for op in OperationID if SETTINGS.VDB_ENABLED or op != OperationID.search_knowledge],
+        *[op.value for op in OperationID],
     ]
 
     mcp = FastApiMCP(
@@ -3,14 +3,22 @@ import logging
 from fastapi import Request
 
 from hippobox.core.redis import RedisManager
+from hippobox.core.result_cache import SearchResults, StatsResults
 from hippobox.errors.admin import AdminErrorCode, AdminException
 from hippobox.errors.service import raise_exception_with_log
 from hippobox.models.user import UserModel, Users
+from hippobox.rag.embedding import Embedding
+from hippobox.rag.qdrant import Qdrant
+from hippobox.rag.reindex import Reindex, ReindexStatus
 
 log = logging.getLogger("admin")
 
 
 class AdminService:
+    def __init__(self, embedding: Embedding | None = None, qdrant: Qdrant | None = None):
+        self.embedding = embedding
+        self.qdrant = qdrant
+
     @staticmethod
     async def _clear_token_set(redis, set_key: str, token_prefix: str):
         tokens = await redis.smembers(set_key)
@@ -46,6 +54,28 @@ class AdminService:
 
         return True
 
+    async def start_reindex(self, rebuild: bool = False, dry_run: bool = False) -> ReindexStatus:
+        if self.embedding is None or self.qdrant is None:
+            raise AdminException(AdminErrorCode.VDB_DISABLED)
+        if rebuild and dry_run:
+            raise AdminException(AdminErrorCode.INVALID_REINDEX)
+
+        try:
+            return await Reindex.start(self.embedding, self.qdrant, rebuild=rebuild, dry_run=dry_run)
+        except RuntimeError:
+            raise AdminException(AdminErrorCode.REINDEX_RUNNING)
+
+    async def get_reindex_status(self) -> ReindexStatus:
+        return await Reindex.get_status()
+
+    def get_cache_stats(self) -> dict[str, dict | None]:
+        embedding_cache = self.embedding.cache if self.embedding is not None else None
+        return {
+            "search": SearchResults.stats() if SearchResults.enabled else None,
+            "stats": StatsResults.stats() if StatsResults.enabled else None,
+            "embedding": embedding_cache.stats() if embedding_cache is not None else None,
+        }
+
 
 def get_admin_service(request: Request) -> AdminService:
-    return AdminService()
+    return AdminService(request.app.state.EMBEDDING, request.app.state.QDRANT)
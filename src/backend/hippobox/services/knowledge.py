@@ -1,17 +1,51 @@
+import asyncio
+import json
 import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Callable
 
 from fastapi import Request
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.exc import IntegrityError
 
+from hippobox.core.metrics import SEARCH_STAGE_SECONDS, observe, timed
+from hippobox.core.result_cache import SearchResults, StatsResults
+from hippobox.core.settings import SETTINGS
 from hippobox.errors.knowledge import KnowledgeErrorCode, KnowledgeException
 from hippobox.errors.service import raise_exception_with_log
-from hippobox.models.knowledge import KnowledgeForm, KnowledgeResponse, Knowledges, KnowledgeUpdate
+from hippobox.models.knowledge import (
+    ExportFormat,
+    KnowledgeForm,
+    KnowledgeImportError,
+    KnowledgeImportResult,
+    KnowledgeListItem,
+    KnowledgeOrder,
+    KnowledgePage,
+    KnowledgeResponse,
+    Knowledges,
+    KnowledgeStats,
+    KnowledgeUpdate,
+    KnowledgeView,
+    SearchMode,
+    StatsBucket,
+)
+from hippobox.models.outbox import Outbox
+from hippobox.models.topic import Topics
 from hippobox.rag.embedding import Embedding
+from hippobox.rag.fusion import reciprocal_rank_fusion
+from hippobox.rag.indexing import KnowledgeIndexer
 from hippobox.rag.qdrant import Qdrant
-from hippobox.utils.preprocess import preprocess_content
+from hippobox.utils.export_files import TarStream, markdown_path, to_markdown
+from hippobox.utils.knowledge_labels import normalize_label, normalize_tag
 
 log = logging.getLogger("knowledge")
 
+SEARCH_RESULTS = TypeAdapter(list[KnowledgeResponse])
+STATS_RESULT = TypeAdapter(KnowledgeStats)
+
+# Activity window when the caller gives no start date.
+STATS_DEFAULT_DAYS = 365
+
 
 class KnowledgeService:
     def __init__(self, embedding: Embedding | None, qdrant: Qdrant | None, vdb_enabled: bool):
@@ -22,78 +56,282 @@ class KnowledgeService:
         if self.vdb_enabled and (self.embedding is None or self.qdrant is None):
             raise RuntimeError("VDB is enabled but embedding or Qdrant is not initialized.")
 
+        self.indexer = KnowledgeIndexer(embedding, qdrant) if self.vdb_enabled else None
+
     # -------------------------------------------
     # Search
     # -------------------------------------------
     async def search(
-        self, user_id: int, query: str, topic: str | None = None, tag: str | None = None, limit: int = 1
+        self,
+        user_id: int,
+        query: str,
+        topic: str | None = None,
+        tag: str | None = None,
+        limit: int = 1,
+        mode: SearchMode | None = None,
+        vector_weight: float = 1.0,
+        lexical_weight: float = 1.0,
     ) -> list[KnowledgeResponse]:
-        if not self.vdb_enabled:
+        if mode is None:
+            mode = SearchMode.HYBRID if self.vdb_enabled else SearchMode.LEXICAL
+        if mode != SearchMode.LEXICAL and not self.vdb_enabled:
             raise KnowledgeException(KnowledgeErrorCode.VDB_DISABLED)
 
-        vector = self.embedding.embed(query)
-        results = self.qdrant.search("knowledge", vector, limit=limit)
+        cache_key = await SearchResults.key(
+            user_id,
+            query=query,
+            topic=normalize_label(topic) if topic else None,
+            tag=normalize_tag(tag) if tag else None,
+            limit=limit,
+            mode=mode.value,
+            weights=[vector_weight, lexical_weight] if mode == SearchMode.HYBRID else None,
+        )
+        cached = await SearchResults.get(cache_key, SEARCH_RESULTS)
+        if cached is not None:
+            return cached
+
+        results = await self._search(user_id, query, topic, tag, limit, mode, vector_weight, lexical_weight)
+        await SearchResults.set(cache_key, results, SEARCH_RESULTS)
+        return results
+
+    async def _search(
+        self,
+        user_id: int,
+        query: str,
+        topic: str | None,
+        tag: str | None,
+        limit: int,
+        mode: SearchMode,
+        vector_weight: float,
+        lexical_weight: float,
+    ) -> list[KnowledgeResponse]:
+        topic_id = tag_id = None
+        with observe(SEARCH_STAGE_SECONDS, stage="filters"):
+            if topic:
+                found = await Topics.get_by_name(user_id, topic)
+                if found is None:
+                    return []
+                topic_id = found.id
+            if tag:
+                tag_id = await Knowledges.get_tag_id(user_id, tag)
+                if tag_id is None:
+                    return []
+
+        filter_dict = {"user_id": user_id}
+        if topic_id is not None:
+            filter_dict["topic_id"] = topic_id
+        if tag_id is not None:
+            filter_dict["tag_ids"] = tag_id
+
+        def vector_search(n: int):
+            return timed(SEARCH_STAGE_SECONDS, self.indexer.search(query, n, filter_dict), stage="vector")
+
+        def lexical_search(n: int):
+            return timed(
+                SEARCH_STAGE_SECONDS,
+                Knowledges.lexical_search(user_id, query, n, topic_id=topic_id, tag_id=tag_id),
+                stage="lexical",
+            )
+
+        if mode == SearchMode.VECTOR:
+            ids = await vector_search(limit)
+        elif mode == SearchMode.LEXICAL:
+            ids = await lexical_search(limit)
+        else:
+            candidates = max(limit, SETTINGS.SEARCH_FUSION_CANDIDATES)
+            vector_ids, lexical_ids = await asyncio.gather(vector_search(candidates), lexical_search(candidates))
+            ids = reciprocal_rank_fusion(
+                [vector_ids, lexical_ids],
+                [vector_weight, lexical_weight],
+                k=SETTINGS.SEARCH_RRF_K,
+            )[:limit]
 
-        ids = results.get("ids", [])
         if not ids:
             return []
 
-        knowledges = []
-        for kid in ids:
+        with observe(SEARCH_STAGE_SECONDS, stage="hydrate"):
             try:
-                k = await Knowledges.get(user_id, kid)
+                knowledges = await Knowledges.get_many(user_id, ids, read_only=True)
             except Exception as e:
-                log.exception(f"{KnowledgeErrorCode.GET_FAILED.default_message}: {e}")
-                continue
+                raise_exception_with_log(KnowledgeErrorCode.GET_FAILED, e)
 
-            if k is None:
-                continue
-            if topic and k.topic != topic:
-                continue
-            if tag and tag not in k.tags:
-                continue
-
-            knowledges.append(KnowledgeResponse.model_validate(k.model_dump()))
-
-        return knowledges
+            return [KnowledgeResponse.model_validate(k.model_dump()) for k in knowledges]
 
     # -------------------------------------------
     # Create
     # -------------------------------------------
     async def create_knowledge(self, user_id: int, form: KnowledgeForm) -> KnowledgeResponse:
         try:
-            knowledge = await Knowledges.create(user_id, form)
+            knowledge = await Knowledges.create(user_id, form, index=self.vdb_enabled)
         except IntegrityError:
             raise KnowledgeException(KnowledgeErrorCode.TITLE_EXISTS)
         except Exception as e:
             raise_exception_with_log(KnowledgeErrorCode.CREATE_FAILED, e)
 
         log.info(f"SQL knowledge created (id={knowledge.id})")
+        return KnowledgeResponse.model_validate(knowledge.model_dump())
+
+    async def import_knowledge(
+        self,
+        user_id: int,
+        items: list[dict],
+        batch_size: int | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> KnowledgeImportResult:
+        """
+        Store many entries at once, batch by batch.
+
+        Each batch is inserted in one SQL transaction together with its
+        outbox jobs. If the items carry exported vectors, each batch is
+        indexed right away so those vectors are reused; otherwise indexing
+        is left to the index worker. Invalid entries, duplicate titles and failed batches are
+        reported per item instead of aborting the import.
+        on_progress(done, total) is called after every batch.
+        """
+        batch_size = max(1, batch_size or SETTINGS.IMPORT_BATCH_SIZE)
+        result = KnowledgeImportResult(total=len(items), created=0)
+
+        def fail(index: int, title: str | None, code: KnowledgeErrorCode, message: str | None = None):
+            result.errors.append(
+                KnowledgeImportError(
+                    index=index,
+                    title=title,
+                    error=code.code.code,
+                    message=message or code.code.default_message,
+                )
+            )
 
-        if self.vdb_enabled:
+        forms: list[tuple[int, KnowledgeForm]] = []
+        vectors: dict[str, list[float]] = {}
+        for index, item in enumerate(items):
             try:
-                vector = self.embedding.embed(knowledge.content)
-                self.qdrant.upsert(
-                    "knowledge",
-                    [
-                        {
-                            "id": knowledge.id,
-                            "vector": vector,
-                            "text": preprocess_content(knowledge),
-                            "metadata": {
-                                "topic": knowledge.topic,
-                                "tags": knowledge.tags,
-                                "title": knowledge.title,
-                                "created_at": str(knowledge.created_at),
-                            },
-                        }
-                    ],
+                form = KnowledgeForm.model_validate(item)
+            except ValidationError as e:
+                title = item.get("title") if isinstance(item, dict) else None
+                fail(index, title if isinstance(title, str) else None, KnowledgeErrorCode.INVALID_ITEM, str(e))
+                continue
+            if not form.title.strip():
+                fail(index, form.title, KnowledgeErrorCode.INVALID_ITEM, "Title must not be empty")
+                continue
+            forms.append((index, form))
+            if self.vdb_enabled:
+                vectors.update(self._exported_vectors(item))
+
+        done = len(items) - len(forms)
+        for start in range(0, len(forms), batch_size):
+            batch = forms[start : start + batch_size]
+
+            try:
+                created, conflicts = await Knowledges.create_many(
+                    user_id, [form for _, form in batch], index=self.vdb_enabled
                 )
             except Exception as e:
-                await Knowledges.delete(user_id, knowledge.id)
-                raise_exception_with_log(KnowledgeErrorCode.CREATE_FAILED, e)
+                log.exception(f"Import batch failed at item {batch[0][0]}: {e}")
+                for index, form in batch:
+                    fail(index, form.title, KnowledgeErrorCode.CREATE_FAILED)
+                created, conflicts = {}, []
 
-        return KnowledgeResponse.model_validate(knowledge.model_dump())
+            for position in conflicts:
+                index, form = batch[position]
+                fail(index, form.title, KnowledgeErrorCode.TITLE_EXISTS)
+
+            if created and vectors:
+                # The entries are new and their ids not yet returned, so their only jobs are the ones just queued.
+                try:
+                    await self.indexer.index_many(list(created.values()), vectors=vectors, reuse_existing=False)
+                    await Outbox.complete_entries([k.id for k in created.values()])
+                except Exception as e:
+                    log.warning(f"Import indexing failed at item {batch[0][0]}, left to the index worker: {e}")
+
+            result.created += len(created)
+            result.ids.extend(k.id for k in created.values())
+            done += len(batch)
+            log.info(f"Import progress: {done}/{len(items)} ({result.created} created, {len(result.errors)} failed)")
+            if on_progress:
+                on_progress(done, len(items))
+
+        result.errors.sort(key=lambda error: error.index)
+        return result
+
+    def _exported_vectors(self, item: dict) -> dict[str, list[float]]:
+        # Vectors from an export are only reusable if they came from the same model.
+        if item.get("embedding_model") != self.embedding.model:
+            return {}
+        try:
+            return {chunk["hash"]: chunk["vector"] for chunk in item.get("chunks") or []}
+        except (KeyError, TypeError):
+            return {}
+
+    # -------------------------------------------
+    # Export
+    # -------------------------------------------
+    async def export_knowledge(
+        self,
+        user_id: int,
+        export_format: ExportFormat = ExportFormat.NDJSON,
+        include_vectors: bool = False,
+        batch_size: int = 256,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream every entry of the user as NDJSON lines or as a tar of markdown notes.
+
+        Rows come from one server-side cursor and are written batch by batch,
+        so memory does not grow with the size of the knowledge base. With
+        include_vectors (NDJSON only) each line also carries its chunk vectors
+        so that importing the export again skips embedding.
+        """
+        if include_vectors and export_format != ExportFormat.NDJSON:
+            raise KnowledgeException(KnowledgeErrorCode.EXPORT_UNSUPPORTED)
+        if include_vectors and not self.vdb_enabled:
+            raise KnowledgeException(KnowledgeErrorCode.VDB_DISABLED)
+
+        return self._export_stream(user_id, export_format, include_vectors, batch_size)
+
+    async def _export_stream(
+        self, user_id: int, export_format: ExportFormat, include_vectors: bool, batch_size: int
+    ) -> AsyncIterator[bytes]:
+        tar = TarStream() if export_format == ExportFormat.TAR else None
+        batch = []
+
+        async def flush() -> bytes:
+            if tar is not None:
+                return b"".join(
+                    tar.add(markdown_path(k), to_markdown(k).encode("utf-8"), k.updated_at.timestamp()) for k in batch
+                )
+
+            chunks = await self.indexer.chunk_vectors(user_id, [k.id for k in batch]) if include_vectors else {}
+            lines = []
+            for k in batch:
+                entry = {
+                    "id": k.id,
+                    "topic": k.topic,
+                    "tags": k.tags,
+                    "title": k.title,
+                    "content": k.content,
+                    "created_at": k.created_at.isoformat(),
+                    "updated_at": k.updated_at.isoformat(),
+                }
+                if include_vectors:
+                    entry["embedding_model"] = self.embedding.model
+                    entry["chunks"] = chunks.get(k.id, [])
+                lines.append(json.dumps(entry, ensure_ascii=False))
+            return ("\n".join(lines) + "\n").encode("utf-8")
+
+        exported = 0
+        async for knowledge in Knowledges.stream(user_id, batch_size=batch_size):
+            batch.append(knowledge)
+            if len(batch) >= batch_size:
+                yield await flush()
+                exported += len(batch)
+                batch.clear()
+
+        if batch:
+            yield await flush()
+            exported += len(batch)
+        if tar is not None:
+            yield tar.close()
+
+        log.info(f"Exported {exported} knowledge entries for user_id={user_id} as {export_format.value}")
 
     # -------------------------------------------
     # Get
@@ -106,17 +344,50 @@ class KnowledgeService:
 
         return KnowledgeResponse.model_validate(knowledge.model_dump())
 
-    async def get_knowledge_list(self, user_id: int) -> list[KnowledgeResponse]:
-        knowledges = await Knowledges.get_list(user_id)
-        return [KnowledgeResponse.model_validate(k.model_dump()) for k in knowledges]
-
-    async def get_by_topic(self, user_id: int, topic: str) -> list[KnowledgeResponse]:
-        knowledges = await Knowledges.get_by_topic(user_id, topic)
-        return [KnowledgeResponse.model_validate(k.model_dump()) for k in knowledges]
-
-    async def get_by_tag(self, user_id: int, tag: str) -> list[KnowledgeResponse]:
-        knowledges = await Knowledges.get_by_tag(user_id, tag)
-        return [KnowledgeResponse.model_validate(k.model_dump()) for k in knowledges]
+    async def get_knowledge_list(
+        self,
+        user_id: int,
+        limit: int,
+        cursor: str | None = None,
+        order: KnowledgeOrder = KnowledgeOrder.CREATED_DESC,
+        view: KnowledgeView = KnowledgeView.SUMMARY,
+        topic: str | None = None,
+        tag: str | None = None,
+    ) -> KnowledgePage:
+        try:
+            knowledges, next_cursor = await Knowledges.get_page(
+                user_id, limit, cursor=cursor, order=order, view=view, topic=topic, tag=tag
+            )
+        except ValueError as e:
+            raise KnowledgeException(KnowledgeErrorCode.INVALID_CURSOR, str(e))
+
+        return KnowledgePage(
+            items=[KnowledgeListItem.model_validate(k.model_dump()) for k in knowledges],
+            next_cursor=next_cursor,
+        )
+
+    async def get_stats(
+        self,
+        user_id: int,
+        bucket: StatsBucket = StatsBucket.DAY,
+        since: date | None = None,
+        utc_offset: int = 0,
+        tag_limit: int = 50,
+    ) -> KnowledgeStats:
+        if since is None:
+            today = (datetime.now(timezone.utc) + timedelta(minutes=utc_offset)).date()
+            since = today - timedelta(days=STATS_DEFAULT_DAYS)
+
+        cache_key = await StatsResults.key(
+            user_id, bucket=bucket.value, since=since, utc_offset=utc_offset, tag_limit=tag_limit
+        )
+        cached = await StatsResults.get(cache_key, STATS_RESULT)
+        if cached is not None:
+            return cached
+
+        stats = await Knowledges.stats(user_id, since, bucket=bucket, utc_offset=utc_offset, tag_limit=tag_limit)
+        await StatsResults.set(cache_key, stats, STATS_RESULT)
+        return stats
 
     async def get_by_title(self, user_id: int, title: str) -> KnowledgeResponse:
         knowledge = await Knowledges.get_by_title(user_id, title)
@@ -130,55 +401,15 @@ class KnowledgeService:
     # Update
     # -------------------------------------------
     async def update_knowledge(self, user_id: int, kid: int, form: KnowledgeUpdate) -> KnowledgeResponse:
-        old = await Knowledges.get(user_id, kid)
-
-        if old is None:
-            raise KnowledgeException(KnowledgeErrorCode.UPDATE_FAILED)
-
         try:
-            updated = await Knowledges.update(user_id, kid, form)
-            if updated is None:
-                raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED)
+            updated = await Knowledges.update(user_id, kid, form, index=self.vdb_enabled)
         except IntegrityError:
             raise KnowledgeException(KnowledgeErrorCode.TITLE_EXISTS)
         except Exception as e:
             raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED, e)
 
-        if self.vdb_enabled:
-            try:
-                vector = self.embedding.embed(updated.content)
-                self.qdrant.upsert(
-                    "knowledge",
-                    [
-                        {
-                            "id": updated.id,
-                            "vector": vector,
-                            "text": preprocess_content(updated),
-                            "metadata": {
-                                "topic": updated.topic,
-                                "tags": updated.tags,
-                                "title": updated.title,
-                                "created_at": str(updated.created_at),
-                            },
-                        }
-                    ],
-                )
-            except Exception as e:
-                try:
-                    await Knowledges.update(
-                        user_id,
-                        kid,
-                        KnowledgeUpdate(
-                            topic=old.topic,
-                            tags=old.tags,
-                            title=old.title,
-                            content=old.content,
-                        ),
-                        override_updated_at=old.updated_at,
-                    )
-                except Exception as rollback_error:
-                    log.exception(f"Rollback failed for id={kid}: {rollback_error}")
-                raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED, e)
+        if updated is None:
+            raise KnowledgeException(KnowledgeErrorCode.UPDATE_FAILED)
 
         return KnowledgeResponse.model_validate(updated.model_dump())
 
@@ -186,24 +417,14 @@ class KnowledgeService:
     # Delete
     # -------------------------------------------
     async def delete_knowledge(self, user_id: int, kid: int) -> bool:
-        old = await Knowledges.get(user_id, kid)
-        if old is None:
-            raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
-
         try:
-            deleted = await Knowledges.delete(user_id, kid)
-            if not deleted:
-                raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
-
-            if self.vdb_enabled:
-                self.qdrant.delete("knowledge", [kid])
+            deleted = await Knowledges.delete(user_id, kid, index=self.vdb_enabled)
         except Exception as e:
-            restored = await Knowledges.restore(old)
-            if restored is None:
-                log.error(f"Rollback failed for id={kid}")
-                raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
             raise_exception_with_log(KnowledgeErrorCode.DELETE_FAILED, e)
 
+        if not deleted:
+            raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
+
         return True
 
 
@@ -3,6 +3,7 @@ import logging
 from fastapi import Request
 from sqlalchemy.exc import IntegrityError
 
+from hippobox.core.settings import SETTINGS
 from hippobox.errors.service import raise_exception_with_log
 from hippobox.errors.topic import TopicErrorCode, TopicException
 from hippobox.models.topic import TopicResponse, Topics, TopicUpdate
@@ -58,7 +59,8 @@ class TopicService:
             raise TopicException(TopicErrorCode.DELETE_DEFAULT)
 
         try:
-            success = await Topics.delete(user_id, topic_id)
+            # Moved entries are reindexed through the outbox, so their vector topic_id follows.
+            success = await Topics.delete(user_id, topic_id, index=SETTINGS.VDB_ENABLED)
         except Exception as e:
             raise_exception_with_log(TopicErrorCode.DELETE_FAILED, e)
             return
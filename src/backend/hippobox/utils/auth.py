@@ -1,23 +1,54 @@
 from typing import Annotated
 
-from fastapi import BackgroundTasks, Depends, HTTPException, status
+from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from pydantic import ValidationError
 
+from hippobox.core.api_key_usage import APIKeyUsage
+from hippobox.core.principal_cache import ADMIN_CACHE_KEY, Principals, api_key_cache_key, user_cache_key
 from hippobox.core.settings import SETTINGS
-from hippobox.models.api_key import APIKeys
-from hippobox.models.user import UserResponse, UserRole, Users
+from hippobox.models.api_key import APIKeyModel, APIKeys
+from hippobox.models.user import UserModel, UserResponse, UserRole, Users
 from hippobox.utils.security import hash_api_key
 
 security = HTTPBearer(auto_error=False)
 
 
+async def _get_user(user_id: int) -> UserModel | None:
+    key = user_cache_key(user_id)
+    user = await Principals.get(key, UserModel)
+    if user is None:
+        user = await Users.get(user_id)
+        if user is not None:
+            await Principals.set(key, user)
+    return user
+
+
+async def _get_admin() -> UserModel | None:
+    admin = await Principals.get(ADMIN_CACHE_KEY, UserModel)
+    if admin is None:
+        admin = await Users.get_admin()
+        if admin is not None:
+            await Principals.set(ADMIN_CACHE_KEY, admin)
+    return admin
+
+
+async def _get_api_key(secret_hash: str) -> APIKeyModel | None:
+    key = api_key_cache_key(secret_hash)
+    api_key = await Principals.get(key, APIKeyModel)
+    if api_key is None:
+        api_key = await APIKeys.get_by_hash(secret_hash)
+        if api_key is not None:
+            await Principals.set(key, api_key)
+    return api_key
+
+
 async def get_current_user(
-    background_tasks: BackgroundTasks, token_auth: Annotated[HTTPAuthorizationCredentials | None, Depends(security)]
+    token_auth: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
 ) -> UserResponse:
     if not SETTINGS.LOGIN_ENABLED:
-        admin = await Users.get_admin()
+        admin = await _get_admin()
         if not admin:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -46,16 +77,16 @@ async def get_current_user(
     if token.startswith("sk-"):
         hashed_input = hash_api_key(token)
 
-        api_key_record = await APIKeys.get_by_hash(hashed_input)
+        api_key_record = await _get_api_key(hashed_input)
 
         if not api_key_record or not api_key_record.is_active:
             raise credentials_exception
 
-        user = await Users.get(api_key_record.user_id)
+        user = await _get_user(api_key_record.user_id)
         if user is None:
             raise credentials_exception
 
-        background_tasks.add_task(APIKeys.update_usage, api_key_record.id)
+        await APIKeyUsage.record(api_key_record.id)
 
         return UserResponse.model_validate(user.model_dump())
 
@@ -72,7 +103,7 @@ async def get_current_user(
         except (JWTError, ValidationError, ValueError):
             raise credentials_exception
 
-        user = await Users.get(user_id_int)
+        user = await _get_user(user_id_int)
         if user is None:
             raise credentials_exception
 
@@ -0,0 +1,68 @@
+import io
+import json
+import re
+import tarfile
+import time
+
+from hippobox.models.knowledge import KnowledgeModel
+
+SLUG_RE = re.compile(r"[^\w\-]+")
+
+
+def _slug(value: str, fallback: str) -> str:
+    slug = SLUG_RE.sub("-", value.strip()).strip("-")
+    return slug[:80] or fallback
+
+
+def _quote(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def to_markdown(knowledge: KnowledgeModel) -> str:
+    """
+    Render an entry as a markdown note whose front matter `hippobox import` reads back.
+    """
+    tags = ", ".join(_quote(tag) for tag in knowledge.tags)
+    return (
+        "---\n"
+        f"title: {_quote(knowledge.title)}\n"
+        f"topic: {_quote(knowledge.topic)}\n"
+        f"tags: [{tags}]\n"
+        f"created_at: {knowledge.created_at.isoformat()}\n"
+        f"updated_at: {knowledge.updated_at.isoformat()}\n"
+        "---\n\n"
+        f"{knowledge.content}\n"
+    )
+
+
+def markdown_path(knowledge: KnowledgeModel) -> str:
+    return f"{_slug(knowledge.topic, 'topic')}/{knowledge.id}-{_slug(knowledge.title, 'note')}.md"
+
+
+class TarStream:
+    """
+    Builds a tar archive member by member and hands back the bytes written so far,
+    so an archive can be streamed without holding it in memory.
+    """
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+        self._tar = tarfile.open(fileobj=self._buffer, mode="w|")
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def add(self, name: str, data: bytes, mtime: float | None = None) -> bytes:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(mtime if mtime is not None else time.time())
+        info.mode = 0o644
+        self._tar.addfile(info, io.BytesIO(data))
+        return self._drain()
+
+    def close(self) -> bytes:
+        self._tar.close()
+        return self._drain()
@@ -0,0 +1,157 @@
+import json
+import re
+import tarfile
+from pathlib import Path, PurePosixPath
+
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+MARKDOWN_SUFFIXES = {".md", ".markdown"}
+TAR_SUFFIXES = {".tar", ".tgz"}
+
+FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*(?:\n|\Z)", re.DOTALL)
+TITLE_RE = re.compile(r"^#\s+(.*\S)\s*$", re.MULTILINE)
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    return value.strip("'\"")
+
+
+def _parse_list(value: str) -> list[str]:
+    value = value.strip()
+    if value.startswith("[") and value.endswith("]"):
+        try:
+            return [str(part) for part in json.loads(value) if str(part).strip()]
+        except json.JSONDecodeError:
+            value = value[1:-1]
+    return [_unquote(part) for part in value.split(",") if _unquote(part)]
+
+
+def _parse_front_matter(block: str) -> dict:
+    """
+    Read the flat `key: value` subset of YAML front matter used by note apps:
+    scalars, inline lists (`tags: [a, b]`) and dash lists on following lines.
+    """
+    meta: dict = {}
+    key = None
+    for line in block.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- ") and key:
+            if not isinstance(meta.get(key), list):
+                meta[key] = []
+            meta[key].append(_unquote(stripped[2:]))
+            continue
+        if ":" not in stripped:
+            continue
+        key, value = stripped.split(":", 1)
+        key, value = key.strip().lower(), value.strip()
+        meta[key] = _parse_list(value) if value.startswith("[") else _unquote(value)
+    return meta
+
+
+def parse_markdown(text: str, stem: str, folder: str | None = None, default_topic: str | None = None) -> dict:
+    """
+    Turn a markdown note into an import item.
+
+    Title comes from front matter, then the first `# heading`, then the file
+    name. Topic comes from front matter, then the note's folder, then
+    default_topic.
+    """
+    meta: dict = {}
+    match = FRONT_MATTER_RE.match(text)
+    if match:
+        meta = _parse_front_matter(match.group(1))
+        text = text[match.end() :]
+
+    title = meta.get("title")
+    if not title:
+        heading = TITLE_RE.search(text)
+        title = heading.group(1) if heading else stem
+
+    topic = meta.get("topic") or meta.get("category") or folder
+
+    tags = meta.get("tags") or []
+    if isinstance(tags, str):
+        tags = _parse_list(tags)
+
+    return {
+        "topic": topic or default_topic,
+        "tags": tags,
+        "title": title,
+        "content": text.strip(),
+    }
+
+
+def _load_tar(path: Path, default_topic: str | None, items: list[dict], errors: list[str]):
+    with tarfile.open(path, mode="r:*") as tar:
+        for member in tar:
+            name = PurePosixPath(member.name)
+            if not member.isfile() or name.suffix.lower() not in MARKDOWN_SUFFIXES:
+                continue
+            try:
+                text = tar.extractfile(member).read().decode("utf-8")
+            except UnicodeDecodeError as e:
+                errors.append(f"{path}:{member.name}: {e}")
+                continue
+            folder = name.parent.as_posix() if name.parent != PurePosixPath(".") else None
+            items.append(parse_markdown(text, name.stem, folder, default_topic))
+
+
+def load_import_items(path: Path, default_topic: str | None = None) -> tuple[list[dict], list[str]]:
+    """
+    Collect import items from a JSONL file, a markdown file, a tar of markdown
+    notes (as written by export), or a directory of JSONL and markdown files.
+
+    ### Returns:
+
+        (items, errors): parsed items in file order, and `file:line: reason`
+        messages for lines or files that could not be read.
+    """
+    path = Path(path)
+    if path.is_dir():
+        root = path
+        files = sorted(
+            p for p in path.rglob("*") if p.is_file() and p.suffix.lower() in JSONL_SUFFIXES | MARKDOWN_SUFFIXES
+        )
+    else:
+        root = None
+        files = [path]
+
+    items: list[dict] = []
+    errors: list[str] = []
+    for file in files:
+        suffix = file.suffix.lower()
+        try:
+            if suffix in JSONL_SUFFIXES:
+                with file.open(encoding="utf-8") as f:
+                    for lineno, line in enumerate(f, start=1):
+                        if not line.strip():
+                            continue
+                        try:
+                            item = json.loads(line)
+                        except json.JSONDecodeError as e:
+                            errors.append(f"{file}:{lineno}: {e}")
+                            continue
+                        if not isinstance(item, dict):
+                            errors.append(f"{file}:{lineno}: expected a JSON object")
+                            continue
+                        if default_topic and not item.get("topic"):
+                            item["topic"] = default_topic
+                        items.append(item)
+            elif suffix in MARKDOWN_SUFFIXES:
+                folder = file.parent.relative_to(root).as_posix() if root and file.parent != root else None
+                items.append(parse_markdown(file.read_text(encoding="utf-8"), file.stem, folder, default_topic))
+            elif suffix in TAR_SUFFIXES or file.name.lower().endswith(".tar.gz"):
+                _load_tar(file, default_topic, items, errors)
+            else:
+                errors.append(f"{file}: unsupported file type")
+        except (OSError, UnicodeDecodeError, tarfile.TarError) as e:
+            errors.append(f"{file}: {e}")
+
+    return items, errors
@@ -1,22 +1,68 @@
+from datetime import datetime, timezone
+
+from hippobox.core.settings import SETTINGS
 from hippobox.models.knowledge import KnowledgeModel
+from hippobox.rag.chunking import Chunk
+
+# Chunk fields stored next to build_metadata() in every point's metadata.
+CHUNK_FIELDS = ("chunk_index", "chunk_count", "chunk_hash")
+
 
+def _epoch(value: datetime) -> int:
+    # SQLite returns naive datetimes; they are stored in UTC.
+    return int((value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp())
 
-def preprocess_content(knowledge: KnowledgeModel) -> str:
+
+def build_metadata(knowledge: KnowledgeModel) -> dict:
     """
-    Build a markdown-formatted text for embedding,
-    combining title, topic, tags, and original content.
+    Payload metadata stored with each point: ids and timestamps only, the
+    text, title and label names stay in SQL. user_id, topic_id and tag_ids
+    are indexed and used as search filters; knowledge_id groups the chunks
+    of one entry.
     """
+    return {
+        "knowledge_id": knowledge.id,
+        "user_id": knowledge.user_id,
+        "topic_id": knowledge.topic_id,
+        "tag_ids": knowledge.tag_ids,
+        "created_at": _epoch(knowledge.created_at),
+        "updated_at": _epoch(knowledge.updated_at),
+    }
 
-    title = knowledge.title
-    topic = knowledge.topic
-    tags = ", ".join(knowledge.tags)
-    content = knowledge.content
 
-    return f"""
-# Title: {title}
+def chunk_snippet(text: str) -> str | None:
+    """
+    Leading characters of a chunk for previews, if QDRANT_PAYLOAD_SNIPPET_CHARS is set.
+    """
+    if SETTINGS.QDRANT_PAYLOAD_SNIPPET_CHARS <= 0:
+        return None
+    return " ".join(text.split())[: SETTINGS.QDRANT_PAYLOAD_SNIPPET_CHARS]
+
 
-## Topic: {topic}
-## Tags: {tags}
+def build_chunk_point(
+    knowledge: KnowledgeModel,
+    chunk: Chunk,
+    chunk_count: int,
+    vector: list[float],
+    point_id: str,
+) -> dict:
+    """
+    Build the Qdrant point for one chunk of a knowledge entry.
 
-{content}
-""".strip()
+    chunk_hash is the content hash that lets unchanged chunks keep their
+    vector; the chunk text itself is not stored.
+    """
+    metadata = build_metadata(knowledge)
+    metadata.update(
+        {
+            "chunk_index": chunk.index,
+            "chunk_count": chunk_count,
+            "chunk_hash": chunk.hash,
+        }
+    )
+    return {
+        "id": point_id,
+        "vector": vector,
+        "metadata": metadata,
+        "snippet": chunk_snippet(chunk.text),
+    }
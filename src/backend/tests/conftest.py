@@ -0,0 +1,18 @@
+import os
+import tempfile
+
+# Settings are read when hippobox is first imported: point them at a throwaway
+# SQLite file and local Qdrant directory before any test module imports it.
+_workdir = tempfile.mkdtemp(prefix="hippobox-tests-")
+os.environ.update(
+    {
+        "DB_DRIVER": "sqlite+aiosqlite",
+        "DB_NAME": os.path.join(_workdir, "hippobox.db"),
+        "QDRANT_MODE": "local",
+        "QDRANT_PATH": os.path.join(_workdir, "qdrant"),
+        "REDIS_IN_MEMORY": "true",
+        "LOGIN_ENABLED": "false",
+        "OPENAI_API_KEY": "test",
+        "LOG_LEVEL": "WARNING",
+    }
+)
@@ -0,0 +1,83 @@
+import asyncio
+import importlib
+import pkgutil
+from datetime import datetime, timezone
+
+from qdrant_client.models import models
+
+from hippobox.core.bootstrap_admin import ensure_admin_for_login_disabled
+from hippobox.core.database import dispose_db, init_db
+from hippobox.models.knowledge import KnowledgeForm, Knowledges
+from hippobox.models.user import Users
+from hippobox.rag.backfill import backfill_knowledge_payload
+from hippobox.rag.qdrant import Qdrant
+from hippobox.utils.preprocess import build_metadata
+
+DIM = 4
+
+
+async def _seed_baseline_points(qdrant: Qdrant):
+    # Tables are registered on Base.metadata as their model modules are imported.
+    for module in pkgutil.iter_modules(importlib.import_module("hippobox.models").__path__):
+        importlib.import_module(f"hippobox.models.{module.name}")
+    await init_db()
+    await ensure_admin_for_login_disabled()
+    user = await Users.get_admin()
+
+    indexed = await Knowledges.create(
+        user.id, KnowledgeForm(topic="Dev", tags=["db"], title="Indexed", content="body"), index=False
+    )
+    missing = await Knowledges.create(
+        user.id, KnowledgeForm(topic="Dev", tags=[], title="Missing", content="body"), index=False
+    )
+
+    # Shaped like the points written before payload filtering and chunking:
+    # the entry id as point id, the full text and label names in the payload.
+    await qdrant.ensure_collection("knowledge", DIM)
+    await qdrant.client.upsert(
+        collection_name=qdrant._full_name("knowledge"),
+        points=[
+            models.PointStruct(
+                id=indexed.id,
+                vector=[0.1, 0.2, 0.3, 0.4],
+                payload={
+                    "text": "# Title: Indexed\n\nbody",
+                    "metadata": {
+                        "topic": "Dev",
+                        "tags": ["db"],
+                        "title": "Indexed",
+                        "created_at": str(datetime.now(timezone.utc)),
+                    },
+                },
+            )
+        ],
+    )
+    return indexed, missing
+
+
+def test_backfill_rewrites_baseline_points():
+    async def run():
+        qdrant = Qdrant()
+        try:
+            indexed, missing = await _seed_baseline_points(qdrant)
+            cname = qdrant._full_name("knowledge")
+            (before,) = await qdrant.client.retrieve(collection_name=cname, ids=[indexed.id], with_vectors=True)
+
+            stats = await backfill_knowledge_payload(qdrant)
+            assert stats == {"updated": 1, "missing": 1}
+
+            (point,) = await qdrant.client.retrieve(collection_name=cname, ids=[indexed.id], with_vectors=True)
+            assert point.payload == {"metadata": {**build_metadata(indexed), "chunk_index": 0, "chunk_count": 1}}
+            assert point.vector == before.vector
+
+            # The rewritten point is now found by the knowledge_id filter that search uses.
+            found = await qdrant.scroll_points("knowledge", {"knowledge_id": [indexed.id, missing.id]})
+            assert [p.id for p in found] == [indexed.id]
+
+            # Running it again finds the point through its metadata and changes nothing.
+            assert await backfill_knowledge_payload(qdrant) == {"updated": 1, "missing": 1}
+        finally:
+            await qdrant.close()
+            await dispose_db()
+
+    asyncio.run(run())
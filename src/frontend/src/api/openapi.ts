@@ -222,16 +222,47 @@ export interface paths {
     '/api/v1/knowledge/list': {
         /**
          * Get Knowledge List
-         * @description Retrieve all stored knowledge entries.
+         * @description Retrieve stored knowledge entries one page at a time.
+         *
+         * ### Args:
+         *
+         *     limit (int = 50): Page size, at most 200.
+         *     cursor (str | None = None): next_cursor returned by the previous page.
+         *     order (created_desc | created_asc | updated_desc | updated_asc = created_desc): Sort order.
+         *         A cursor is only valid for the order it was issued with.
+         *     view (summary | full = summary): summary returns a content snippet, full returns the content.
          *
          * ### Returns:
          *
-         *     List of all knowledge entries sorted by creation date.
+         *     page (KnowledgePage): Entries of this page and the cursor of the next one (null on the last page).
          *
-         * Useful for browsing or building UI item lists.
+         * Useful for browsing or building UI item lists. Use the summary view to
+         * scan titles cheaply, then fetch single entries by id for full content.
          */
         get: operations['get_knowledge_list'];
     };
+    '/api/v1/knowledge/stats': {
+        /**
+         * Get Knowledge Stats
+         * @description Summarize the stored knowledge: totals, content size, entries per topic
+         * and tag, and an activity histogram.
+         *
+         * ### Args:
+         *
+         *     bucket (day | week = day): Size of the activity periods; weeks start on Monday.
+         *     since (date | None = None): First local day of the activity histogram, a year ago by default.
+         *     utc_offset (int = 0): Minutes east of UTC used to assign entries to local days.
+         *     tag_limit (int = 50): Number of most used tags to list.
+         *
+         * ### Returns:
+         *
+         *     stats (KnowledgeStats): Aggregates computed in SQL, without entry content.
+         *
+         * Use this for dashboards and for an overview of which topics and tags
+         * exist before browsing or searching.
+         */
+        get: operations['get_knowledge_stats'];
+    };
     '/api/v1/knowledge/{knowledge_id}': {
         /**
          * Get Knowledge
@@ -440,6 +471,27 @@ export interface components {
             /** User Id */
             user_id?: number | null;
         };
+        /** ActivityPoint */
+        ActivityPoint: {
+            /**
+             * Period
+             * Format: date
+             * @description First day of the day or week
+             */
+            period: string;
+            /**
+             * Created
+             * @description Entries created in the period
+             * @default 0
+             */
+            created?: number;
+            /**
+             * Updated
+             * @description Entries whose last update falls in the period
+             * @default 0
+             */
+            updated?: number;
+        };
         /** EmailVerificationResend */
         EmailVerificationResend: {
             /**
@@ -453,6 +505,11 @@ export interface components {
             /** Detail */
             detail?: components['schemas']['ValidationError'][];
         };
+        /**
+         * IndexStatus
+         * @enum {string}
+         */
+        IndexStatus: 'pending' | 'indexed' | 'failed' | 'disabled';
         /** KnowledgeForm */
         KnowledgeForm: {
             /**
@@ -476,6 +533,79 @@ export interface components {
              */
             content: string;
         };
+        /** KnowledgeListItem */
+        KnowledgeListItem: {
+            /**
+             * Id
+             * @description Unique identifier of the knowledge entry
+             */
+            id: number;
+            /**
+             * User Id
+             * @description Owner's user identifier
+             */
+            user_id: number;
+            /**
+             * Topic
+             * @description Topic or category of this knowledge
+             */
+            topic: string;
+            /**
+             * Tags
+             * @description Keywords associated with this knowledge
+             */
+            tags?: string[];
+            /**
+             * Title
+             * @description Title summarizing the content
+             */
+            title: string;
+            /**
+             * Content
+             * @description Full text content, present in the full view
+             */
+            content?: string | null;
+            /**
+             * Snippet
+             * @description Leading characters of the content, present in the summary view
+             */
+            snippet?: string | null;
+            /**
+             * @description Vector index state of the entry
+             * @default pending
+             */
+            index_status?: components['schemas']['IndexStatus'];
+            /**
+             * Created At
+             * Format: date-time
+             * @description Timestamp when the entry was created
+             */
+            created_at: string;
+            /**
+             * Updated At
+             * Format: date-time
+             * @description Timestamp when the entry was last updated
+             */
+            updated_at: string;
+        };
+        /**
+         * KnowledgeOrder
+         * @enum {string}
+         */
+        KnowledgeOrder: 'created_desc' | 'created_asc' | 'updated_desc' | 'updated_asc';
+        /** KnowledgePage */
+        KnowledgePage: {
+            /**
+             * Items
+             * @description Entries on this page
+             */
+            items?: components['schemas']['KnowledgeListItem'][];
+            /**
+             * Next Cursor
+             * @description Cursor for the next page, or null on the last page
+             */
+            next_cursor?: string | null;
+        };
         /** KnowledgeResponse */
         KnowledgeResponse: {
             /**
@@ -508,6 +638,11 @@ export interface components {
              * @description Full text content of the knowledge entry
              */
             content: string;
+            /**
+             * @description pending until the background worker has written the vectors
+             * @default pending
+             */
+            index_status?: components['schemas']['IndexStatus'];
             /**
              * Created At
              * Format: date-time
@@ -521,6 +656,87 @@ export interface components {
              */
             updated_at: string;
         };
+        /**
+         * KnowledgeView
+         * @enum {string}
+         */
+        KnowledgeView: 'full' | 'summary';
+        /** KnowledgeStats */
+        KnowledgeStats: {
+            /**
+             * Total
+             * @description Number of knowledge entries
+             * @default 0
+             */
+            total?: number;
+            /**
+             * Index Status
+             * @description Entries per vector index state
+             */
+            index_status?: {
+                [key: string]: number;
+            };
+            /**
+             * Content Chars
+             * @description Total content length in characters
+             * @default 0
+             */
+            content_chars?: number;
+            /**
+             * Content Chars Avg
+             * @description Average content length in characters
+             * @default 0
+             */
+            content_chars_avg?: number;
+            /**
+             * Content Chars Max
+             * @description Longest content in characters
+             * @default 0
+             */
+            content_chars_max?: number;
+            /**
+             * First Created At
+             * @description Creation time of the oldest entry
+             */
+            first_created_at?: string | null;
+            /**
+             * Last Updated At
+             * @description Time of the latest update
+             */
+            last_updated_at?: string | null;
+            /**
+             * Topics
+             * @description Every topic with its entry count
+             */
+            topics?: components['schemas']['TopicCount'][];
+            /**
+             * Tags
+             * @description Most used tags with their entry count
+             */
+            tags?: components['schemas']['LabelCount'][];
+            /**
+             * Tag Total
+             * @description Number of tags, including those not listed
+             * @default 0
+             */
+            tag_total?: number;
+            /**
+             * @description Size of the activity periods
+             * @default day
+             */
+            bucket?: components['schemas']['StatsBucket'];
+            /**
+             * Since
+             * Format: date
+             * @description First day covered by activity
+             */
+            since: string;
+            /**
+             * Activity
+             * @description Periods with activity, oldest first; empty periods are omitted
+             */
+            activity?: components['schemas']['ActivityPoint'][];
+        };
         /** KnowledgeUpdate */
         KnowledgeUpdate: {
             /**
@@ -544,6 +760,24 @@ export interface components {
              */
             content?: string | null;
         };
+        /** LabelCount */
+        LabelCount: {
+            /**
+             * Id
+             * @description Identifier of the topic or tag
+             */
+            id: number;
+            /**
+             * Name
+             * @description Display name
+             */
+            name: string;
+            /**
+             * Count
+             * @description Number of knowledge entries
+             */
+            count: number;
+        };
         /** LoginForm */
         LoginForm: {
             /**
@@ -631,6 +865,16 @@ export interface components {
              */
             name: string;
         };
+        /**
+         * SearchMode
+         * @enum {string}
+         */
+        SearchMode: 'vector' | 'lexical' | 'hybrid';
+        /**
+         * StatsBucket
+         * @enum {string}
+         */
+        StatsBucket: 'day' | 'week';
         /** TokenRefreshResponse */
         TokenRefreshResponse: {
             /**
@@ -650,6 +894,30 @@ export interface components {
              */
             token_type?: string;
         };
+        /** TopicCount */
+        TopicCount: {
+            /**
+             * Id
+             * @description Identifier of the topic or tag
+             */
+            id: number;
+            /**
+             * Name
+             * @description Display name
+             */
+            name: string;
+            /**
+             * Count
+             * @description Number of knowledge entries
+             */
+            count: number;
+            /**
+             * Is Default
+             * @description Whether this is the default topic
+             * @default false
+             */
+            is_default?: boolean;
+        };
         /** TopicForm */
         TopicForm: {
             /**
@@ -1225,6 +1493,9 @@ export interface operations {
                 topic?: string | null;
                 tag?: string | null;
                 limit?: number;
+                mode?: components['schemas']['SearchMode'] | null;
+                vector_weight?: number;
+                lexical_weight?: number;
             };
         };
         responses: {
@@ -1282,20 +1553,86 @@ export interface operations {
     };
     /**
      * Get Knowledge List
-     * @description Retrieve all stored knowledge entries.
+     * @description Retrieve stored knowledge entries one page at a time.
+     *
+     * ### Args:
+     *
+     *     limit (int = 50): Page size, at most 200.
+     *     cursor (str | None = None): next_cursor returned by the previous page.
+     *     order (created_desc | created_asc | updated_desc | updated_asc = created_desc): Sort order.
+     *         A cursor is only valid for the order it was issued with.
+     *     view (summary | full = summary): summary returns a content snippet, full returns the content.
      *
      * ### Returns:
      *
-     *     List of all knowledge entries sorted by creation date.
+     *     page (KnowledgePage): Entries of this page and the cursor of the next one (null on the last page).
      *
-     * Useful for browsing or building UI item lists.
+     * Useful for browsing or building UI item lists. Use the summary view to
+     * scan titles cheaply, then fetch single entries by id for full content.
      */
     get_knowledge_list: {
+        parameters: {
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+                order?: components['schemas']['KnowledgeOrder'];
+                view?: components['schemas']['KnowledgeView'];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
                 content: {
-                    'application/json': components['schemas']['KnowledgeResponse'][];
+                    'application/json': components['schemas']['KnowledgePage'];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                content: {
+                    'application/json': components['schemas']['HTTPValidationError'];
+                };
+            };
+        };
+    };
+    /**
+     * Get Knowledge Stats
+     * @description Summarize the stored knowledge: totals, content size, entries per topic
+     * and tag, and an activity histogram.
+     *
+     * ### Args:
+     *
+     *     bucket (day | week = day): Size of the activity periods; weeks start on Monday.
+     *     since (date | None = None): First local day of the activity histogram, a year ago by default.
+     *     utc_offset (int = 0): Minutes east of UTC used to assign entries to local days.
+     *     tag_limit (int = 50): Number of most used tags to list.
+     *
+     * ### Returns:
+     *
+     *     stats (KnowledgeStats): Aggregates computed in SQL, without entry content.
+     *
+     * Use this for dashboards and for an overview of which topics and tags
+     * exist before browsing or searching.
+     */
+    get_knowledge_stats: {
+        parameters: {
+            query?: {
+                bucket?: components['schemas']['StatsBucket'];
+                since?: string | null;
+                utc_offset?: number;
+                tag_limit?: number;
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                content: {
+                    'application/json': components['schemas']['KnowledgeStats'];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                content: {
+                    'application/json': components['schemas']['HTTPValidationError'];
                 };
             };
         };
@@ -1443,6 +1780,12 @@ export interface operations {
      */
     get_knowledge_by_topic: {
         parameters: {
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+                order?: components['schemas']['KnowledgeOrder'];
+                view?: components['schemas']['KnowledgeView'];
+            };
             path: {
                 topic: string;
             };
@@ -1451,7 +1794,7 @@ export interface operations {
             /** @description Successful Response */
             200: {
                 content: {
-                    'application/json': components['schemas']['KnowledgeResponse'][];
+                    'application/json': components['schemas']['KnowledgePage'];
                 };
             };
             /** @description Validation Error */
@@ -1474,6 +1817,12 @@ export interface operations {
      */
     get_knowledge_by_tag: {
         parameters: {
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+                order?: components['schemas']['KnowledgeOrder'];
+                view?: components['schemas']['KnowledgeView'];
+            };
             path: {
                 tag: string;
             };
@@ -1482,7 +1831,7 @@ export interface operations {
             /** @description Successful Response */
             200: {
                 content: {
-                    'application/json': components['schemas']['KnowledgeResponse'][];
+                    'application/json': components['schemas']['KnowledgePage'];
                 };
             };
             /** @description Validation Error */
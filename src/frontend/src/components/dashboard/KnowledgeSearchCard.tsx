@@ -1,10 +1,11 @@
-import { useMemo, useState, type MouseEvent } from 'react';
+import { useEffect, useMemo, useState, type MouseEvent } from 'react';
 import { useTranslation } from 'react-i18next';
 import { Search } from 'lucide-react';
 import { Link } from 'react-router-dom';
 import { marked } from 'marked';
 
 import { useKnowledgeList } from '../../context/KnowledgeListContext';
+import { useKnowledgeLexicalSearchQuery } from '../../hooks/useKnowledge';
 import { Input } from '../Input';
 
 type KnowledgeSearchCardProps = {
@@ -33,6 +34,8 @@ const formatDate = (value: string | undefined) => {
 };
 
 const PREVIEW_LIMIT = 200;
+const CONTENT_SEARCH_LIMIT = 100;
+const CONTENT_SEARCH_DELAY_MS = 300;
 const NO_TOPIC_KEY = '__no_topic__';
 
 const toPlainText = (markdown: string) => {
@@ -69,6 +72,23 @@ export function KnowledgeSearchCard({ inputId }: KnowledgeSearchCardProps) {
         () => new Set(SEARCH_FILTERS.map((filter) => filter.key)),
     );
 
+    // The list only holds snippets; matches further into the content come from the server.
+    const [contentQuery, setContentQuery] = useState('');
+    useEffect(() => {
+        const timer = window.setTimeout(
+            () => setContentQuery(query.trim()),
+            CONTENT_SEARCH_DELAY_MS,
+        );
+        return () => window.clearTimeout(timer);
+    }, [query]);
+    const searchesContent = selectedFilters.size === 0 || selectedFilters.has('content');
+    const { data: contentMatchIds } = useKnowledgeLexicalSearchQuery(
+        contentQuery,
+        CONTENT_SEARCH_LIMIT,
+        { enabled: searchesContent && !contentQuery.startsWith('#') },
+    );
+    const contentMatches = useMemo(() => new Set(contentMatchIds ?? []), [contentMatchIds]);
+
     const defaultResults = useMemo(() => {
         return [...knowledgeList].sort((a, b) => {
             const aTime = a.created_at ? new Date(a.created_at).getTime() : 0;
@@ -102,12 +122,13 @@ export function KnowledgeSearchCard({ inputId }: KnowledgeSearchCardProps) {
                     const fields: string[] = [];
                     if (activeFilters.has('title')) fields.push(item.title);
                     if (activeFilters.has('topic')) fields.push(item.topic);
-                    if (activeFilters.has('content')) fields.push(item.content);
+                    if (activeFilters.has('content')) fields.push(item.snippet ?? '');
                     if (activeFilters.has('tags')) fields.push(...(item.tags ?? []));
                     if (activeFilters.has('created_at')) fields.push(item.created_at ?? '');
                     if (activeFilters.has('updated_at')) fields.push(item.updated_at ?? '');
                     const haystack = fields.join(' ').toLowerCase();
-                    return terms.every((term) => haystack.includes(term));
+                    if (terms.every((term) => haystack.includes(term))) return true;
+                    return activeFilters.has('content') && contentMatches.has(item.id);
                 });
             }
         }
@@ -124,12 +145,12 @@ export function KnowledgeSearchCard({ inputId }: KnowledgeSearchCardProps) {
         }
 
         return results;
-    }, [defaultResults, query, selectedFilters, activeTopic]);
+    }, [defaultResults, query, selectedFilters, activeTopic, contentMatches]);
 
     const previewById = useMemo(() => {
         const map = new Map<number, string>();
         defaultResults.forEach((item) => {
-            const plain = toPlainText(item.content ?? '');
+            const plain = toPlainText(item.snippet ?? '');
             map.set(item.id, truncateText(plain, PREVIEW_LIMIT));
         });
         return map;
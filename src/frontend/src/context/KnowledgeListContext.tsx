@@ -1,10 +1,10 @@
 import { createContext, useContext, useEffect, useMemo, useRef, type ReactNode } from 'react';
 import { useLocation } from 'react-router-dom';
 
-import { useKnowledgeListQuery, type KnowledgeResponse } from '../hooks/useKnowledge';
+import { useKnowledgeListQuery, type KnowledgeListItem } from '../hooks/useKnowledge';
 
 type KnowledgeListContextValue = {
-    knowledge: KnowledgeResponse[];
+    knowledge: KnowledgeListItem[];
     isPending: boolean;
     isError: boolean;
 };
@@ -7,13 +7,20 @@ import {
 } from '@tanstack/react-query';
 
 import { apiClient } from '../api/client';
-import type { components } from '../api/openapi';
+import type { components, operations } from '../api/openapi';
 
 type KnowledgeForm = components['schemas']['KnowledgeForm'];
 type KnowledgeUpdate = components['schemas']['KnowledgeUpdate'];
 export type KnowledgeResponse = components['schemas']['KnowledgeResponse'];
-type KnowledgeListOptions = Omit<UseQueryOptions<KnowledgeResponse[]>, 'queryKey' | 'queryFn'>;
+export type KnowledgeListItem = components['schemas']['KnowledgeListItem'];
+export type KnowledgeStats = components['schemas']['KnowledgeStats'];
+export type KnowledgeStatsParams = NonNullable<
+    operations['get_knowledge_stats']['parameters']['query']
+>;
+type KnowledgeListOptions = Omit<UseQueryOptions<KnowledgeListItem[]>, 'queryKey' | 'queryFn'>;
 type KnowledgeDetailOptions = Omit<UseQueryOptions<KnowledgeResponse>, 'queryKey' | 'queryFn'>;
+type KnowledgeStatsOptions = Omit<UseQueryOptions<KnowledgeStats>, 'queryKey' | 'queryFn'>;
+type KnowledgeSearchIdsOptions = Omit<UseQueryOptions<number[]>, 'queryKey' | 'queryFn'>;
 
 const unwrap = async <T>(promise: Promise<{ data?: T; error?: unknown }>) => {
     const { data, error } = await promise;
@@ -21,6 +28,34 @@ const unwrap = async <T>(promise: Promise<{ data?: T; error?: unknown }>) => {
     return data as T;
 };
 
+const LIST_PAGE_SIZE = 200;
+// Matches the server's summary snippet (LIST_SNIPPET_CHARS).
+const LIST_SNIPPET_CHARS = 280;
+
+// The list endpoint is cursor-paginated; the list context wants every entry but
+// not its content, so walk the pages with the summary view (snippet instead of
+// content) until the server stops returning a cursor. Pages that show or edit
+// an entry fetch its content with useKnowledgeQuery.
+const fetchKnowledgeList = async () => {
+    const entries: KnowledgeListItem[] = [];
+    let cursor: string | undefined;
+    do {
+        const page = await unwrap(
+            apiClient.GET('/api/v1/knowledge/list', {
+                params: { query: { limit: LIST_PAGE_SIZE, view: 'summary', cursor } },
+            }),
+        );
+        entries.push(...(page.items ?? []));
+        cursor = page.next_cursor ?? undefined;
+    } while (cursor);
+    return entries;
+};
+
+const toListItem = ({ content, ...rest }: KnowledgeResponse): KnowledgeListItem => ({
+    ...rest,
+    snippet: content.slice(0, LIST_SNIPPET_CHARS),
+});
+
 export const useCreateKnowledgeMutation = (
     options?: UseMutationOptions<KnowledgeResponse, unknown, KnowledgeForm>,
 ) => {
@@ -28,13 +63,15 @@ export const useCreateKnowledgeMutation = (
     return useMutation({
         mutationFn: (body) => unwrap(apiClient.POST('/api/v1/knowledge/', { body })),
         onSuccess: (data, variables, onMutateResult, context) => {
-            queryClient.setQueryData<KnowledgeResponse[]>(['knowledge', 'list'], (prev) => {
-                if (!prev) return [data];
+            queryClient.setQueryData<KnowledgeListItem[]>(['knowledge', 'list'], (prev) => {
+                if (!prev) return [toListItem(data)];
                 const next = prev.filter((item) => item.id !== data.id);
-                return [data, ...next];
+                return [toListItem(data), ...next];
             });
             queryClient.setQueryData<KnowledgeResponse>(['knowledge', 'detail', data.id], data);
             queryClient.invalidateQueries({ queryKey: ['knowledge', 'list'] });
+            queryClient.invalidateQueries({ queryKey: ['knowledge', 'stats'] });
+            queryClient.invalidateQueries({ queryKey: ['knowledge', 'search'] });
             queryClient.invalidateQueries({ queryKey: ['knowledge', 'detail', data.id] });
             options?.onSuccess?.(data, variables, onMutateResult, context);
         },
@@ -45,7 +82,7 @@ export const useCreateKnowledgeMutation = (
 export const useKnowledgeListQuery = (options?: KnowledgeListOptions) =>
     useQuery({
         queryKey: ['knowledge', 'list'],
-        queryFn: () => unwrap(apiClient.GET('/api/v1/knowledge/list')),
+        queryFn: fetchKnowledgeList,
         staleTime: 1000 * 30,
         ...options,
     });
@@ -69,6 +106,43 @@ export const useKnowledgeQuery = (
     });
 };
 
+// Ids of the entries whose text matches the query on the server's full-text index,
+// which covers the whole content rather than the list's snippets.
+export const useKnowledgeLexicalSearchQuery = (
+    query: string,
+    limit: number,
+    options?: KnowledgeSearchIdsOptions,
+) => {
+    const enabled = Boolean(query) && (options?.enabled ?? true);
+    return useQuery({
+        queryKey: ['knowledge', 'search', 'lexical', query, limit],
+        queryFn: async () => {
+            const results = await unwrap(
+                apiClient.GET('/api/v1/knowledge/search', {
+                    params: { query: { query, limit, mode: 'lexical' } },
+                }),
+            );
+            return results.map((item) => item.id);
+        },
+        enabled,
+        staleTime: 1000 * 30,
+        ...options,
+    });
+};
+
+// Counts and activity histograms aggregated by the server, without entry content.
+export const useKnowledgeStatsQuery = (
+    params: KnowledgeStatsParams = {},
+    options?: KnowledgeStatsOptions,
+) =>
+    useQuery({
+        queryKey: ['knowledge', 'stats', params],
+        queryFn: () =>
+            unwrap(apiClient.GET('/api/v1/knowledge/stats', { params: { query: params } })),
+        staleTime: 1000 * 30,
+        ...options,
+    });
+
 type UpdateKnowledgePayload = {
     knowledgeId: number;
     body: KnowledgeUpdate;
@@ -87,12 +161,14 @@ export const useUpdateKnowledgeMutation = (
                 }),
             ),
         onSuccess: (data, variables, onMutateResult, context) => {
-            queryClient.setQueryData<KnowledgeResponse[]>(['knowledge', 'list'], (prev) => {
+            queryClient.setQueryData<KnowledgeListItem[]>(['knowledge', 'list'], (prev) => {
                 if (!prev) return prev;
-                return prev.map((item) => (item.id === data.id ? data : item));
+                return prev.map((item) => (item.id === data.id ? toListItem(data) : item));
             });
             queryClient.setQueryData<KnowledgeResponse>(['knowledge', 'detail', data.id], data);
             queryClient.invalidateQueries({ queryKey: ['knowledge', 'list'] });
+            queryClient.invalidateQueries({ queryKey: ['knowledge', 'stats'] });
+            queryClient.invalidateQueries({ queryKey: ['knowledge', 'search'] });
             queryClient.invalidateQueries({ queryKey: ['knowledge', 'detail', data.id] });
             options?.onSuccess?.(data, variables, onMutateResult, context);
         },
@@ -117,12 +193,14 @@ export const useDeleteKnowledgeMutation = (
             );
         },
         onSuccess: (_data, variables, onMutateResult, context) => {
-            queryClient.setQueryData<KnowledgeResponse[]>(['knowledge', 'list'], (prev) => {
+            queryClient.setQueryData<KnowledgeListItem[]>(['knowledge', 'list'], (prev) => {
                 if (!prev) return prev;
                 return prev.filter((item) => item.id !== variables.knowledgeId);
             });
             queryClient.removeQueries({ queryKey: ['knowledge', 'detail', variables.knowledgeId] });
             queryClient.invalidateQueries({ queryKey: ['knowledge', 'list'] });
+            queryClient.invalidateQueries({ queryKey: ['knowledge', 'stats'] });
+            queryClient.invalidateQueries({ queryKey: ['knowledge', 'search'] });
             queryClient.refetchQueries({ queryKey: ['knowledge', 'list'] });
             options?.onSuccess?.(_data, variables, onMutateResult, context);
         },
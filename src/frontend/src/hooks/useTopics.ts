@@ -12,7 +12,7 @@ import type { components } from '../api/openapi';
 export type TopicResponse = components['schemas']['TopicResponse'];
 type TopicForm = components['schemas']['TopicForm'];
 type TopicListOptions = Omit<UseQueryOptions<TopicResponse[]>, 'queryKey' | 'queryFn'>;
-type KnowledgeResponse = components['schemas']['KnowledgeResponse'];
+type KnowledgeListItem = components['schemas']['KnowledgeListItem'];
 
 const unwrap = async <T>(promise: Promise<{ data?: T; error?: unknown }>) => {
     const { data, error } = await promise;
@@ -44,7 +44,7 @@ export const useCreateTopicMutation = (
 
 type DeleteTopicContext = {
     previousTopics?: TopicResponse[];
-    previousKnowledge?: KnowledgeResponse[];
+    previousKnowledge?: KnowledgeListItem[];
 };
 
 export const useDeleteTopicMutation = (
@@ -63,7 +63,7 @@ export const useDeleteTopicMutation = (
             await queryClient.cancelQueries({ queryKey: ['topics'] });
             await queryClient.cancelQueries({ queryKey: ['knowledge', 'list'] });
             const previousTopics = queryClient.getQueryData<TopicResponse[]>(['topics']);
-            const previousKnowledge = queryClient.getQueryData<KnowledgeResponse[]>([
+            const previousKnowledge = queryClient.getQueryData<KnowledgeListItem[]>([
                 'knowledge',
                 'list',
             ]);
@@ -77,7 +77,7 @@ export const useDeleteTopicMutation = (
                 const defaultTopic = previousTopics.find((topic) => topic.is_default);
                 const deletedTopic = previousTopics.find((topic) => topic.id === topicId);
                 if (defaultTopic && deletedTopic) {
-                    queryClient.setQueryData<KnowledgeResponse[]>(
+                    queryClient.setQueryData<KnowledgeListItem[]>(
                         ['knowledge', 'list'],
                         previousKnowledge.map((item) =>
                             item.topic === deletedTopic.name
@@ -94,7 +94,7 @@ export const useDeleteTopicMutation = (
                 queryClient.setQueryData<TopicResponse[]>(['topics'], onMutateResult.previousTopics);
             }
             if (onMutateResult?.previousKnowledge) {
-                queryClient.setQueryData<KnowledgeResponse[]>(
+                queryClient.setQueryData<KnowledgeListItem[]>(
                     ['knowledge', 'list'],
                     onMutateResult.previousKnowledge,
                 );
@@ -104,6 +104,7 @@ export const useDeleteTopicMutation = (
         onSuccess: (_data, variables, onMutateResult, context) => {
             queryClient.invalidateQueries({ queryKey: ['topics'] });
             queryClient.invalidateQueries({ queryKey: ['knowledge', 'list'] });
+            queryClient.invalidateQueries({ queryKey: ['knowledge', 'stats'] });
             queryClient.refetchQueries({ queryKey: ['knowledge', 'list'] });
             options?.onSuccess?.(_data, variables, onMutateResult, context);
         },
@@ -69,27 +69,24 @@ export function KnowledgeEditorPage() {
     const { knowledgeId } = useParams();
     const navigate = useNavigate();
     const isEditMode = Boolean(knowledgeId);
-    const { knowledge = [], isPending, isError } = useKnowledgeList();
+    // Summaries of every entry, for the duplicate-title check.
+    const { knowledge = [] } = useKnowledgeList();
     const initializedRef = useRef(false);
     const loadedIdRef = useRef<string | null>(null);
     const loadedRevisionRef = useRef<string | null>(null);
     const isDirtyRef = useRef(false);
 
-    const listEntry = useMemo(() => {
-        if (!knowledgeId) return undefined;
-        return knowledge.find((item) => String(item.id) === knowledgeId);
-    }, [knowledge, knowledgeId]);
     const numericKnowledgeId = knowledgeId ? Number(knowledgeId) : undefined;
+    // The form is filled from the detail query, which carries the content.
     const {
-        data: directEntry,
-        isPending: isDirectPending,
-        isError: isDirectError,
+        data: entry,
+        isPending: isEntryPending,
+        isError: isEntryError,
     } = useKnowledgeQuery(numericKnowledgeId, {
         enabled: Boolean(knowledgeId),
         refetchOnMount: 'always',
         staleTime: 0,
     });
-    const entry = directEntry ?? listEntry;
     const entryRevision = useMemo(() => {
         if (!entry) return null;
         const stamp = entry.updated_at ?? entry.created_at ?? '';
@@ -353,8 +350,8 @@ export function KnowledgeEditorPage() {
         }
     };
 
-    const isLoadingEntry = isEditMode && (isDirectPending || (isPending && !entry));
-    const isLoadError = isEditMode && (isDirectError || (isError && !entry));
+    const isLoadingEntry = isEditMode && isEntryPending;
+    const isLoadError = isEditMode && isEntryError;
 
     if (isLoadingEntry) {
         return <LoadingPage variant="content" />;
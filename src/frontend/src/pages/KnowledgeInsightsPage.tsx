@@ -7,7 +7,7 @@ import { ActivityChartCard } from '../components/dashboard/ActivityChartCard';
 import { TopicSummaryCard } from '../components/dashboard/TopicSummaryCard';
 import { ConfirmDialog } from '../components/ConfirmDialog';
 import { ErrorMessage } from '../components/ErrorMessage';
-import { useKnowledgeList } from '../context/KnowledgeListContext';
+import { useKnowledgeStatsQuery, type KnowledgeStats } from '../hooks/useKnowledge';
 import { useDeleteTopicMutation, useTopicsQuery } from '../hooks/useTopics';
 
 const formatDateKey = (date: Date) => {
@@ -26,43 +26,15 @@ const formatActivityLabel = (date: Date, language: string) => {
     return `${String(month).padStart(2, '0')}/${String(day).padStart(2, '0')}`;
 };
 
-const buildActivitySeries = (entries: Array<{ created_at?: string }>, language: string) => {
-    const today = new Date();
-    const todayKey = formatDateKey(today);
-
-    const counts = new Map<string, number>();
-    let minDate: Date | null = null;
-    entries.forEach((entry) => {
-        if (!entry.created_at) return;
-        const parsed = new Date(entry.created_at);
-        if (Number.isNaN(parsed.getTime())) return;
-        const key = formatDateKey(parsed);
-        counts.set(key, (counts.get(key) ?? 0) + 1);
-        if (!minDate || parsed < minDate) {
-            minDate = parsed;
-        }
-    });
-
-    const start = minDate ? new Date(minDate) : new Date(today);
-    start.setHours(0, 0, 0, 0);
-    const end = new Date(today);
-    end.setHours(0, 0, 0, 0);
-    const totalDays = Math.max(
-        1,
-        Math.floor((end.getTime() - start.getTime()) / (1000 * 60 * 60 * 24)) + 1,
-    );
-
-    return Array.from({ length: totalDays }, (_, index) => {
-        const current = new Date(start);
-        current.setDate(start.getDate() + index);
-        const key = formatDateKey(current);
-        return {
-            key,
-            label: formatActivityLabel(current, language),
-            count: counts.get(key) ?? 0,
-            isToday: key === todayKey,
-        };
-    });
+// The server returns only days with activity; the chart fills in the rest of the year.
+const buildActivitySeries = (activity: KnowledgeStats['activity'] = [], language: string) => {
+    const todayKey = formatDateKey(new Date());
+    return activity.map((point) => ({
+        key: point.period,
+        label: formatActivityLabel(new Date(`${point.period}T00:00:00`), language),
+        count: point.created ?? 0,
+        isToday: point.period === todayKey,
+    }));
 };
 
 const extractErrorMessage = (error: unknown, fallback: string) => {
@@ -85,7 +57,15 @@ export function KnowledgeInsightsPage() {
     const { t, i18n } = useTranslation();
     const queryClient = useQueryClient();
     const { data: topics = [] } = useTopicsQuery();
-    const { knowledge = [] } = useKnowledgeList();
+    // Activity for the calendar year shown by the chart, bucketed by local day.
+    const statsParams = useMemo(() => {
+        const now = new Date();
+        return {
+            since: formatDateKey(new Date(now.getFullYear(), 0, 1)),
+            utc_offset: -now.getTimezoneOffset(),
+        };
+    }, []);
+    const { data: stats } = useKnowledgeStatsQuery(statsParams);
     const [deleteTarget, setDeleteTarget] = useState<{
         id: number;
         name: string;
@@ -102,45 +82,41 @@ export function KnowledgeInsightsPage() {
         },
     });
 
-    const topicCounts = useMemo(() => {
-        const counts = new Map<string, number>();
-        knowledge.forEach((entry) => {
-            counts.set(entry.topic, (counts.get(entry.topic) ?? 0) + 1);
-        });
-        return counts;
-    }, [knowledge]);
+    const topicCounts = useMemo(
+        () => new Map((stats?.topics ?? []).map((topic) => [topic.id, topic.count])),
+        [stats],
+    );
 
     const topicRows = useMemo(() => {
         const fromTopics = topics.length
             ? topics.map((topic) => ({
                   id: topic.id,
                   name: topic.name,
-                  count: topicCounts.get(topic.name) ?? 0,
+                  count: topicCounts.get(topic.id) ?? 0,
                   isDefault: topic.is_default ?? false,
               }))
-            : Array.from(topicCounts.entries()).map(([name, count]) => ({
-                  name,
-                  count,
-                  isDefault: false,
+            : (stats?.topics ?? []).map((topic) => ({
+                  id: topic.id,
+                  name: topic.name,
+                  count: topic.count,
+                  isDefault: topic.is_default ?? false,
               }));
 
         return fromTopics.sort((a, b) => {
             if (b.count !== a.count) return b.count - a.count;
             return a.name.localeCompare(b.name);
         });
-    }, [topics, topicCounts]);
+    }, [topics, topicCounts, stats]);
 
-    const activitySeries = useMemo(() => {
-        if (knowledge.length === 0) {
-            return buildActivitySeries([], i18n.language);
-        }
-        return buildActivitySeries(knowledge, i18n.language);
-    }, [knowledge, i18n.language]);
-    const totalKnowledge = knowledge.length;
+    const activitySeries = useMemo(
+        () => buildActivitySeries(stats?.activity, i18n.language),
+        [stats, i18n.language],
+    );
+    const totalKnowledge = stats?.total ?? 0;
 
     useEffect(() => {
         queryClient.refetchQueries({ queryKey: ['topics'] });
-        queryClient.refetchQueries({ queryKey: ['knowledge', 'list'] });
+        queryClient.refetchQueries({ queryKey: ['knowledge', 'stats'] });
     }, [queryClient]);
 
     return (